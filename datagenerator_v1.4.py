@@ -5,7 +5,7 @@ Covers all 40+ consumer sub-categories as per IESCO/NEPRA classification
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import random
 from faker import Faker
 import os
@@ -13,7 +13,15 @@ import json
 from tqdm import tqdm
 import argparse
 from typing import Tuple, Dict, List, Optional
-from collections import defaultdict
+from itertools import chain
+from functools import reduce
+from types import MappingProxyType
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pickle import PicklingError
+
+# Numba is optional: the batch generators fall back to NumPy kernels
+from numba_compat import njit, prange, NUMBA_AVAILABLE
 
 # Initialize Faker
 fake = Faker('en_PK')
@@ -21,1134 +29,1318 @@ Faker.seed(42)
 np.random.seed(42)
 random.seed(42)
 
-class IESCOConsumerTypesGenerator:
-    def __init__(self):
-        # ============================================================
-        # COMPREHENSIVE CONSUMER TYPES BASED ON IESCO TARIFF STRUCTURE
-        # ============================================================
+# Size of the pre-generated Faker pools (names, cities, emails) sampled for bulk meter generation
+NAME_POOL_SIZE = 20000
+
+# Earliest net metering installation date
+SOLAR_PROGRAM_START = pd.Timestamp('2018-01-01')
+
+
+def _freeze(value):
+    """Recursively convert nested dict/list literals to read-only mappings/tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _str_concat(*parts) -> np.ndarray:
+    """Element-wise concatenation of string arrays and scalars"""
+    return reduce(np.char.add, parts)
+
+
+class AliasSampler:
+    """Walker/Vose alias table for O(1) draws from a fixed discrete distribution"""
+
+    def __init__(self, probs, outcomes=None):
+        probs = np.asarray(probs, dtype=np.float64)
+        n_out = len(probs)
+        scaled = probs * (n_out / probs.sum())
+        self.prob = np.ones(n_out)
+        self.alias = np.arange(n_out)
+        self.outcomes = np.arange(n_out) if outcomes is None else np.asarray(outcomes)
         
-        self.consumer_types = {
-            # ===== RESIDENTIAL (A-1) =====
-            'RESIDENTIAL_GENERAL': {
-                'tariff_category': 'A-1',
-                'category_name': 'Residential - General',
-                'description': 'Regular households',
-                'load_range': (1, 5),
-                'phase': 'single',
-                'subsidized': False,
-                'meter_type': 'smart',
-                'consumption_pattern': 'typical',
-                'peak_hours_sensitivity': 0.7,
-                'solar_adoption_rate': 0.15,
-                'priority': 'normal',
-                'sub_category': 'residential'
-            },
-            'RESIDENTIAL_LIFELINE': {
-                'tariff_category': 'A-1',
-                'category_name': 'Residential - Lifeline',
-                'description': 'Low income <50 units/month',
-                'load_range': (1, 2),
-                'phase': 'single',
-                'subsidized': True,
-                'meter_type': 'conventional',
-                'consumption_pattern': 'low',
-                'peak_hours_sensitivity': 0.3,
-                'solar_adoption_rate': 0.01,
-                'priority': 'protected',
-                'sub_category': 'residential'
-            },
-            'RESIDENTIAL_PROTECTED': {
-                'tariff_category': 'A-1',
-                'category_name': 'Residential - Protected',
-                'description': '<200 units/month with subsidy',
-                'load_range': (2, 3),
-                'phase': 'single',
-                'subsidized': True,
-                'meter_type': 'conventional',
-                'consumption_pattern': 'low_medium',
-                'peak_hours_sensitivity': 0.4,
-                'solar_adoption_rate': 0.02,
-                'priority': 'protected',
-                'sub_category': 'residential'
-            },
-            'RESIDENTIAL_UNPROTECTED': {
-                'tariff_category': 'A-1',
-                'category_name': 'Residential - Unprotected',
-                'description': '>200 units/month, no subsidy',
-                'load_range': (3, 10),
-                'phase': 'single',
-                'subsidized': False,
-                'meter_type': 'smart',
-                'consumption_pattern': 'high',
-                'peak_hours_sensitivity': 0.8,
-                'solar_adoption_rate': 0.25,
-                'priority': 'normal',
-                'sub_category': 'residential'
-            },
-            'FARMHOUSE': {
-                'tariff_category': 'A-1',
-                'category_name': 'Farmhouse',
-                'description': 'Large residential estates',
-                'load_range': (10, 50),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart',
-                'consumption_pattern': 'luxury',
-                'peak_hours_sensitivity': 0.6,
-                'solar_adoption_rate': 0.40,
-                'priority': 'normal',
-                'sub_category': 'residential'
-            },
-            'SENIOR_CITIZEN': {
-                'tariff_category': 'A-1',
-                'category_name': 'Senior Citizen',
-                'description': 'Elderly with discount eligibility',
-                'load_range': (1, 3),
-                'phase': 'single',
-                'subsidized': True,
-                'meter_type': 'conventional',
-                'consumption_pattern': 'low',
-                'peak_hours_sensitivity': 0.3,
-                'solar_adoption_rate': 0.05,
-                'priority': 'protected',
-                'sub_category': 'residential'
-            },
-            'GOVT_QUARTERS': {
-                'tariff_category': 'A-1',
-                'category_name': 'Government Quarters',
-                'description': 'Staff housing in govt colonies',
-                'load_range': (2, 5),
-                'phase': 'single',
-                'subsidized': True,
-                'meter_type': 'conventional',
-                'consumption_pattern': 'typical',
-                'peak_hours_sensitivity': 0.5,
-                'solar_adoption_rate': 0.05,
-                'priority': 'govt',
-                'sub_category': 'residential'
-            },
-            
-            # ===== COMMERCIAL (A-2) =====
-            'COMMERCIAL_GENERAL': {
-                'tariff_category': 'A-2',
-                'category_name': 'Commercial - General',
-                'description': 'Shops, offices, clinics',
-                'load_range': (1, 10),
-                'phase': 'single',
-                'subsidized': False,
-                'meter_type': 'smart',
-                'consumption_pattern': 'business_hours',
-                'peak_hours_sensitivity': 0.9,
-                'solar_adoption_rate': 0.20,
-                'priority': 'normal',
-                'sub_category': 'commercial'
-            },
-            'PLAZA_MALL': {
-                'tariff_category': 'A-2',
-                'category_name': 'Plaza/Mall',
-                'description': 'Multi-story commercial buildings',
-                'load_range': (20, 200),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': 'business_hours_extended',
-                'peak_hours_sensitivity': 0.95,
-                'solar_adoption_rate': 0.30,
-                'priority': 'high',
-                'sub_category': 'commercial'
-            },
-            'MARRIAGE_HALL': {
-                'tariff_category': 'A-2',
-                'category_name': 'Marriage Hall',
-                'description': 'Banquet facilities',
-                'load_range': (15, 100),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': 'weekend_evening',
-                'peak_hours_sensitivity': 0.98,
-                'solar_adoption_rate': 0.15,
-                'priority': 'normal',
-                'sub_category': 'commercial'
-            },
-            'RESTAURANT_HOTEL': {
-                'tariff_category': 'A-2',
-                'category_name': 'Restaurant/Hotel',
-                'description': 'Food businesses',
-                'load_range': (5, 50),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': 'evening_peak',
-                'peak_hours_sensitivity': 0.92,
-                'solar_adoption_rate': 0.10,
-                'priority': 'normal',
-                'sub_category': 'commercial'
-            },
-            'PETROL_PUMP': {
-                'tariff_category': 'A-2',
-                'category_name': 'Petrol Pump',
-                'description': 'Fuel stations',
-                'load_range': (10, 30),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart',
-                'consumption_pattern': 'business_hours_extended',
-                'peak_hours_sensitivity': 0.85,
-                'solar_adoption_rate': 0.25,
-                'priority': 'essential',
-                'sub_category': 'commercial'
-            },
-            'CINEMA_THEATER': {
-                'tariff_category': 'A-2',
-                'category_name': 'Cinema/Theater',
-                'description': 'Entertainment venues',
-                'load_range': (20, 80),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': 'evening_weekend',
-                'peak_hours_sensitivity': 0.94,
-                'solar_adoption_rate': 0.05,
-                'priority': 'normal',
-                'sub_category': 'commercial'
-            },
-            'PRIVATE_SCHOOL': {
-                'tariff_category': 'A-2',
-                'category_name': 'Private School',
-                'description': 'Educational institutions',
-                'load_range': (5, 50),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart',
-                'consumption_pattern': 'daytime',
-                'peak_hours_sensitivity': 0.6,
-                'solar_adoption_rate': 0.35,
-                'priority': 'educational',
-                'sub_category': 'commercial'
-            },
-            'PRIVATE_HOSPITAL': {
-                'tariff_category': 'A-2',
-                'category_name': 'Private Hospital',
-                'description': 'Healthcare facilities',
-                'load_range': (10, 100),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': '24_7',
-                'peak_hours_sensitivity': 0.7,
-                'solar_adoption_rate': 0.20,
-                'priority': 'critical',
-                'sub_category': 'commercial'
-            },
-            'BEAUTY_SALON': {
-                'tariff_category': 'A-2',
-                'category_name': 'Beauty Salon/Spa',
-                'description': 'Personal care services',
-                'load_range': (3, 15),
-                'phase': 'single',
-                'subsidized': False,
-                'meter_type': 'smart',
-                'consumption_pattern': 'business_hours',
-                'peak_hours_sensitivity': 0.8,
-                'solar_adoption_rate': 0.10,
-                'priority': 'normal',
-                'sub_category': 'commercial'
-            },
-            'BANK_ATM': {
-                'tariff_category': 'A-2',
-                'category_name': 'Bank/ATM',
-                'description': 'Financial institutions',
-                'load_range': (5, 25),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart',
-                'consumption_pattern': 'business_hours',
-                'peak_hours_sensitivity': 0.75,
-                'solar_adoption_rate': 0.15,
-                'priority': 'essential',
-                'sub_category': 'commercial'
-            },
-            
-            # ===== INDUSTRIAL (B) =====
-            'SMALL_INDUSTRY': {
-                'tariff_category': 'B-1',
-                'category_name': 'Small Industry',
-                'description': '<25 kW load',
-                'load_range': (5, 25),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': 'industrial_single_shift',
-                'peak_hours_sensitivity': 0.7,
-                'solar_adoption_rate': 0.30,
-                'priority': 'normal',
-                'sub_category': 'industrial'
-            },
-            'LARGE_INDUSTRY': {
-                'tariff_category': 'B-2',
-                'category_name': 'Large Industry',
-                'description': '>25 kW load',
-                'load_range': (25, 500),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou_ht',
-                'consumption_pattern': 'industrial_multi_shift',
-                'peak_hours_sensitivity': 0.8,
-                'solar_adoption_rate': 0.40,
-                'priority': 'high',
-                'sub_category': 'industrial'
-            },
-            'FACTORY': {
-                'tariff_category': 'B-2',
-                'category_name': 'Factory',
-                'description': 'Manufacturing units',
-                'load_range': (50, 500),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou_ht',
-                'consumption_pattern': 'industrial_multi_shift',
-                'peak_hours_sensitivity': 0.85,
-                'solar_adoption_rate': 0.45,
-                'priority': 'high',
-                'sub_category': 'industrial'
-            },
-            'WAREHOUSE': {
-                'tariff_category': 'B-1',
-                'category_name': 'Warehouse',
-                'description': 'Storage facilities',
-                'load_range': (10, 50),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart',
-                'consumption_pattern': 'business_hours',
-                'peak_hours_sensitivity': 0.5,
-                'solar_adoption_rate': 0.20,
-                'priority': 'normal',
-                'sub_category': 'industrial'
-            },
-            'WORKSHOP': {
-                'tariff_category': 'B-1',
-                'category_name': 'Workshop',
-                'description': 'Repair/maintenance',
-                'load_range': (5, 30),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart',
-                'consumption_pattern': 'business_hours',
-                'peak_hours_sensitivity': 0.6,
-                'solar_adoption_rate': 0.15,
-                'priority': 'normal',
-                'sub_category': 'industrial'
-            },
-            'STONE_CRUSHER': {
-                'tariff_category': 'B-2',
-                'category_name': 'Stone Crusher',
-                'description': 'Construction material',
-                'load_range': (50, 200),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': 'daytime_heavy',
-                'peak_hours_sensitivity': 0.5,
-                'solar_adoption_rate': 0.10,
-                'priority': 'normal',
-                'sub_category': 'industrial'
-            },
-            'RICE_MILL': {
-                'tariff_category': 'B-2',
-                'category_name': 'Rice/Grain Mill',
-                'description': 'Food processing',
-                'load_range': (30, 150),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': 'seasonal_peak',
-                'peak_hours_sensitivity': 0.6,
-                'solar_adoption_rate': 0.20,
-                'priority': 'normal',
-                'sub_category': 'industrial'
-            },
-            'TEXTILE_UNIT': {
-                'tariff_category': 'B-2',
-                'category_name': 'Textile Unit',
-                'description': 'Garment manufacturing',
-                'load_range': (50, 400),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou_ht',
-                'consumption_pattern': 'industrial_multi_shift',
-                'peak_hours_sensitivity': 0.75,
-                'solar_adoption_rate': 0.35,
-                'priority': 'high',
-                'sub_category': 'industrial'
-            },
-            
-            # ===== AGRICULTURAL (C) =====
-            'TUBE_WELL': {
-                'tariff_category': 'C-1',
-                'category_name': 'Tube Well',
-                'description': 'Irrigation pumps',
-                'load_range': (10, 50),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart',
-                'consumption_pattern': 'seasonal_daytime',
-                'peak_hours_sensitivity': 0.3,
-                'solar_adoption_rate': 0.25,
-                'priority': 'agricultural',
-                'sub_category': 'agricultural'
-            },
-            'GREENHOUSE': {
-                'tariff_category': 'C-1',
-                'category_name': 'Greenhouse',
-                'description': 'Protected farming',
-                'load_range': (5, 30),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart',
-                'consumption_pattern': 'climate_controlled',
-                'peak_hours_sensitivity': 0.4,
-                'solar_adoption_rate': 0.35,
-                'priority': 'agricultural',
-                'sub_category': 'agricultural'
-            },
-            'POULTRY_FARM': {
-                'tariff_category': 'C-1',
-                'category_name': 'Poultry Farm',
-                'description': 'Chicken farming',
-                'load_range': (5, 25),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart',
-                'consumption_pattern': '24_7_lighting',
-                'peak_hours_sensitivity': 0.5,
-                'solar_adoption_rate': 0.20,
-                'priority': 'agricultural',
-                'sub_category': 'agricultural'
-            },
-            'LIVESTOCK_FARM': {
-                'tariff_category': 'C-1',
-                'category_name': 'Livestock Farm',
-                'description': 'Cattle/goat farming',
-                'load_range': (5, 20),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart',
-                'consumption_pattern': '24_7',
-                'peak_hours_sensitivity': 0.4,
-                'solar_adoption_rate': 0.15,
-                'priority': 'agricultural',
-                'sub_category': 'agricultural'
-            },
-            'FISHERY': {
-                'tariff_category': 'C-1',
-                'category_name': 'Fishery',
-                'description': 'Fish farming',
-                'load_range': (5, 30),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart',
-                'consumption_pattern': '24_7_aeration',
-                'peak_hours_sensitivity': 0.4,
-                'solar_adoption_rate': 0.15,
-                'priority': 'agricultural',
-                'sub_category': 'agricultural'
-            },
-            'ORCHARD': {
-                'tariff_category': 'C-1',
-                'category_name': 'Orchard',
-                'description': 'Fruit farms',
-                'load_range': (5, 30),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart',
-                'consumption_pattern': 'seasonal_irrigation',
-                'peak_hours_sensitivity': 0.3,
-                'solar_adoption_rate': 0.20,
-                'priority': 'agricultural',
-                'sub_category': 'agricultural'
-            },
-            
-            # ===== GOVERNMENT/PUBLIC SECTOR =====
-            'GOVT_OFFICE': {
-                'tariff_category': 'G-1',
-                'category_name': 'Government Office',
-                'description': 'Civil secretariat/departments',
-                'load_range': (10, 100),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart',
-                'consumption_pattern': 'business_hours',
-                'peak_hours_sensitivity': 0.5,
-                'solar_adoption_rate': 0.10,
-                'priority': 'govt',
-                'sub_category': 'government'
-            },
-            'GOVT_SCHOOL': {
-                'tariff_category': 'G-1',
-                'category_name': 'Government School',
-                'description': 'Public educational institutions',
-                'load_range': (5, 30),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'conventional',
-                'consumption_pattern': 'daytime',
-                'peak_hours_sensitivity': 0.3,
-                'solar_adoption_rate': 0.05,
-                'priority': 'govt',
-                'sub_category': 'government'
-            },
-            'GOVT_COLLEGE': {
-                'tariff_category': 'G-1',
-                'category_name': 'Government College',
-                'description': 'Higher secondary institutions',
-                'load_range': (10, 50),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart',
-                'consumption_pattern': 'daytime_extended',
-                'peak_hours_sensitivity': 0.4,
-                'solar_adoption_rate': 0.10,
-                'priority': 'govt',
-                'sub_category': 'government'
-            },
-            'GOVT_UNIVERSITY': {
-                'tariff_category': 'G-1',
-                'category_name': 'Government University',
-                'description': 'Higher education institutions',
-                'load_range': (50, 500),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': 'university',
-                'peak_hours_sensitivity': 0.6,
-                'solar_adoption_rate': 0.20,
-                'priority': 'govt',
-                'sub_category': 'government'
-            },
-            'GOVT_HOSPITAL': {
-                'tariff_category': 'G-1',
-                'category_name': 'Government Hospital',
-                'description': 'Public healthcare facilities',
-                'load_range': (50, 500),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': '24_7',
-                'peak_hours_sensitivity': 0.7,
-                'solar_adoption_rate': 0.15,
-                'priority': 'critical',
-                'sub_category': 'government'
-            },
-            'STREET_LIGHT': {
-                'tariff_category': 'G-4',
-                'category_name': 'Street Light',
-                'description': 'Public lighting',
-                'load_range': (5, 100),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart',
-                'consumption_pattern': 'night_only',
-                'peak_hours_sensitivity': 1.0,
-                'solar_adoption_rate': 0.05,
-                'priority': 'municipal',
-                'sub_category': 'government'
-            },
-            'WATER_SUPPLY': {
-                'tariff_category': 'G-2',
-                'category_name': 'Water Supply',
-                'description': 'Pumping stations',
-                'load_range': (50, 500),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': 'scheduled_pumping',
-                'peak_hours_sensitivity': 0.3,
-                'solar_adoption_rate': 0.30,
-                'priority': 'essential',
-                'sub_category': 'government'
-            },
-            'SEWERAGE_PLANT': {
-                'tariff_category': 'G-2',
-                'category_name': 'Sewerage Plant',
-                'description': 'Treatment facilities',
-                'load_range': (50, 300),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': '24_7',
-                'peak_hours_sensitivity': 0.5,
-                'solar_adoption_rate': 0.20,
-                'priority': 'essential',
-                'sub_category': 'government'
-            },
-            'MILITARY_INSTALLATION': {
-                'tariff_category': 'G-1',
-                'category_name': 'Military Installation',
-                'description': 'Cantonment/Civilian areas',
-                'load_range': (50, 1000),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart_tou_ht',
-                'consumption_pattern': '24_7',
-                'peak_hours_sensitivity': 0.6,
-                'solar_adoption_rate': 0.10,
-                'priority': 'defence',
-                'sub_category': 'government'
-            },
-            'PRISON': {
-                'tariff_category': 'G-1',
-                'category_name': 'Prison',
-                'description': 'Correctional facilities',
-                'load_range': (50, 200),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart',
-                'consumption_pattern': '24_7',
-                'peak_hours_sensitivity': 0.5,
-                'solar_adoption_rate': 0.05,
-                'priority': 'govt',
-                'sub_category': 'government'
-            },
-            'PUBLIC_PARK': {
-                'tariff_category': 'G-4',
-                'category_name': 'Public Park',
-                'description': 'Municipal parks',
-                'load_range': (10, 50),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart',
-                'consumption_pattern': 'evening_peak',
-                'peak_hours_sensitivity': 0.9,
-                'solar_adoption_rate': 0.15,
-                'priority': 'municipal',
-                'sub_category': 'government'
-            },
-            'BUS_TERMINAL': {
-                'tariff_category': 'G-1',
-                'category_name': 'Bus Terminal',
-                'description': 'Transport hubs',
-                'load_range': (20, 100),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart',
-                'consumption_pattern': 'business_hours_extended',
-                'peak_hours_sensitivity': 0.8,
-                'solar_adoption_rate': 0.10,
-                'priority': 'municipal',
-                'sub_category': 'government'
-            },
-            
-            # ===== RELIGIOUS & COMMUNITY =====
-            'MOSQUE': {
-                'tariff_category': 'G-3',
-                'category_name': 'Mosque',
-                'description': 'Masajid (often subsidized)',
-                'load_range': (2, 20),
-                'phase': 'single',
-                'subsidized': True,
-                'meter_type': 'conventional',
-                'consumption_pattern': 'prayer_times',
-                'peak_hours_sensitivity': 0.7,
-                'solar_adoption_rate': 0.25,
-                'priority': 'religious',
-                'sub_category': 'religious'
-            },
-            'CHURCH_TEMPLE': {
-                'tariff_category': 'G-3',
-                'category_name': 'Church/Temple',
-                'description': 'Other religious places',
-                'load_range': (2, 15),
-                'phase': 'single',
-                'subsidized': True,
-                'meter_type': 'conventional',
-                'consumption_pattern': 'weekly_services',
-                'peak_hours_sensitivity': 0.5,
-                'solar_adoption_rate': 0.20,
-                'priority': 'religious',
-                'sub_category': 'religious'
-            },
-            'MADRASSA': {
-                'tariff_category': 'G-3',
-                'category_name': 'Madrassa',
-                'description': 'Religious schools',
-                'load_range': (5, 30),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart',
-                'consumption_pattern': 'daytime',
-                'peak_hours_sensitivity': 0.4,
-                'solar_adoption_rate': 0.15,
-                'priority': 'religious',
-                'sub_category': 'religious'
-            },
-            'COMMUNITY_CENTER': {
-                'tariff_category': 'A-2',
-                'category_name': 'Community Center',
-                'description': 'Public gathering places',
-                'load_range': (10, 50),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart',
-                'consumption_pattern': 'event_based',
-                'peak_hours_sensitivity': 0.8,
-                'solar_adoption_rate': 0.10,
-                'priority': 'normal',
-                'sub_category': 'commercial'
-            },
-            'CEMETERY': {
-                'tariff_category': 'A-1',
-                'category_name': 'Cemetery',
-                'description': 'Graveyards',
-                'load_range': (1, 5),
-                'phase': 'single',
-                'subsidized': True,
-                'meter_type': 'conventional',
-                'consumption_pattern': 'minimal',
-                'peak_hours_sensitivity': 0.1,
-                'solar_adoption_rate': 0.01,
-                'priority': 'municipal',
-                'sub_category': 'government'
-            },
-            
-            # ===== BULK SUPPLY (D) =====
-            'HOUSING_SOCIETY': {
-                'tariff_category': 'D-1',
-                'category_name': 'Housing Society',
-                'description': 'Bulk residential complexes',
-                'load_range': (100, 1000),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou_ht',
-                'consumption_pattern': 'residential_bulk',
-                'peak_hours_sensitivity': 0.7,
-                'solar_adoption_rate': 0.30,
-                'priority': 'bulk',
-                'sub_category': 'bulk'
-            },
-            'INDUSTRIAL_ESTATE': {
-                'tariff_category': 'D-2',
-                'category_name': 'Industrial Estate',
-                'description': 'Multiple industries shared',
-                'load_range': (500, 5000),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou_ht',
-                'consumption_pattern': 'industrial_multi_shift',
-                'peak_hours_sensitivity': 0.8,
-                'solar_adoption_rate': 0.40,
-                'priority': 'high',
-                'sub_category': 'bulk'
-            },
-            'COMMERCIAL_PLAZA_BULK': {
-                'tariff_category': 'D-1',
-                'category_name': 'Commercial Plaza Bulk',
-                'description': 'Bulk metering for shops',
-                'load_range': (100, 500),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': 'commercial_bulk',
-                'peak_hours_sensitivity': 0.85,
-                'solar_adoption_rate': 0.25,
-                'priority': 'bulk',
-                'sub_category': 'bulk'
-            },
-            'APARTMENT_BUILDING': {
-                'tariff_category': 'D-1',
-                'category_name': 'Apartment Building',
-                'description': 'Multi-family dwellings',
-                'load_range': (50, 300),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': 'residential_bulk',
-                'peak_hours_sensitivity': 0.7,
-                'solar_adoption_rate': 0.20,
-                'priority': 'bulk',
-                'sub_category': 'bulk'
-            },
-            
-            # ===== TEMPORARY CONNECTIONS =====
-            'CONSTRUCTION_SITE': {
-                'tariff_category': 'T-1',
-                'category_name': 'Construction Site',
-                'description': 'Building projects',
-                'load_range': (10, 100),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'temporary',
-                'consumption_pattern': 'daytime_heavy',
-                'peak_hours_sensitivity': 0.5,
-                'solar_adoption_rate': 0.01,
-                'priority': 'temporary',
-                'sub_category': 'temporary'
+        small = [i for i in range(n_out) if scaled[i] < 1.0]
+        large = [i for i in range(n_out) if scaled[i] >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Leftovers are 1.0 up to rounding error and keep prob=1, alias=self
+
+    def sample_n(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """Draw n outcomes"""
+        i = rng.integers(0, len(self.prob), n)
+        u = rng.random(n)
+        return self.outcomes[np.where(u < self.prob[i], i, self.alias[i])]
+
+
+# Name components used by the consumer name generators
+GOVT_DEPARTMENTS = ('Education', 'Health', 'Municipal', 'Public Works', 'Revenue')
+PRIVATE_SCHOOL_PREFIXES = ('The City', 'Roots', 'Beaconhouse', 'Lahore Grammar', 'Pak-Turk')
+SCHOOL_SUFFIXES = ('School', 'College', 'Academy', 'High School', 'Public School')
+PRIVATE_HOSPITAL_NAMES = ('Shifa', 'Ali Medical', 'Maroof', 'Rehman')
+HOSPITAL_SUFFIXES = ('Hospital', 'Clinic', 'Medical Center')
+MOSQUE_NAMES = ('Jamia Masjid', 'Madni Masjid', 'Quba Masjid', 'Faisal Masjid', 'Badshahi Masjid')
+INDUSTRY_PRODUCTS = ('Textile', 'Steel', 'Cement', 'Food', 'Pharmaceutical', 'Plastic', 'Paper')
+INDUSTRY_SUFFIXES = ('Industries', 'Mills', 'Factory', 'Manufacturing')
+SHOP_TYPES = ('General Store', 'Medical Store', 'Electronics', 'Clothing', 'Furniture', 'Book Shop')
+FARM_SUFFIXES = ('Farm', 'Agriculture', 'Tube Well', 'Orchard')
+
+# Address components used by the address generators
+STREET_TYPES = ('Street', 'Road', 'Boulevard', 'Lane', 'Avenue', 'Chowk')
+LOCALITIES = _freeze({
+    'ISLAMABAD': ['G-7/4', 'G-8/1', 'G-9/4', 'F-7/3', 'F-8/1', 'F-10/2', 'I-8/2', 'I-10/3'],
+    'RAWALPINDI': ['Committee Chowk', 'Sadiqabad', 'Tench Bhatta', 'Chah Sultan', 'Dhoke Mangtal'],
+    'ATTOCK': ['Civil Quarters', 'Kamra Road', 'Nala Mohra', 'Shahdand'],
+    'JHELUM': ['Civil Lines', 'G.T. Road', 'Kachehri Chowk', 'Mandi City'],
+    'CHAKWAL': ['Mohalla Lathi', 'Ratta Mohra', 'Shamsabad']
+})
+
+# Reading data quality flags (categories of the int8 flag codes) and their probabilities
+DATA_QUALITY_FLAGS = ('Normal', 'Missing Reading', 'Voltage Sag', 'Signal Drop')
+DATA_QUALITY_FLAG_PROBS = (0.98, 0.02 / 3, 0.02 / 3, 0.02 / 3)
+FLAG_MISSING = 1
+FLAG_VOLTAGE_SAG = 2
+
+
+# Base ambient temperature by month (index 0 unused)
+MONTH_BASE_TEMP = np.array([np.nan, 10.0, 10.0, 25.0, 25.0, 35.0, 35.0, 35.0, 35.0, 25.0, 25.0, 25.0, 10.0])
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _fill_readings_nb(voltage, current, frequency, power_factor, temperature, signal, battery,
+                      consumption, transformer_load, jitter, is_peak, base_temp, noise, flag):
+    """
+    Finish a batch of readings in one pass: scale consumption in place by
+    transformer load and random variation, then fill the electrical
+    parameters (voltage sags follow the pre-drawn quality flag codes)
+    """
+    for i in prange(consumption.shape[0]):
+        c = consumption[i] * (0.7 + 0.3 * transformer_load[i]) * (0.9 + 0.2 * jitter[i])
+        consumption[i] = c
+        
+        # Peak hours: 220 V +/- 3, otherwise 230 V +/- 2
+        peak = 1.0 * is_peak[i]
+        v = 230.0 - 10.0 * peak + (2.0 + peak) * noise[0, i]
+        current[i] = c * 1000.0 / v
+        frequency[i] = 50.0 + 0.1 * noise[1, i]
+        power_factor[i] = 0.92 + 0.02 * noise[2, i]
+        temperature[i] = base_temp[i] + 3.0 * noise[3, i]
+        signal[i] = -70.0 + 5.0 * noise[4, i]
+        battery[i] = 3.7 + 0.1 * noise[5, i]
+        
+        voltage[i] = v * (1.0 - 0.3 * (flag[i] == FLAG_VOLTAGE_SAG))
+
+
+def _fill_readings_np(voltage, current, frequency, power_factor, temperature, signal, battery,
+                      consumption, transformer_load, jitter, is_peak, base_temp, noise, flag):
+    """NumPy equivalent of _fill_readings_nb, used when Numba is not installed"""
+    # Scale consumption in place, reusing the jitter buffer for the variation factor
+    np.multiply(consumption, 0.7 + 0.3 * transformer_load, out=consumption)
+    np.multiply(jitter, 0.2, out=jitter)
+    np.add(jitter, 0.9, out=jitter)
+    np.multiply(consumption, jitter, out=consumption)
+    
+    np.multiply(is_peak, -10.0, out=voltage)
+    np.add(voltage, 230.0, out=voltage)
+    np.add(voltage, (2.0 + is_peak) * noise[0], out=voltage)
+    np.multiply(consumption, 1000.0, out=current)
+    np.divide(current, voltage, out=current)
+    np.multiply(noise[1], 0.1, out=frequency)
+    np.add(frequency, 50.0, out=frequency)
+    np.multiply(noise[2], 0.02, out=power_factor)
+    np.add(power_factor, 0.92, out=power_factor)
+    np.multiply(noise[3], 3.0, out=temperature)
+    np.add(temperature, base_temp, out=temperature)
+    np.multiply(noise[4], 5.0, out=signal)
+    np.add(signal, -70.0, out=signal)
+    np.multiply(noise[5], 0.1, out=battery)
+    np.add(battery, 3.7, out=battery)
+    voltage *= 1.0 - 0.3 * (flag == FLAG_VOLTAGE_SAG)
+
+
+_fill_readings = _fill_readings_nb if NUMBA_AVAILABLE else _fill_readings_np
+
+
+# ============================================================
+# COMPREHENSIVE CONSUMER TYPES BASED ON IESCO TARIFF STRUCTURE
+# ============================================================
+
+CONSUMER_TYPES = _freeze({
+    # ===== RESIDENTIAL (A-1) =====
+    'RESIDENTIAL_GENERAL': {
+        'tariff_category': 'A-1',
+        'category_name': 'Residential - General',
+        'description': 'Regular households',
+        'load_range': (1, 5),
+        'phase': 'single',
+        'subsidized': False,
+        'meter_type': 'smart',
+        'consumption_pattern': 'typical',
+        'peak_hours_sensitivity': 0.7,
+        'solar_adoption_rate': 0.15,
+        'priority': 'normal',
+        'sub_category': 'residential'
+    },
+    'RESIDENTIAL_LIFELINE': {
+        'tariff_category': 'A-1',
+        'category_name': 'Residential - Lifeline',
+        'description': 'Low income <50 units/month',
+        'load_range': (1, 2),
+        'phase': 'single',
+        'subsidized': True,
+        'meter_type': 'conventional',
+        'consumption_pattern': 'low',
+        'peak_hours_sensitivity': 0.3,
+        'solar_adoption_rate': 0.01,
+        'priority': 'protected',
+        'sub_category': 'residential'
+    },
+    'RESIDENTIAL_PROTECTED': {
+        'tariff_category': 'A-1',
+        'category_name': 'Residential - Protected',
+        'description': '<200 units/month with subsidy',
+        'load_range': (2, 3),
+        'phase': 'single',
+        'subsidized': True,
+        'meter_type': 'conventional',
+        'consumption_pattern': 'low_medium',
+        'peak_hours_sensitivity': 0.4,
+        'solar_adoption_rate': 0.02,
+        'priority': 'protected',
+        'sub_category': 'residential'
+    },
+    'RESIDENTIAL_UNPROTECTED': {
+        'tariff_category': 'A-1',
+        'category_name': 'Residential - Unprotected',
+        'description': '>200 units/month, no subsidy',
+        'load_range': (3, 10),
+        'phase': 'single',
+        'subsidized': False,
+        'meter_type': 'smart',
+        'consumption_pattern': 'high',
+        'peak_hours_sensitivity': 0.8,
+        'solar_adoption_rate': 0.25,
+        'priority': 'normal',
+        'sub_category': 'residential'
+    },
+    'FARMHOUSE': {
+        'tariff_category': 'A-1',
+        'category_name': 'Farmhouse',
+        'description': 'Large residential estates',
+        'load_range': (10, 50),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart',
+        'consumption_pattern': 'luxury',
+        'peak_hours_sensitivity': 0.6,
+        'solar_adoption_rate': 0.40,
+        'priority': 'normal',
+        'sub_category': 'residential'
+    },
+    'SENIOR_CITIZEN': {
+        'tariff_category': 'A-1',
+        'category_name': 'Senior Citizen',
+        'description': 'Elderly with discount eligibility',
+        'load_range': (1, 3),
+        'phase': 'single',
+        'subsidized': True,
+        'meter_type': 'conventional',
+        'consumption_pattern': 'low',
+        'peak_hours_sensitivity': 0.3,
+        'solar_adoption_rate': 0.05,
+        'priority': 'protected',
+        'sub_category': 'residential'
+    },
+    'GOVT_QUARTERS': {
+        'tariff_category': 'A-1',
+        'category_name': 'Government Quarters',
+        'description': 'Staff housing in govt colonies',
+        'load_range': (2, 5),
+        'phase': 'single',
+        'subsidized': True,
+        'meter_type': 'conventional',
+        'consumption_pattern': 'typical',
+        'peak_hours_sensitivity': 0.5,
+        'solar_adoption_rate': 0.05,
+        'priority': 'govt',
+        'sub_category': 'residential'
+    },
+    
+    # ===== COMMERCIAL (A-2) =====
+    'COMMERCIAL_GENERAL': {
+        'tariff_category': 'A-2',
+        'category_name': 'Commercial - General',
+        'description': 'Shops, offices, clinics',
+        'load_range': (1, 10),
+        'phase': 'single',
+        'subsidized': False,
+        'meter_type': 'smart',
+        'consumption_pattern': 'business_hours',
+        'peak_hours_sensitivity': 0.9,
+        'solar_adoption_rate': 0.20,
+        'priority': 'normal',
+        'sub_category': 'commercial'
+    },
+    'PLAZA_MALL': {
+        'tariff_category': 'A-2',
+        'category_name': 'Plaza/Mall',
+        'description': 'Multi-story commercial buildings',
+        'load_range': (20, 200),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': 'business_hours_extended',
+        'peak_hours_sensitivity': 0.95,
+        'solar_adoption_rate': 0.30,
+        'priority': 'high',
+        'sub_category': 'commercial'
+    },
+    'MARRIAGE_HALL': {
+        'tariff_category': 'A-2',
+        'category_name': 'Marriage Hall',
+        'description': 'Banquet facilities',
+        'load_range': (15, 100),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': 'weekend_evening',
+        'peak_hours_sensitivity': 0.98,
+        'solar_adoption_rate': 0.15,
+        'priority': 'normal',
+        'sub_category': 'commercial'
+    },
+    'RESTAURANT_HOTEL': {
+        'tariff_category': 'A-2',
+        'category_name': 'Restaurant/Hotel',
+        'description': 'Food businesses',
+        'load_range': (5, 50),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': 'evening_peak',
+        'peak_hours_sensitivity': 0.92,
+        'solar_adoption_rate': 0.10,
+        'priority': 'normal',
+        'sub_category': 'commercial'
+    },
+    'PETROL_PUMP': {
+        'tariff_category': 'A-2',
+        'category_name': 'Petrol Pump',
+        'description': 'Fuel stations',
+        'load_range': (10, 30),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart',
+        'consumption_pattern': 'business_hours_extended',
+        'peak_hours_sensitivity': 0.85,
+        'solar_adoption_rate': 0.25,
+        'priority': 'essential',
+        'sub_category': 'commercial'
+    },
+    'CINEMA_THEATER': {
+        'tariff_category': 'A-2',
+        'category_name': 'Cinema/Theater',
+        'description': 'Entertainment venues',
+        'load_range': (20, 80),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': 'evening_weekend',
+        'peak_hours_sensitivity': 0.94,
+        'solar_adoption_rate': 0.05,
+        'priority': 'normal',
+        'sub_category': 'commercial'
+    },
+    'PRIVATE_SCHOOL': {
+        'tariff_category': 'A-2',
+        'category_name': 'Private School',
+        'description': 'Educational institutions',
+        'load_range': (5, 50),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart',
+        'consumption_pattern': 'daytime',
+        'peak_hours_sensitivity': 0.6,
+        'solar_adoption_rate': 0.35,
+        'priority': 'educational',
+        'sub_category': 'commercial'
+    },
+    'PRIVATE_HOSPITAL': {
+        'tariff_category': 'A-2',
+        'category_name': 'Private Hospital',
+        'description': 'Healthcare facilities',
+        'load_range': (10, 100),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': '24_7',
+        'peak_hours_sensitivity': 0.7,
+        'solar_adoption_rate': 0.20,
+        'priority': 'critical',
+        'sub_category': 'commercial'
+    },
+    'BEAUTY_SALON': {
+        'tariff_category': 'A-2',
+        'category_name': 'Beauty Salon/Spa',
+        'description': 'Personal care services',
+        'load_range': (3, 15),
+        'phase': 'single',
+        'subsidized': False,
+        'meter_type': 'smart',
+        'consumption_pattern': 'business_hours',
+        'peak_hours_sensitivity': 0.8,
+        'solar_adoption_rate': 0.10,
+        'priority': 'normal',
+        'sub_category': 'commercial'
+    },
+    'BANK_ATM': {
+        'tariff_category': 'A-2',
+        'category_name': 'Bank/ATM',
+        'description': 'Financial institutions',
+        'load_range': (5, 25),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart',
+        'consumption_pattern': 'business_hours',
+        'peak_hours_sensitivity': 0.75,
+        'solar_adoption_rate': 0.15,
+        'priority': 'essential',
+        'sub_category': 'commercial'
+    },
+    
+    # ===== INDUSTRIAL (B) =====
+    'SMALL_INDUSTRY': {
+        'tariff_category': 'B-1',
+        'category_name': 'Small Industry',
+        'description': '<25 kW load',
+        'load_range': (5, 25),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': 'industrial_single_shift',
+        'peak_hours_sensitivity': 0.7,
+        'solar_adoption_rate': 0.30,
+        'priority': 'normal',
+        'sub_category': 'industrial'
+    },
+    'LARGE_INDUSTRY': {
+        'tariff_category': 'B-2',
+        'category_name': 'Large Industry',
+        'description': '>25 kW load',
+        'load_range': (25, 500),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou_ht',
+        'consumption_pattern': 'industrial_multi_shift',
+        'peak_hours_sensitivity': 0.8,
+        'solar_adoption_rate': 0.40,
+        'priority': 'high',
+        'sub_category': 'industrial'
+    },
+    'FACTORY': {
+        'tariff_category': 'B-2',
+        'category_name': 'Factory',
+        'description': 'Manufacturing units',
+        'load_range': (50, 500),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou_ht',
+        'consumption_pattern': 'industrial_multi_shift',
+        'peak_hours_sensitivity': 0.85,
+        'solar_adoption_rate': 0.45,
+        'priority': 'high',
+        'sub_category': 'industrial'
+    },
+    'WAREHOUSE': {
+        'tariff_category': 'B-1',
+        'category_name': 'Warehouse',
+        'description': 'Storage facilities',
+        'load_range': (10, 50),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart',
+        'consumption_pattern': 'business_hours',
+        'peak_hours_sensitivity': 0.5,
+        'solar_adoption_rate': 0.20,
+        'priority': 'normal',
+        'sub_category': 'industrial'
+    },
+    'WORKSHOP': {
+        'tariff_category': 'B-1',
+        'category_name': 'Workshop',
+        'description': 'Repair/maintenance',
+        'load_range': (5, 30),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart',
+        'consumption_pattern': 'business_hours',
+        'peak_hours_sensitivity': 0.6,
+        'solar_adoption_rate': 0.15,
+        'priority': 'normal',
+        'sub_category': 'industrial'
+    },
+    'STONE_CRUSHER': {
+        'tariff_category': 'B-2',
+        'category_name': 'Stone Crusher',
+        'description': 'Construction material',
+        'load_range': (50, 200),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': 'daytime_heavy',
+        'peak_hours_sensitivity': 0.5,
+        'solar_adoption_rate': 0.10,
+        'priority': 'normal',
+        'sub_category': 'industrial'
+    },
+    'RICE_MILL': {
+        'tariff_category': 'B-2',
+        'category_name': 'Rice/Grain Mill',
+        'description': 'Food processing',
+        'load_range': (30, 150),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': 'seasonal_peak',
+        'peak_hours_sensitivity': 0.6,
+        'solar_adoption_rate': 0.20,
+        'priority': 'normal',
+        'sub_category': 'industrial'
+    },
+    'TEXTILE_UNIT': {
+        'tariff_category': 'B-2',
+        'category_name': 'Textile Unit',
+        'description': 'Garment manufacturing',
+        'load_range': (50, 400),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou_ht',
+        'consumption_pattern': 'industrial_multi_shift',
+        'peak_hours_sensitivity': 0.75,
+        'solar_adoption_rate': 0.35,
+        'priority': 'high',
+        'sub_category': 'industrial'
+    },
+    
+    # ===== AGRICULTURAL (C) =====
+    'TUBE_WELL': {
+        'tariff_category': 'C-1',
+        'category_name': 'Tube Well',
+        'description': 'Irrigation pumps',
+        'load_range': (10, 50),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart',
+        'consumption_pattern': 'seasonal_daytime',
+        'peak_hours_sensitivity': 0.3,
+        'solar_adoption_rate': 0.25,
+        'priority': 'agricultural',
+        'sub_category': 'agricultural'
+    },
+    'GREENHOUSE': {
+        'tariff_category': 'C-1',
+        'category_name': 'Greenhouse',
+        'description': 'Protected farming',
+        'load_range': (5, 30),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart',
+        'consumption_pattern': 'climate_controlled',
+        'peak_hours_sensitivity': 0.4,
+        'solar_adoption_rate': 0.35,
+        'priority': 'agricultural',
+        'sub_category': 'agricultural'
+    },
+    'POULTRY_FARM': {
+        'tariff_category': 'C-1',
+        'category_name': 'Poultry Farm',
+        'description': 'Chicken farming',
+        'load_range': (5, 25),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart',
+        'consumption_pattern': '24_7_lighting',
+        'peak_hours_sensitivity': 0.5,
+        'solar_adoption_rate': 0.20,
+        'priority': 'agricultural',
+        'sub_category': 'agricultural'
+    },
+    'LIVESTOCK_FARM': {
+        'tariff_category': 'C-1',
+        'category_name': 'Livestock Farm',
+        'description': 'Cattle/goat farming',
+        'load_range': (5, 20),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart',
+        'consumption_pattern': '24_7',
+        'peak_hours_sensitivity': 0.4,
+        'solar_adoption_rate': 0.15,
+        'priority': 'agricultural',
+        'sub_category': 'agricultural'
+    },
+    'FISHERY': {
+        'tariff_category': 'C-1',
+        'category_name': 'Fishery',
+        'description': 'Fish farming',
+        'load_range': (5, 30),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart',
+        'consumption_pattern': '24_7_aeration',
+        'peak_hours_sensitivity': 0.4,
+        'solar_adoption_rate': 0.15,
+        'priority': 'agricultural',
+        'sub_category': 'agricultural'
+    },
+    'ORCHARD': {
+        'tariff_category': 'C-1',
+        'category_name': 'Orchard',
+        'description': 'Fruit farms',
+        'load_range': (5, 30),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart',
+        'consumption_pattern': 'seasonal_irrigation',
+        'peak_hours_sensitivity': 0.3,
+        'solar_adoption_rate': 0.20,
+        'priority': 'agricultural',
+        'sub_category': 'agricultural'
+    },
+    
+    # ===== GOVERNMENT/PUBLIC SECTOR =====
+    'GOVT_OFFICE': {
+        'tariff_category': 'G-1',
+        'category_name': 'Government Office',
+        'description': 'Civil secretariat/departments',
+        'load_range': (10, 100),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart',
+        'consumption_pattern': 'business_hours',
+        'peak_hours_sensitivity': 0.5,
+        'solar_adoption_rate': 0.10,
+        'priority': 'govt',
+        'sub_category': 'government'
+    },
+    'GOVT_SCHOOL': {
+        'tariff_category': 'G-1',
+        'category_name': 'Government School',
+        'description': 'Public educational institutions',
+        'load_range': (5, 30),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'conventional',
+        'consumption_pattern': 'daytime',
+        'peak_hours_sensitivity': 0.3,
+        'solar_adoption_rate': 0.05,
+        'priority': 'govt',
+        'sub_category': 'government'
+    },
+    'GOVT_COLLEGE': {
+        'tariff_category': 'G-1',
+        'category_name': 'Government College',
+        'description': 'Higher secondary institutions',
+        'load_range': (10, 50),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart',
+        'consumption_pattern': 'daytime_extended',
+        'peak_hours_sensitivity': 0.4,
+        'solar_adoption_rate': 0.10,
+        'priority': 'govt',
+        'sub_category': 'government'
+    },
+    'GOVT_UNIVERSITY': {
+        'tariff_category': 'G-1',
+        'category_name': 'Government University',
+        'description': 'Higher education institutions',
+        'load_range': (50, 500),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': 'university',
+        'peak_hours_sensitivity': 0.6,
+        'solar_adoption_rate': 0.20,
+        'priority': 'govt',
+        'sub_category': 'government'
+    },
+    'GOVT_HOSPITAL': {
+        'tariff_category': 'G-1',
+        'category_name': 'Government Hospital',
+        'description': 'Public healthcare facilities',
+        'load_range': (50, 500),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': '24_7',
+        'peak_hours_sensitivity': 0.7,
+        'solar_adoption_rate': 0.15,
+        'priority': 'critical',
+        'sub_category': 'government'
+    },
+    'STREET_LIGHT': {
+        'tariff_category': 'G-4',
+        'category_name': 'Street Light',
+        'description': 'Public lighting',
+        'load_range': (5, 100),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart',
+        'consumption_pattern': 'night_only',
+        'peak_hours_sensitivity': 1.0,
+        'solar_adoption_rate': 0.05,
+        'priority': 'municipal',
+        'sub_category': 'government'
+    },
+    'WATER_SUPPLY': {
+        'tariff_category': 'G-2',
+        'category_name': 'Water Supply',
+        'description': 'Pumping stations',
+        'load_range': (50, 500),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': 'scheduled_pumping',
+        'peak_hours_sensitivity': 0.3,
+        'solar_adoption_rate': 0.30,
+        'priority': 'essential',
+        'sub_category': 'government'
+    },
+    'SEWERAGE_PLANT': {
+        'tariff_category': 'G-2',
+        'category_name': 'Sewerage Plant',
+        'description': 'Treatment facilities',
+        'load_range': (50, 300),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': '24_7',
+        'peak_hours_sensitivity': 0.5,
+        'solar_adoption_rate': 0.20,
+        'priority': 'essential',
+        'sub_category': 'government'
+    },
+    'MILITARY_INSTALLATION': {
+        'tariff_category': 'G-1',
+        'category_name': 'Military Installation',
+        'description': 'Cantonment/Civilian areas',
+        'load_range': (50, 1000),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart_tou_ht',
+        'consumption_pattern': '24_7',
+        'peak_hours_sensitivity': 0.6,
+        'solar_adoption_rate': 0.10,
+        'priority': 'defence',
+        'sub_category': 'government'
+    },
+    'PRISON': {
+        'tariff_category': 'G-1',
+        'category_name': 'Prison',
+        'description': 'Correctional facilities',
+        'load_range': (50, 200),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart',
+        'consumption_pattern': '24_7',
+        'peak_hours_sensitivity': 0.5,
+        'solar_adoption_rate': 0.05,
+        'priority': 'govt',
+        'sub_category': 'government'
+    },
+    'PUBLIC_PARK': {
+        'tariff_category': 'G-4',
+        'category_name': 'Public Park',
+        'description': 'Municipal parks',
+        'load_range': (10, 50),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart',
+        'consumption_pattern': 'evening_peak',
+        'peak_hours_sensitivity': 0.9,
+        'solar_adoption_rate': 0.15,
+        'priority': 'municipal',
+        'sub_category': 'government'
+    },
+    'BUS_TERMINAL': {
+        'tariff_category': 'G-1',
+        'category_name': 'Bus Terminal',
+        'description': 'Transport hubs',
+        'load_range': (20, 100),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart',
+        'consumption_pattern': 'business_hours_extended',
+        'peak_hours_sensitivity': 0.8,
+        'solar_adoption_rate': 0.10,
+        'priority': 'municipal',
+        'sub_category': 'government'
+    },
+    
+    # ===== RELIGIOUS & COMMUNITY =====
+    'MOSQUE': {
+        'tariff_category': 'G-3',
+        'category_name': 'Mosque',
+        'description': 'Masajid (often subsidized)',
+        'load_range': (2, 20),
+        'phase': 'single',
+        'subsidized': True,
+        'meter_type': 'conventional',
+        'consumption_pattern': 'prayer_times',
+        'peak_hours_sensitivity': 0.7,
+        'solar_adoption_rate': 0.25,
+        'priority': 'religious',
+        'sub_category': 'religious'
+    },
+    'CHURCH_TEMPLE': {
+        'tariff_category': 'G-3',
+        'category_name': 'Church/Temple',
+        'description': 'Other religious places',
+        'load_range': (2, 15),
+        'phase': 'single',
+        'subsidized': True,
+        'meter_type': 'conventional',
+        'consumption_pattern': 'weekly_services',
+        'peak_hours_sensitivity': 0.5,
+        'solar_adoption_rate': 0.20,
+        'priority': 'religious',
+        'sub_category': 'religious'
+    },
+    'MADRASSA': {
+        'tariff_category': 'G-3',
+        'category_name': 'Madrassa',
+        'description': 'Religious schools',
+        'load_range': (5, 30),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart',
+        'consumption_pattern': 'daytime',
+        'peak_hours_sensitivity': 0.4,
+        'solar_adoption_rate': 0.15,
+        'priority': 'religious',
+        'sub_category': 'religious'
+    },
+    'COMMUNITY_CENTER': {
+        'tariff_category': 'A-2',
+        'category_name': 'Community Center',
+        'description': 'Public gathering places',
+        'load_range': (10, 50),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart',
+        'consumption_pattern': 'event_based',
+        'peak_hours_sensitivity': 0.8,
+        'solar_adoption_rate': 0.10,
+        'priority': 'normal',
+        'sub_category': 'commercial'
+    },
+    'CEMETERY': {
+        'tariff_category': 'A-1',
+        'category_name': 'Cemetery',
+        'description': 'Graveyards',
+        'load_range': (1, 5),
+        'phase': 'single',
+        'subsidized': True,
+        'meter_type': 'conventional',
+        'consumption_pattern': 'minimal',
+        'peak_hours_sensitivity': 0.1,
+        'solar_adoption_rate': 0.01,
+        'priority': 'municipal',
+        'sub_category': 'government'
+    },
+    
+    # ===== BULK SUPPLY (D) =====
+    'HOUSING_SOCIETY': {
+        'tariff_category': 'D-1',
+        'category_name': 'Housing Society',
+        'description': 'Bulk residential complexes',
+        'load_range': (100, 1000),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou_ht',
+        'consumption_pattern': 'residential_bulk',
+        'peak_hours_sensitivity': 0.7,
+        'solar_adoption_rate': 0.30,
+        'priority': 'bulk',
+        'sub_category': 'bulk'
+    },
+    'INDUSTRIAL_ESTATE': {
+        'tariff_category': 'D-2',
+        'category_name': 'Industrial Estate',
+        'description': 'Multiple industries shared',
+        'load_range': (500, 5000),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou_ht',
+        'consumption_pattern': 'industrial_multi_shift',
+        'peak_hours_sensitivity': 0.8,
+        'solar_adoption_rate': 0.40,
+        'priority': 'high',
+        'sub_category': 'bulk'
+    },
+    'COMMERCIAL_PLAZA_BULK': {
+        'tariff_category': 'D-1',
+        'category_name': 'Commercial Plaza Bulk',
+        'description': 'Bulk metering for shops',
+        'load_range': (100, 500),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': 'commercial_bulk',
+        'peak_hours_sensitivity': 0.85,
+        'solar_adoption_rate': 0.25,
+        'priority': 'bulk',
+        'sub_category': 'bulk'
+    },
+    'APARTMENT_BUILDING': {
+        'tariff_category': 'D-1',
+        'category_name': 'Apartment Building',
+        'description': 'Multi-family dwellings',
+        'load_range': (50, 300),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': 'residential_bulk',
+        'peak_hours_sensitivity': 0.7,
+        'solar_adoption_rate': 0.20,
+        'priority': 'bulk',
+        'sub_category': 'bulk'
+    },
+    
+    # ===== TEMPORARY CONNECTIONS =====
+    'CONSTRUCTION_SITE': {
+        'tariff_category': 'T-1',
+        'category_name': 'Construction Site',
+        'description': 'Building projects',
+        'load_range': (10, 100),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'temporary',
+        'consumption_pattern': 'daytime_heavy',
+        'peak_hours_sensitivity': 0.5,
+        'solar_adoption_rate': 0.01,
+        'priority': 'temporary',
+        'sub_category': 'temporary'
+    },
+    'EVENT_EXHIBITION': {
+        'tariff_category': 'T-1',
+        'category_name': 'Event/Exhibition',
+        'description': 'Temporary events',
+        'load_range': (5, 50),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'temporary',
+        'consumption_pattern': 'event_based',
+        'peak_hours_sensitivity': 0.9,
+        'solar_adoption_rate': 0.01,
+        'priority': 'temporary',
+        'sub_category': 'temporary'
+    },
+    'ELECTION_POLLING': {
+        'tariff_category': 'T-1',
+        'category_name': 'Election Polling Station',
+        'description': 'Seasonal election use',
+        'load_range': (2, 10),
+        'phase': 'single',
+        'subsidized': True,
+        'meter_type': 'temporary',
+        'consumption_pattern': 'daytime',
+        'peak_hours_sensitivity': 0.3,
+        'solar_adoption_rate': 0.0,
+        'priority': 'temporary',
+        'sub_category': 'temporary'
+    },
+    'CROP_HARVESTING': {
+        'tariff_category': 'T-1',
+        'category_name': 'Crop Harvesting',
+        'description': 'Seasonal agricultural',
+        'load_range': (5, 30),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'temporary',
+        'consumption_pattern': 'seasonal_peak',
+        'peak_hours_sensitivity': 0.4,
+        'solar_adoption_rate': 0.0,
+        'priority': 'temporary',
+        'sub_category': 'temporary'
+    },
+    
+    # ===== SPECIAL CATEGORIES =====
+    'NET_METERING_PROSUMER': {
+        'tariff_category': 'A-1',
+        'category_name': 'Net Metering Prosumer',
+        'description': 'Solar exporters with bidirectional meter',
+        'load_range': (3, 50),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_bi',
+        'consumption_pattern': 'solar_hybrid',
+        'peak_hours_sensitivity': 0.9,
+        'solar_adoption_rate': 1.0,
+        'priority': 'prosumer',
+        'sub_category': 'special',
+        'solar_export_rate': 19.32  # IESCO interim rate [citation:7]
+    },
+    'EV_CHARGING_STATION': {
+        'tariff_category': 'A-2',
+        'category_name': 'EV Charging Station',
+        'description': 'Electric vehicle charging',
+        'load_range': (10, 100),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': 'ev_charging',
+        'peak_hours_sensitivity': 0.6,
+        'solar_adoption_rate': 0.50,
+        'priority': 'emerging',
+        'sub_category': 'special'
+    },
+    'TELECOM_TOWER': {
+        'tariff_category': 'A-2',
+        'category_name': 'Telecom Tower',
+        'description': 'Mobile network infrastructure',
+        'load_range': (5, 20),
+        'phase': 'three',
+        'subsidized': False,
+        'meter_type': 'smart',
+        'consumption_pattern': '24_7',
+        'peak_hours_sensitivity': 0.7,
+        'solar_adoption_rate': 0.40,
+        'priority': 'essential',
+        'sub_category': 'special'
+    },
+    'TRAFFIC_SIGNAL': {
+        'tariff_category': 'G-4',
+        'category_name': 'Traffic Signal',
+        'description': 'Road control systems',
+        'load_range': (1, 5),
+        'phase': 'single',
+        'subsidized': True,
+        'meter_type': 'conventional',
+        'consumption_pattern': '24_7_low',
+        'peak_hours_sensitivity': 1.0,
+        'solar_adoption_rate': 0.30,
+        'priority': 'essential',
+        'sub_category': 'government'
+    },
+    'RAILWAY_STATION': {
+        'tariff_category': 'G-1',
+        'category_name': 'Railway Station',
+        'description': 'Pakistan Railways',
+        'load_range': (50, 300),
+        'phase': 'three',
+        'subsidized': True,
+        'meter_type': 'smart_tou',
+        'consumption_pattern': '24_7',
+        'peak_hours_sensitivity': 0.8,
+        'solar_adoption_rate': 0.15,
+        'priority': 'govt',
+        'sub_category': 'government'
+    }
+})
+
+# ============================================================
+# IESCO DISTRICTS AND SUB-DIVISIONS (as before)
+# ============================================================
+DISTRICTS = _freeze({
+    'ISLAMABAD': {
+        'growth_rate': 0.18,
+        'population_density': 'very_high',
+        'coordinates': {'lat_center': 33.6844, 'lon_center': 73.0479, 'radius': 0.15},
+        'consumer_type_distribution': {
+            'residential': 0.55,
+            'commercial': 0.25,
+            'industrial': 0.05,
+            'government': 0.10,
+            'agricultural': 0.01,
+            'religious': 0.02,
+            'bulk': 0.01,
+            'temporary': 0.005,
+            'special': 0.005
+        },
+        'divisions': {
+            'ISLAMABAD DIVISION 1': {
+                'sub_divisions': ['I-10', 'G-10', 'F-11', 'I-8', 'G-9', 'F-10', 'I-9', 'G-8', 'F-9', 'I-11', 'G-11'],
+                'consumer_type_distribution': {
+                    'RESIDENTIAL_GENERAL': 0.30, 'RESIDENTIAL_UNPROTECTED': 0.15, 'COMMERCIAL_GENERAL': 0.15,
+                    'PLAZA_MALL': 0.05, 'GOVT_OFFICE': 0.10, 'GOVT_HOSPITAL': 0.02, 'MOSQUE': 0.05,
+                    'PRIVATE_SCHOOL': 0.04, 'RESTAURANT_HOTEL': 0.03, 'BANK_ATM': 0.02, 'TELECOM_TOWER': 0.02,
+                    'NET_METERING_PROSUMER': 0.02
+                }
             },
-            'EVENT_EXHIBITION': {
-                'tariff_category': 'T-1',
-                'category_name': 'Event/Exhibition',
-                'description': 'Temporary events',
-                'load_range': (5, 50),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'temporary',
-                'consumption_pattern': 'event_based',
-                'peak_hours_sensitivity': 0.9,
-                'solar_adoption_rate': 0.01,
-                'priority': 'temporary',
-                'sub_category': 'temporary'
+            'ISLAMABAD DIVISION 2': {
+                'sub_divisions': ['I-16', 'I-17', 'Korang', 'Tarlai', 'Nilore', 'Shahzad Town', 'Bhara Kahu'],
+                'consumer_type_distribution': {
+                    'RESIDENTIAL_GENERAL': 0.25, 'RESIDENTIAL_PROTECTED': 0.15, 'FARMHOUSE': 0.05,
+                    'TUBE_WELL': 0.05, 'POULTRY_FARM': 0.03, 'GOVT_SCHOOL': 0.05, 'MOSQUE': 0.08,
+                    'COMMERCIAL_GENERAL': 0.10, 'PETROL_PUMP': 0.02, 'SMALL_INDUSTRY': 0.02,
+                    'CONSTRUCTION_SITE': 0.02
+                }
             },
-            'ELECTION_POLLING': {
-                'tariff_category': 'T-1',
-                'category_name': 'Election Polling Station',
-                'description': 'Seasonal election use',
-                'load_range': (2, 10),
-                'phase': 'single',
-                'subsidized': True,
-                'meter_type': 'temporary',
-                'consumption_pattern': 'daytime',
-                'peak_hours_sensitivity': 0.3,
-                'solar_adoption_rate': 0.0,
-                'priority': 'temporary',
-                'sub_category': 'temporary'
+            'BARAKAHU DIVISION': {
+                'sub_divisions': ['Barakahu', 'Murree', 'Kohat Bazar'],
+                'consumer_type_distribution': {
+                    'RESIDENTIAL_GENERAL': 0.25, 'RESIDENTIAL_PROTECTED': 0.20, 'FARMHOUSE': 0.10,
+                    'HOTEL': 0.10, 'RESTAURANT_HOTEL': 0.08, 'COMMERCIAL_GENERAL': 0.08,
+                    'TUBE_WELL': 0.03, 'GOVT_SCHOOL': 0.03, 'MOSQUE': 0.05, 'CONSTRUCTION_SITE': 0.03
+                }
+            }
+        }
+    },
+    'RAWALPINDI': {
+        'growth_rate': 0.15,
+        'population_density': 'high',
+        'coordinates': {'lat_center': 33.5651, 'lon_center': 73.0169, 'radius': 0.2},
+        'consumer_type_distribution': {
+            'residential': 0.60,
+            'commercial': 0.20,
+            'industrial': 0.08,
+            'government': 0.05,
+            'agricultural': 0.03,
+            'religious': 0.02,
+            'bulk': 0.01,
+            'temporary': 0.005,
+            'special': 0.005
+        },
+        'divisions': {
+            'RAWALPINDI CITY DIVISION': {
+                'sub_divisions': ['Babri Bazar', 'Pirwadhai', 'Dhok Ratta', 'Waris Khan', 'Chah Sultan', 'Kalyan'],
+                'consumer_type_distribution': {
+                    'RESIDENTIAL_GENERAL': 0.25, 'RESIDENTIAL_PROTECTED': 0.15, 'RESIDENTIAL_UNPROTECTED': 0.10,
+                    'COMMERCIAL_GENERAL': 0.15, 'PLAZA_MALL': 0.05, 'MARRIAGE_HALL': 0.03,
+                    'GOVT_OFFICE': 0.05, 'MOSQUE': 0.05, 'PRIVATE_SCHOOL': 0.03, 'BANK_ATM': 0.02,
+                    'WORKSHOP': 0.02, 'WAREHOUSE': 0.02
+                }
             },
-            'CROP_HARVESTING': {
-                'tariff_category': 'T-1',
-                'category_name': 'Crop Harvesting',
-                'description': 'Seasonal agricultural',
-                'load_range': (5, 30),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'temporary',
-                'consumption_pattern': 'seasonal_peak',
-                'peak_hours_sensitivity': 0.4,
-                'solar_adoption_rate': 0.0,
-                'priority': 'temporary',
-                'sub_category': 'temporary'
+            'CANTT DIVISION': {
+                'sub_divisions': ['Cantt', 'Tariqabad', 'RA Bazar', 'Chaklala'],
+                'consumer_type_distribution': {
+                    'MILITARY_INSTALLATION': 0.15, 'GOVT_QUARTERS': 0.10, 'RESIDENTIAL_GENERAL': 0.15,
+                    'COMMERCIAL_GENERAL': 0.12, 'PLAZA_MALL': 0.05, 'PRIVATE_HOSPITAL': 0.03,
+                    'GOVT_HOSPITAL': 0.02, 'MOSQUE': 0.05, 'PRIVATE_SCHOOL': 0.03, 'RESTAURANT_HOTEL': 0.03,
+                    'AIRPORT': 0.02
+                }
             },
-            
-            # ===== SPECIAL CATEGORIES =====
-            'NET_METERING_PROSUMER': {
-                'tariff_category': 'A-1',
-                'category_name': 'Net Metering Prosumer',
-                'description': 'Solar exporters with bidirectional meter',
-                'load_range': (3, 50),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_bi',
-                'consumption_pattern': 'solar_hybrid',
-                'peak_hours_sensitivity': 0.9,
-                'solar_adoption_rate': 1.0,
-                'priority': 'prosumer',
-                'sub_category': 'special',
-                'solar_export_rate': 19.32  # IESCO interim rate [citation:7]
+            'SATELLITE TOWN DIVISION': {
+                'sub_divisions': ['Satellite Town Main', 'Muslim Town', 'Gangal', 'Dhoke Kala Khan'],
+                'consumer_type_distribution': {
+                    'RESIDENTIAL_GENERAL': 0.20, 'RESIDENTIAL_UNPROTECTED': 0.15, 'RESIDENTIAL_PROTECTED': 0.10,
+                    'COMMERCIAL_GENERAL': 0.15, 'PLAZA_MALL': 0.08, 'GOVT_OFFICE': 0.05,
+                    'PRIVATE_HOSPITAL': 0.03, 'PRIVATE_SCHOOL': 0.04, 'MOSQUE': 0.04,
+                    'BANK_ATM': 0.02, 'RESTAURANT_HOTEL': 0.03
+                }
             },
-            'EV_CHARGING_STATION': {
-                'tariff_category': 'A-2',
-                'category_name': 'EV Charging Station',
-                'description': 'Electric vehicle charging',
-                'load_range': (10, 100),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': 'ev_charging',
-                'peak_hours_sensitivity': 0.6,
-                'solar_adoption_rate': 0.50,
-                'priority': 'emerging',
-                'sub_category': 'special'
+            'WESTRIDGE DIVISION': {
+                'sub_divisions': ['Westridge Main', 'Tarnol', 'Defence Westridge', 'Shamsabad'],
+                'consumer_type_distribution': {
+                    'RESIDENTIAL_GENERAL': 0.25, 'RESIDENTIAL_UNPROTECTED': 0.15, 'RESIDENTIAL_PROTECTED': 0.10,
+                    'FARMHOUSE': 0.05, 'COMMERCIAL_GENERAL': 0.10, 'PETROL_PUMP': 0.03,
+                    'SMALL_INDUSTRY': 0.03, 'WAREHOUSE': 0.02, 'MOSQUE': 0.04, 'GOVT_SCHOOL': 0.03
+                }
             },
-            'TELECOM_TOWER': {
-                'tariff_category': 'A-2',
-                'category_name': 'Telecom Tower',
-                'description': 'Mobile network infrastructure',
-                'load_range': (5, 20),
-                'phase': 'three',
-                'subsidized': False,
-                'meter_type': 'smart',
-                'consumption_pattern': '24_7',
-                'peak_hours_sensitivity': 0.7,
-                'solar_adoption_rate': 0.40,
-                'priority': 'essential',
-                'sub_category': 'special'
+            'RAWAT DIVISION': {
+                'sub_divisions': ['Rawat', 'Mandra', 'Kallar Syedan', 'Chak Beli Khan'],
+                'consumer_type_distribution': {
+                    'RESIDENTIAL_GENERAL': 0.20, 'RESIDENTIAL_PROTECTED': 0.20, 'FARMHOUSE': 0.05,
+                    'TUBE_WELL': 0.10, 'POULTRY_FARM': 0.05, 'SMALL_INDUSTRY': 0.05,
+                    'COMMERCIAL_GENERAL': 0.08, 'PETROL_PUMP': 0.02, 'MOSQUE': 0.05, 'GOVT_SCHOOL': 0.03
+                }
+            }
+        }
+    },
+    'ATTOCK': {
+        'growth_rate': 0.10,
+        'population_density': 'medium',
+        'coordinates': {'lat_center': 33.7667, 'lon_center': 72.3667, 'radius': 0.25},
+        'consumer_type_distribution': {
+            'residential': 0.50,
+            'commercial': 0.10,
+            'industrial': 0.15,
+            'government': 0.05,
+            'agricultural': 0.15,
+            'religious': 0.03,
+            'bulk': 0.01,
+            'temporary': 0.005,
+            'special': 0.005
+        },
+        'divisions': {
+            'ATTOCK DIVISION': {
+                'sub_divisions': ['Attock City', 'Shadi Khan', 'Hassanabdal', 'Burhan'],
+                'consumer_type_distribution': {
+                    'RESIDENTIAL_GENERAL': 0.20, 'RESIDENTIAL_PROTECTED': 0.20,
+                    'TUBE_WELL': 0.15, 'SMALL_INDUSTRY': 0.08, 'LARGE_INDUSTRY': 0.03,
+                    'COMMERCIAL_GENERAL': 0.08, 'PETROL_PUMP': 0.02, 'GOVT_OFFICE': 0.03,
+                    'MOSQUE': 0.05, 'GOVT_SCHOOL': 0.03, 'RICE_MILL': 0.03
+                }
             },
-            'TRAFFIC_SIGNAL': {
-                'tariff_category': 'G-4',
-                'category_name': 'Traffic Signal',
-                'description': 'Road control systems',
-                'load_range': (1, 5),
-                'phase': 'single',
-                'subsidized': True,
-                'meter_type': 'conventional',
-                'consumption_pattern': '24_7_low',
-                'peak_hours_sensitivity': 1.0,
-                'solar_adoption_rate': 0.30,
-                'priority': 'essential',
-                'sub_category': 'government'
+            'TAXILA DIVISION': {
+                'sub_divisions': ['Taxila', 'Margalla', 'Wah Cantt', 'New Taxila'],
+                'consumer_type_distribution': {
+                    'LARGE_INDUSTRY': 0.15, 'FACTORY': 0.10, 'TEXTILE_UNIT': 0.05,
+                    'RESIDENTIAL_GENERAL': 0.15, 'RESIDENTIAL_PROTECTED': 0.10,
+                    'COMMERCIAL_GENERAL': 0.08, 'GOVT_OFFICE': 0.03, 'MILITARY_INSTALLATION': 0.05,
+                    'MOSQUE': 0.04, 'PRIVATE_SCHOOL': 0.02, 'WAREHOUSE': 0.03
+                }
             },
-            'RAILWAY_STATION': {
-                'tariff_category': 'G-1',
-                'category_name': 'Railway Station',
-                'description': 'Pakistan Railways',
-                'load_range': (50, 300),
-                'phase': 'three',
-                'subsidized': True,
-                'meter_type': 'smart_tou',
-                'consumption_pattern': '24_7',
-                'peak_hours_sensitivity': 0.8,
-                'solar_adoption_rate': 0.15,
-                'priority': 'govt',
-                'sub_category': 'government'
+            'PINDIGHEB DIVISION': {
+                'sub_divisions': ['Pindigheb', 'Jan', 'Fateh Jang'],
+                'consumer_type_distribution': {
+                    'RESIDENTIAL_PROTECTED': 0.25, 'RESIDENTIAL_GENERAL': 0.15,
+                    'TUBE_WELL': 0.20, 'LIVESTOCK_FARM': 0.05, 'ORCHARD': 0.05,
+                    'COMMERCIAL_GENERAL': 0.05, 'MOSQUE': 0.05, 'GOVT_SCHOOL': 0.03
+                }
             }
         }
-        
-        # ============================================================
-        # IESCO DISTRICTS AND SUB-DIVISIONS (as before)
-        # ============================================================
-        self.districts = {
-            'ISLAMABAD': {
-                'growth_rate': 0.18,
-                'population_density': 'very_high',
-                'coordinates': {'lat_center': 33.6844, 'lon_center': 73.0479, 'radius': 0.15},
+    },
+    'JHELUM': {
+        'growth_rate': 0.10,
+        'population_density': 'medium',
+        'coordinates': {'lat_center': 32.9333, 'lon_center': 73.7333, 'radius': 0.2},
+        'consumer_type_distribution': {
+            'residential': 0.55,
+            'commercial': 0.12,
+            'industrial': 0.08,
+            'government': 0.05,
+            'agricultural': 0.15,
+            'religious': 0.03,
+            'bulk': 0.01,
+            'temporary': 0.005,
+            'special': 0.005
+        },
+        'divisions': {
+            'JHELUM DIVISION 1': {
+                'sub_divisions': ['Jhelum City', 'Sara-e-Alamgir', 'Khushab'],
                 'consumer_type_distribution': {
-                    'residential': 0.55,
-                    'commercial': 0.25,
-                    'industrial': 0.05,
-                    'government': 0.10,
-                    'agricultural': 0.01,
-                    'religious': 0.02,
-                    'bulk': 0.01,
-                    'temporary': 0.005,
-                    'special': 0.005
-                },
-                'divisions': {
-                    'ISLAMABAD DIVISION 1': {
-                        'sub_divisions': ['I-10', 'G-10', 'F-11', 'I-8', 'G-9', 'F-10', 'I-9', 'G-8', 'F-9', 'I-11', 'G-11'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_GENERAL': 0.30, 'RESIDENTIAL_UNPROTECTED': 0.15, 'COMMERCIAL_GENERAL': 0.15,
-                            'PLAZA_MALL': 0.05, 'GOVT_OFFICE': 0.10, 'GOVT_HOSPITAL': 0.02, 'MOSQUE': 0.05,
-                            'PRIVATE_SCHOOL': 0.04, 'RESTAURANT_HOTEL': 0.03, 'BANK_ATM': 0.02, 'TELECOM_TOWER': 0.02,
-                            'NET_METERING_PROSUMER': 0.02
-                        }
-                    },
-                    'ISLAMABAD DIVISION 2': {
-                        'sub_divisions': ['I-16', 'I-17', 'Korang', 'Tarlai', 'Nilore', 'Shahzad Town', 'Bhara Kahu'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_GENERAL': 0.25, 'RESIDENTIAL_PROTECTED': 0.15, 'FARMHOUSE': 0.05,
-                            'TUBE_WELL': 0.05, 'POULTRY_FARM': 0.03, 'GOVT_SCHOOL': 0.05, 'MOSQUE': 0.08,
-                            'COMMERCIAL_GENERAL': 0.10, 'PETROL_PUMP': 0.02, 'SMALL_INDUSTRY': 0.02,
-                            'CONSTRUCTION_SITE': 0.02
-                        }
-                    },
-                    'BARAKAHU DIVISION': {
-                        'sub_divisions': ['Barakahu', 'Murree', 'Kohat Bazar'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_GENERAL': 0.25, 'RESIDENTIAL_PROTECTED': 0.20, 'FARMHOUSE': 0.10,
-                            'HOTEL': 0.10, 'RESTAURANT_HOTEL': 0.08, 'COMMERCIAL_GENERAL': 0.08,
-                            'TUBE_WELL': 0.03, 'GOVT_SCHOOL': 0.03, 'MOSQUE': 0.05, 'CONSTRUCTION_SITE': 0.03
-                        }
-                    }
+                    'RESIDENTIAL_GENERAL': 0.20, 'RESIDENTIAL_PROTECTED': 0.15, 'RESIDENTIAL_UNPROTECTED': 0.10,
+                    'COMMERCIAL_GENERAL': 0.10, 'GOVT_OFFICE': 0.05, 'TUBE_WELL': 0.10,
+                    'SMALL_INDUSTRY': 0.03, 'MOSQUE': 0.05, 'GOVT_SCHOOL': 0.03, 'RICE_MILL': 0.02
                 }
             },
-            'RAWALPINDI': {
-                'growth_rate': 0.15,
-                'population_density': 'high',
-                'coordinates': {'lat_center': 33.5651, 'lon_center': 73.0169, 'radius': 0.2},
+            'JHELUM DIVISION 2': {
+                'sub_divisions': ['Dina', 'Sohawa', 'Pind Dadan Khan'],
                 'consumer_type_distribution': {
-                    'residential': 0.60,
-                    'commercial': 0.20,
-                    'industrial': 0.08,
-                    'government': 0.05,
-                    'agricultural': 0.03,
-                    'religious': 0.02,
-                    'bulk': 0.01,
-                    'temporary': 0.005,
-                    'special': 0.005
-                },
-                'divisions': {
-                    'RAWALPINDI CITY DIVISION': {
-                        'sub_divisions': ['Babri Bazar', 'Pirwadhai', 'Dhok Ratta', 'Waris Khan', 'Chah Sultan', 'Kalyan'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_GENERAL': 0.25, 'RESIDENTIAL_PROTECTED': 0.15, 'RESIDENTIAL_UNPROTECTED': 0.10,
-                            'COMMERCIAL_GENERAL': 0.15, 'PLAZA_MALL': 0.05, 'MARRIAGE_HALL': 0.03,
-                            'GOVT_OFFICE': 0.05, 'MOSQUE': 0.05, 'PRIVATE_SCHOOL': 0.03, 'BANK_ATM': 0.02,
-                            'WORKSHOP': 0.02, 'WAREHOUSE': 0.02
-                        }
-                    },
-                    'CANTT DIVISION': {
-                        'sub_divisions': ['Cantt', 'Tariqabad', 'RA Bazar', 'Chaklala'],
-                        'consumer_type_distribution': {
-                            'MILITARY_INSTALLATION': 0.15, 'GOVT_QUARTERS': 0.10, 'RESIDENTIAL_GENERAL': 0.15,
-                            'COMMERCIAL_GENERAL': 0.12, 'PLAZA_MALL': 0.05, 'PRIVATE_HOSPITAL': 0.03,
-                            'GOVT_HOSPITAL': 0.02, 'MOSQUE': 0.05, 'PRIVATE_SCHOOL': 0.03, 'RESTAURANT_HOTEL': 0.03,
-                            'AIRPORT': 0.02
-                        }
-                    },
-                    'SATELLITE TOWN DIVISION': {
-                        'sub_divisions': ['Satellite Town Main', 'Muslim Town', 'Gangal', 'Dhoke Kala Khan'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_GENERAL': 0.20, 'RESIDENTIAL_UNPROTECTED': 0.15, 'RESIDENTIAL_PROTECTED': 0.10,
-                            'COMMERCIAL_GENERAL': 0.15, 'PLAZA_MALL': 0.08, 'GOVT_OFFICE': 0.05,
-                            'PRIVATE_HOSPITAL': 0.03, 'PRIVATE_SCHOOL': 0.04, 'MOSQUE': 0.04,
-                            'BANK_ATM': 0.02, 'RESTAURANT_HOTEL': 0.03
-                        }
-                    },
-                    'WESTRIDGE DIVISION': {
-                        'sub_divisions': ['Westridge Main', 'Tarnol', 'Defence Westridge', 'Shamsabad'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_GENERAL': 0.25, 'RESIDENTIAL_UNPROTECTED': 0.15, 'RESIDENTIAL_PROTECTED': 0.10,
-                            'FARMHOUSE': 0.05, 'COMMERCIAL_GENERAL': 0.10, 'PETROL_PUMP': 0.03,
-                            'SMALL_INDUSTRY': 0.03, 'WAREHOUSE': 0.02, 'MOSQUE': 0.04, 'GOVT_SCHOOL': 0.03
-                        }
-                    },
-                    'RAWAT DIVISION': {
-                        'sub_divisions': ['Rawat', 'Mandra', 'Kallar Syedan', 'Chak Beli Khan'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_GENERAL': 0.20, 'RESIDENTIAL_PROTECTED': 0.20, 'FARMHOUSE': 0.05,
-                            'TUBE_WELL': 0.10, 'POULTRY_FARM': 0.05, 'SMALL_INDUSTRY': 0.05,
-                            'COMMERCIAL_GENERAL': 0.08, 'PETROL_PUMP': 0.02, 'MOSQUE': 0.05, 'GOVT_SCHOOL': 0.03
-                        }
-                    }
+                    'RESIDENTIAL_PROTECTED': 0.20, 'RESIDENTIAL_GENERAL': 0.15,
+                    'TUBE_WELL': 0.20, 'ORCHARD': 0.08, 'LIVESTOCK_FARM': 0.05,
+                    'COMMERCIAL_GENERAL': 0.05, 'MOSQUE': 0.05, 'GOVT_SCHOOL': 0.03
                 }
             },
-            'ATTOCK': {
-                'growth_rate': 0.10,
-                'population_density': 'medium',
-                'coordinates': {'lat_center': 33.7667, 'lon_center': 72.3667, 'radius': 0.25},
+            'GUJAR KHAN DIVISION': {
+                'sub_divisions': ['Gujar Khan', 'Kalar Syedan', 'Mandra', 'Naroli'],
                 'consumer_type_distribution': {
-                    'residential': 0.50,
-                    'commercial': 0.10,
-                    'industrial': 0.15,
-                    'government': 0.05,
-                    'agricultural': 0.15,
-                    'religious': 0.03,
-                    'bulk': 0.01,
-                    'temporary': 0.005,
-                    'special': 0.005
-                },
-                'divisions': {
-                    'ATTOCK DIVISION': {
-                        'sub_divisions': ['Attock City', 'Shadi Khan', 'Hassanabdal', 'Burhan'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_GENERAL': 0.20, 'RESIDENTIAL_PROTECTED': 0.20,
-                            'TUBE_WELL': 0.15, 'SMALL_INDUSTRY': 0.08, 'LARGE_INDUSTRY': 0.03,
-                            'COMMERCIAL_GENERAL': 0.08, 'PETROL_PUMP': 0.02, 'GOVT_OFFICE': 0.03,
-                            'MOSQUE': 0.05, 'GOVT_SCHOOL': 0.03, 'RICE_MILL': 0.03
-                        }
-                    },
-                    'TAXILA DIVISION': {
-                        'sub_divisions': ['Taxila', 'Margalla', 'Wah Cantt', 'New Taxila'],
-                        'consumer_type_distribution': {
-                            'LARGE_INDUSTRY': 0.15, 'FACTORY': 0.10, 'TEXTILE_UNIT': 0.05,
-                            'RESIDENTIAL_GENERAL': 0.15, 'RESIDENTIAL_PROTECTED': 0.10,
-                            'COMMERCIAL_GENERAL': 0.08, 'GOVT_OFFICE': 0.03, 'MILITARY_INSTALLATION': 0.05,
-                            'MOSQUE': 0.04, 'PRIVATE_SCHOOL': 0.02, 'WAREHOUSE': 0.03
-                        }
-                    },
-                    'PINDIGHEB DIVISION': {
-                        'sub_divisions': ['Pindigheb', 'Jan', 'Fateh Jang'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_PROTECTED': 0.25, 'RESIDENTIAL_GENERAL': 0.15,
-                            'TUBE_WELL': 0.20, 'LIVESTOCK_FARM': 0.05, 'ORCHARD': 0.05,
-                            'COMMERCIAL_GENERAL': 0.05, 'MOSQUE': 0.05, 'GOVT_SCHOOL': 0.03
-                        }
-                    }
+                    'RESIDENTIAL_GENERAL': 0.20, 'RESIDENTIAL_PROTECTED': 0.15,
+                    'TUBE_WELL': 0.15, 'POULTRY_FARM': 0.05, 'SMALL_INDUSTRY': 0.05,
+                    'COMMERCIAL_GENERAL': 0.08, 'PETROL_PUMP': 0.02, 'MOSQUE': 0.05,
+                    'GOVT_SCHOOL': 0.03, 'WAREHOUSE': 0.02
+                }
+            }
+        }
+    },
+    'CHAKWAL': {
+        'growth_rate': 0.08,
+        'population_density': 'low',
+        'coordinates': {'lat_center': 32.9333, 'lon_center': 72.8500, 'radius': 0.25},
+        'consumer_type_distribution': {
+            'residential': 0.45,
+            'commercial': 0.08,
+            'industrial': 0.05,
+            'government': 0.05,
+            'agricultural': 0.32,
+            'religious': 0.03,
+            'bulk': 0.01,
+            'temporary': 0.005,
+            'special': 0.005
+        },
+        'divisions': {
+            'CHAKWAL DIVISION': {
+                'sub_divisions': ['Chakwal City', 'Kalar Kahar', 'Choa Saidan Shah'],
+                'consumer_type_distribution': {
+                    'RESIDENTIAL_PROTECTED': 0.20, 'RESIDENTIAL_GENERAL': 0.15,
+                    'TUBE_WELL': 0.20, 'ORCHARD': 0.08, 'LIVESTOCK_FARM': 0.05,
+                    'COMMERCIAL_GENERAL': 0.05, 'GOVT_OFFICE': 0.03, 'MOSQUE': 0.05
                 }
             },
-            'JHELUM': {
-                'growth_rate': 0.10,
-                'population_density': 'medium',
-                'coordinates': {'lat_center': 32.9333, 'lon_center': 73.7333, 'radius': 0.2},
+            'TALAGANG DIVISION': {
+                'sub_divisions': ['Talagang', 'Danda Shah Balawal', 'Lawa'],
                 'consumer_type_distribution': {
-                    'residential': 0.55,
-                    'commercial': 0.12,
-                    'industrial': 0.08,
-                    'government': 0.05,
-                    'agricultural': 0.15,
-                    'religious': 0.03,
-                    'bulk': 0.01,
-                    'temporary': 0.005,
-                    'special': 0.005
-                },
-                'divisions': {
-                    'JHELUM DIVISION 1': {
-                        'sub_divisions': ['Jhelum City', 'Sara-e-Alamgir', 'Khushab'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_GENERAL': 0.20, 'RESIDENTIAL_PROTECTED': 0.15, 'RESIDENTIAL_UNPROTECTED': 0.10,
-                            'COMMERCIAL_GENERAL': 0.10, 'GOVT_OFFICE': 0.05, 'TUBE_WELL': 0.10,
-                            'SMALL_INDUSTRY': 0.03, 'MOSQUE': 0.05, 'GOVT_SCHOOL': 0.03, 'RICE_MILL': 0.02
-                        }
-                    },
-                    'JHELUM DIVISION 2': {
-                        'sub_divisions': ['Dina', 'Sohawa', 'Pind Dadan Khan'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_PROTECTED': 0.20, 'RESIDENTIAL_GENERAL': 0.15,
-                            'TUBE_WELL': 0.20, 'ORCHARD': 0.08, 'LIVESTOCK_FARM': 0.05,
-                            'COMMERCIAL_GENERAL': 0.05, 'MOSQUE': 0.05, 'GOVT_SCHOOL': 0.03
-                        }
-                    },
-                    'GUJAR KHAN DIVISION': {
-                        'sub_divisions': ['Gujar Khan', 'Kalar Syedan', 'Mandra', 'Naroli'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_GENERAL': 0.20, 'RESIDENTIAL_PROTECTED': 0.15,
-                            'TUBE_WELL': 0.15, 'POULTRY_FARM': 0.05, 'SMALL_INDUSTRY': 0.05,
-                            'COMMERCIAL_GENERAL': 0.08, 'PETROL_PUMP': 0.02, 'MOSQUE': 0.05,
-                            'GOVT_SCHOOL': 0.03, 'WAREHOUSE': 0.02
-                        }
-                    }
+                    'RESIDENTIAL_PROTECTED': 0.20, 'RESIDENTIAL_GENERAL': 0.10,
+                    'TUBE_WELL': 0.25, 'LIVESTOCK_FARM': 0.08, 'GREENHOUSE': 0.03,
+                    'COMMERCIAL_GENERAL': 0.03, 'MOSQUE': 0.05, 'GOVT_SCHOOL': 0.03
                 }
             },
-            'CHAKWAL': {
-                'growth_rate': 0.08,
-                'population_density': 'low',
-                'coordinates': {'lat_center': 32.9333, 'lon_center': 72.8500, 'radius': 0.25},
+            'DHUDIAL DIVISION': {
+                'sub_divisions': ['Dhudial', 'Chak Beli Khan'],
                 'consumer_type_distribution': {
-                    'residential': 0.45,
-                    'commercial': 0.08,
-                    'industrial': 0.05,
-                    'government': 0.05,
-                    'agricultural': 0.32,
-                    'religious': 0.03,
-                    'bulk': 0.01,
-                    'temporary': 0.005,
-                    'special': 0.005
-                },
-                'divisions': {
-                    'CHAKWAL DIVISION': {
-                        'sub_divisions': ['Chakwal City', 'Kalar Kahar', 'Choa Saidan Shah'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_PROTECTED': 0.20, 'RESIDENTIAL_GENERAL': 0.15,
-                            'TUBE_WELL': 0.20, 'ORCHARD': 0.08, 'LIVESTOCK_FARM': 0.05,
-                            'COMMERCIAL_GENERAL': 0.05, 'GOVT_OFFICE': 0.03, 'MOSQUE': 0.05
-                        }
-                    },
-                    'TALAGANG DIVISION': {
-                        'sub_divisions': ['Talagang', 'Danda Shah Balawal', 'Lawa'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_PROTECTED': 0.20, 'RESIDENTIAL_GENERAL': 0.10,
-                            'TUBE_WELL': 0.25, 'LIVESTOCK_FARM': 0.08, 'GREENHOUSE': 0.03,
-                            'COMMERCIAL_GENERAL': 0.03, 'MOSQUE': 0.05, 'GOVT_SCHOOL': 0.03
-                        }
-                    },
-                    'DHUDIAL DIVISION': {
-                        'sub_divisions': ['Dhudial', 'Chak Beli Khan'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_PROTECTED': 0.20, 'RESIDENTIAL_GENERAL': 0.10,
-                            'TUBE_WELL': 0.25, 'POULTRY_FARM': 0.05, 'LIVESTOCK_FARM': 0.05,
-                            'COMMERCIAL_GENERAL': 0.03, 'MOSQUE': 0.05
-                        }
-                    },
-                    'PIND DADAN KHAN DIVISION': {
-                        'sub_divisions': ['Pind Dadan Khan', 'Jhelum Referral'],
-                        'consumer_type_distribution': {
-                            'RESIDENTIAL_PROTECTED': 0.15, 'RESIDENTIAL_GENERAL': 0.10,
-                            'TUBE_WELL': 0.30, 'ORCHARD': 0.10, 'FISHERY': 0.03,
-                            'COMMERCIAL_GENERAL': 0.03, 'MOSQUE': 0.05
-                        }
-                    }
+                    'RESIDENTIAL_PROTECTED': 0.20, 'RESIDENTIAL_GENERAL': 0.10,
+                    'TUBE_WELL': 0.25, 'POULTRY_FARM': 0.05, 'LIVESTOCK_FARM': 0.05,
+                    'COMMERCIAL_GENERAL': 0.03, 'MOSQUE': 0.05
+                }
+            },
+            'PIND DADAN KHAN DIVISION': {
+                'sub_divisions': ['Pind Dadan Khan', 'Jhelum Referral'],
+                'consumer_type_distribution': {
+                    'RESIDENTIAL_PROTECTED': 0.15, 'RESIDENTIAL_GENERAL': 0.10,
+                    'TUBE_WELL': 0.30, 'ORCHARD': 0.10, 'FISHERY': 0.03,
+                    'COMMERCIAL_GENERAL': 0.03, 'MOSQUE': 0.05
                 }
             }
         }
+    }
+})
+
+
+# ============================================================
+# CONSUMPTION PATTERNS (kW ranges per 15-minute interval)
+# ============================================================
+CONSUMPTION_PATTERNS = _freeze({
+    'typical': {'base': (0.1, 0.3), 'peak': (0.3, 0.6)},
+    'low': {'base': (0.05, 0.15), 'peak': (0.15, 0.3)},
+    'low_medium': {'base': (0.1, 0.2), 'peak': (0.2, 0.4)},
+    'high': {'base': (0.2, 0.4), 'peak': (0.4, 0.8)},
+    'luxury': {'base': (0.3, 0.6), 'peak': (0.6, 1.2)},
+    'business_hours': {'base': (0.1, 0.2), 'peak': (0.2, 0.5), 'off_hours': (0.05, 0.1)},
+    'business_hours_extended': {'base': (0.2, 0.3), 'peak': (0.3, 0.6), 'off_hours': (0.1, 0.2)},
+    '24_7': {'base': (0.2, 0.4), 'night': (0.1, 0.2)},
+    '24_7_low': {'base': (0.05, 0.1), 'night': (0.02, 0.05)},
+    'evening_peak': {'base': (0.1, 0.2), 'evening': (0.4, 0.8)},
+    'night_only': {'day': (0.01, 0.05), 'night': (0.3, 0.6)},
+    'industrial_single_shift': {'base': (0.5, 1.0), 'peak': (1.0, 2.0), 'off': (0.1, 0.2)},
+    'industrial_multi_shift': {'base': (1.0, 2.0), 'peak': (2.0, 4.0)},
+    'seasonal_peak': {'base': (0.3, 0.6), 'peak_season': (0.8, 1.5)},
+    'seasonal_daytime': {'base': (0.2, 0.4), 'seasonal': (0.6, 1.2)},
+    'solar_hybrid': {'day': (0.1, 0.3), 'evening': (0.4, 0.8), 'night': (0.1, 0.2)},
+    'ev_charging': {'day': (0.1, 0.3), 'evening': (0.6, 1.2), 'night': (0.2, 0.4)},
+    'prayer_times': {'base': (0.1, 0.2), 'prayer': (0.4, 0.8)},
+    'weekly_services': {'weekday': (0.1, 0.2), 'weekend': (0.4, 0.8)},
+    'minimal': (0.01, 0.05),
+    'event_based': (0.2, 0.8)
+})
+
+SUMMER_MONTHS = (5, 6, 7, 8, 9)
+WINTER_MONTHS = (12, 1, 2)
+
+# Fajr, Zuhr, Asr, Maghrib, Isha
+PRAYER_HOURS = (5, 6, 12, 13, 15, 16, 18, 19, 20, 21)
+
+# Season index per month (0 = other, 1 = summer, 2 = winter; index 0 unused)
+# and a representative month for each season
+MONTH_SEASON = np.array([0, 2, 2, 0, 0, 1, 1, 1, 1, 1, 0, 0, 2])
+SEASON_MONTHS = (3, 6, 1)
+
+
+class IESCOConsumerTypesGenerator:
+    def __init__(self, seed: int = 42):
+        # Generator for batch paths that are not given their own seed
+        self._rng = np.random.default_rng(seed)
+        
+        # Consumer types and districts are shared, read-only module constants
+        self.consumer_types = CONSUMER_TYPES
+        self.districts = DISTRICTS
         
         # ============================================================
         # Transformer specs (same as before)
@@ -1197,187 +1389,322 @@ class IESCOConsumerTypesGenerator:
             'reverse_energy': 0.002
         }
         
+        # ============================================================
+        # Consumer-type lookup arrays (indexed by type code)
+        # ============================================================
+        self._ct_names = list(self.consumer_types.keys())
+        self._ct_index = {name: code for code, name in enumerate(self._ct_names)}
+        self._ct_solar = np.array([info['solar_adoption_rate'] for info in self.consumer_types.values()])
+        self._ct_names_array = np.array(self._ct_names, dtype=object)
+        self._ct_category_name = np.array([info['category_name'] for info in self.consumer_types.values()], dtype=object)
+        self._ct_description = np.array([info['description'] for info in self.consumer_types.values()], dtype=object)
+        self._ct_tariff_category = np.array([info['tariff_category'] for info in self.consumer_types.values()], dtype=object)
+        self._ct_phase = np.array([info['phase'] for info in self.consumer_types.values()], dtype=object)
+        self._ct_meter_type = np.array([info['meter_type'] for info in self.consumer_types.values()], dtype=object)
+        self._ct_load_low = np.array([info['load_range'][0] for info in self.consumer_types.values()], dtype=np.float64)
+        self._ct_load_high = np.array([info['load_range'][1] for info in self.consumer_types.values()], dtype=np.float64)
+        self._ct_sub_category = np.array([info['sub_category'] for info in self.consumer_types.values()], dtype=object)
+        self._ct_subsidized = np.array([info['subsidized'] for info in self.consumer_types.values()], dtype=bool)
+        self._ct_priority = np.array([info['priority'] for info in self.consumer_types.values()], dtype=object)
+        self._ct_default = self._ct_index['RESIDENTIAL_GENERAL']
+        
+        # Consumption ranges indexed by (pattern id, season, weekend, hour)
+        self._pattern_names = sorted({info['consumption_pattern'] for info in self.consumer_types.values()})
+        pattern_index = {name: pid for pid, name in enumerate(self._pattern_names)}
+        self._ct_pattern = np.array([pattern_index[info['consumption_pattern']]
+                                     for info in self.consumer_types.values()])
+        self._consumption_lo, self._consumption_hi = self._build_consumption_tables()
+        
+        # (transformers_df, distribution rows, sub-division -> row positions)
+        self._distribution_cache = None
+        
+        # Faker value pools, built on first use (see _get_faker_pools)
+        self._faker_pools = None
+        
+        # District-level type distributions and their alias samplers, built once per district
+        self._district_dist_cache = {}
+        self._district_type_tables = {}
+        for district_name in self.districts:
+            self._district_type_tables[district_name] = self._build_type_table(
+                self._get_district_level_distribution(district_name)
+            )
+        
+        # Alias samplers over consumer type codes, one per division; divisions
+        # without their own distribution share their district's sampler
+        self._division_type_tables = {}
+        for district_name, district_info in self.districts.items():
+            for div_name, div_info in district_info['divisions'].items():
+                if 'consumer_type_distribution' in div_info:
+                    type_sampler = self._build_type_table(div_info['consumer_type_distribution'])
+                else:
+                    type_sampler = self._district_type_tables[district_name]
+                self._division_type_tables[(district_name, div_name)] = type_sampler
+        
         self.events_log = []
 
     def generate_consumer_type_meters(self,
                                      num_meters: int,
                                      transformers_df: pd.DataFrame,
-                                     current_date: str) -> pd.DataFrame:
+                                     current_date: str,
+                                     max_workers: Optional[int] = None,
+                                     seed: int = 42) -> pd.DataFrame:
         """
         Generate meters with granular consumer types
+        
+        Sub-divisions are processed in parallel worker processes
+        (max_workers=1 runs serially in-process).
         """
         
-        meters = []
-        distribution_transformers = transformers_df[transformers_df['transformer_type'] == 'distribution']
+        # Parse the reference date once; every meter's connection window derives from it
+        current_ts = pd.to_datetime(current_date)
+        connect_start = current_ts - pd.Timedelta(days=8*365)
+        distribution_transformers, subdiv_indices = self._prepare_distribution(transformers_df)
+        transformer_fields = {
+            col: distribution_transformers[col].to_numpy()
+            for col in ['feeder_name', 'grid_transformer_id', 'transformer_id', 'latitude', 'longitude']
+        }
         
         print("\n👥 Generating meters with granular consumer types...")
         
-        # Group transformers by sub-division
-        transformers_by_subdiv = defaultdict(list)
-        for _, transformer in distribution_transformers.iterrows():
-            transformers_by_subdiv[transformer['sub_division']].append(transformer)
-        
         # First, collect all sub-divisions with their consumer type distributions
         all_subdivs = []
         for district_name, district_info in self.districts.items():
             for div_name, div_info in district_info['divisions'].items():
-                for sub_div in div_info['sub_divisions']:
-                    # Get distribution for this sub-division
+                # Sampler for this division (tables are precomputed; only divisions
+                # added after construction need building here)
+                type_sampler = self._division_type_tables.get((district_name, div_name))
+                if type_sampler is None:
                     if 'consumer_type_distribution' in div_info:
-                        type_dist = div_info['consumer_type_distribution']
+                        type_sampler = self._build_type_table(div_info['consumer_type_distribution'])
                     else:
-                        # Use district-level distribution if sub-division specific not available
-                        type_dist = self._get_district_level_distribution(district_info)
-                    
+                        # Use district-level distribution if division specific not available
+                        type_sampler = self._build_type_table(self._get_district_level_distribution(district_name))
+                    self._division_type_tables[(district_name, div_name)] = type_sampler
+                
+                for sub_div in div_info['sub_divisions']:
                     all_subdivs.append({
                         'district': district_name,
                         'division': div_name,
                         'sub_division': sub_div,
-                        'coordinates': district_info['coordinates'],
-                        'type_distribution': type_dist,
+                        'coordinates': dict(district_info['coordinates']),
+                        'type_sampler': type_sampler,
                         'growth_rate': district_info['growth_rate']
                     })
         
-        # Calculate total weight for distribution
-        total_weight = len(all_subdivs)
-        meters_per_subdiv = max(1, num_meters // len(all_subdivs))
-        remaining_meters = num_meters - (meters_per_subdiv * len(all_subdivs))
+        # Only sub-divisions with transformers can host meters
+        subdiv_transformer_idx = []
+        for subdiv_info in all_subdivs:
+            transformer_idx = subdiv_indices.get(subdiv_info['sub_division'])
+            if transformer_idx is not None and len(transformer_idx) > 0:
+                subdiv_transformer_idx.append((subdiv_info, transformer_idx))
         
-        meter_id = 1
-        type_counts = defaultdict(int)
+        # Split num_meters exactly across them so no trimming is needed afterwards
+        meters_per_subdiv, remaining_meters = divmod(num_meters, max(1, len(subdiv_transformer_idx)))
         
-        for subdiv_info in tqdm(all_subdivs, desc="Processing sub-divisions"):
-            subdiv_transformers = transformers_by_subdiv.get(subdiv_info['sub_division'], [])
-            
-            if not subdiv_transformers:
+        # Allocate meter counts up front so each sub-division is an independent task
+        tasks = []
+        for idx, (subdiv_info, transformer_idx) in enumerate(subdiv_transformer_idx):
+            subdiv_meters = meters_per_subdiv + (1 if idx < remaining_meters else 0)
+            if subdiv_meters == 0:
                 continue
             
-            # Determine how many meters for this sub-division
-            subdiv_meters = meters_per_subdiv
-            if remaining_meters > 0:
-                subdiv_meters += 1
-                remaining_meters -= 1
+            subdiv_transformers = {col: values[transformer_idx] for col, values in transformer_fields.items()}
             
-            # Distribute meters across transformers
-            meters_per_transformer = subdiv_meters // len(subdiv_transformers)
-            extra = subdiv_meters % len(subdiv_transformers)
-            
-            for idx, transformer_row in enumerate(subdiv_transformers):
-                transformer = transformer_row.to_dict() if hasattr(transformer_row, 'to_dict') else transformer_row
-                
-                trans_meters = meters_per_transformer + (1 if idx < extra else 0)
-                
-                for _ in range(trans_meters):
-                    # Select consumer type based on sub-division distribution
-                    consumer_type = self._select_consumer_type(subdiv_info['type_distribution'])
-                    type_info = self.consumer_types[consumer_type]
-                    
-                    # Generate connection date
-                    connection_date = fake.date_between(
-                        start_date=pd.to_datetime(current_date) - timedelta(days=8*365),
-                        end_date=current_date
-                    )
-                    
-                    consumer_id = f"CI{random.randint(1000000, 9999999)}"
-                    meter_number = f"{random.randint(10000000000, 99999999999)}"
-                    
-                    # Generate load based on consumer type
-                    load_range = type_info['load_range']
-                    connected_load = round(random.uniform(load_range[0], load_range[1]), 2)
-                    
-                    # Determine if this is a net metering prosumer
-                    is_prosumer = False
-                    if consumer_type == 'NET_METERING_PROSUMER':
-                        is_prosumer = True
-                    elif type_info['solar_adoption_rate'] > random.random():
-                        is_prosumer = True
-                        consumer_type = 'NET_METERING_PROSUMER'
-                        type_info = self.consumer_types['NET_METERING_PROSUMER']
-                    
-                    # Generate address
-                    address = self._generate_address(
-                        subdiv_info['district'],
-                        subdiv_info['division'],
-                        subdiv_info['sub_division']
-                    )
-                    
-                    meter = {
-                        'consumer_id': consumer_id,
-                        'meter_number': meter_number,
-                        'previous_meter_number': None,
-                        'meter_generation': 1,
-                        'consumer_type': consumer_type,
-                        'consumer_type_name': type_info['category_name'],
-                        'consumer_type_description': type_info['description'],
-                        'tariff_category': type_info['tariff_category'],
-                        'consumer_category': type_info['sub_category'],
-                        'installation_date': connection_date,
-                        'connection_date': connection_date,
-                        'deactivation_date': None,
-                        'is_active': True,
-                        'reference_no': f"11 {random.randint(10000, 99999)} {random.randint(1000000, 9999999)} U",
-                        'name': self._generate_name_by_type(consumer_type),
-                        'father_name': fake.name_male() if random.random() > 0.3 else fake.name_female(),
-                        'cnic': f"{random.randint(10000, 99999)}-{random.randint(1000000, 9999999)}-{random.randint(1, 9)}",
-                        'phone': f"03{random.randint(0, 9)}-{random.randint(1000000, 9999999)}",
-                        'address': address,
-                        'district': subdiv_info['district'],
-                        'division': subdiv_info['division'],
-                        'sub_division': subdiv_info['sub_division'],
-                        'feeder_name': transformer['feeder_name'],
-                        'grid_transformer_id': transformer['grid_transformer_id'],
-                        'distribution_transformer_id': transformer['transformer_id'],
-                        'phase_type': type_info['phase'],
-                        'meter_type': type_info['meter_type'],
-                        'meter_make': self._get_meter_make(type_info['meter_type']),
-                        'meter_model': self._get_meter_model(type_info['meter_type']),
-                        'latitude': transformer['latitude'] + random.uniform(-0.001, 0.001),
-                        'longitude': transformer['longitude'] + random.uniform(-0.001, 0.001),
-                        'status': 'Active',
-                        'connected_load_kw': connected_load,
-                        'sanctioned_load_kw': connected_load * random.uniform(1.1, 1.3),
-                        'has_solar': is_prosumer,
-                        'solar_capacity_kw': round(random.uniform(3, 15), 2) if is_prosumer else 0,
-                        'solar_installation_date': fake.date_between(
-                            start_date=max(connection_date, pd.to_datetime('2018-01-01')),
-                            end_date=current_date
-                        ) if is_prosumer else None,
-                        'subsidized': type_info['subsidized'],
-                        'priority': type_info['priority'],
-                        'average_monthly_consumption': 0,
-                        'billing_status': 'Regular',
-                        'payment_method': self._get_payment_method(consumer_type),
-                        'email': fake.email(),
-                        'lifecycle_events': []
+            # Deterministic per-task seed keeps output independent of scheduling
+            tasks.append((subdiv_info, subdiv_transformers, subdiv_meters, current_ts, connect_start, seed + len(tasks)))
+        
+        results = [None] * len(tasks)
+        # Throttle progress redraws; sub-division tasks can complete very quickly
+        progress = {'desc': "Processing sub-divisions", 'mininterval': 0.5, 'smoothing': 0.1}
+        # No point starting more workers than there are sub-divisions
+        if max_workers is None:
+            max_workers = min(len(tasks), os.cpu_count() or 1)
+        if max_workers <= 1:
+            for task_idx, task in enumerate(tqdm(tasks, **progress)):
+                results[task_idx] = self._build_subdiv_meters(*task)
+        else:
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_subdiv_worker) as executor:
+                    futures = {
+                        executor.submit(_build_subdiv_meters_task, task): task_idx
+                        for task_idx, task in enumerate(tasks)
                     }
-                    
-                    meters.append(meter)
-                    type_counts[consumer_type] += 1
-                    meter_id += 1
+                    for future in tqdm(as_completed(futures), total=len(futures), **progress):
+                        results[futures[future]] = future.result()
+            except (PicklingError, BrokenProcessPool, AttributeError) as e:
+                print(f"⚠️  Parallel sub-division processing unavailable ({e}); running serially")
+                for task_idx, task in enumerate(tqdm(tasks, **progress)):
+                    results[task_idx] = self._build_subdiv_meters(*task)
         
-        # Trim to exact number
-        if len(meters) > num_meters:
-            meters = random.sample(meters, num_meters)
+        # Stitch the per-sub-division columns together once
+        code_chunks = [codes for _, codes in results]
+        meter_columns = {}
+        if results:
+            for col in results[0][0]:
+                chunks = [columns[col] for columns, _ in results]
+                if isinstance(chunks[0], np.ndarray):
+                    meter_columns[col] = np.concatenate(chunks)
+                else:
+                    meter_columns[col] = list(chain.from_iterable(chunks))
+        meters_df = pd.DataFrame(meter_columns)
         
-        print(f"\n✅ Generated {len(meters)} meters with {len(type_counts)} consumer types")
+        # Count consumer types in one pass over all sampled codes
+        all_codes = np.concatenate(code_chunks) if code_chunks else np.empty(0, dtype=np.int64)
+        counts = np.bincount(all_codes, minlength=len(self._ct_names))
+        type_counts = {self._ct_names[code]: int(count) for code, count in enumerate(counts) if count}
+        
+        print(f"\n✅ Generated {len(meters_df)} meters with {len(type_counts)} consumer types")
         
         # Print top consumer types
         print("\n📊 Top Consumer Types:")
         sorted_types = sorted(type_counts.items(), key=lambda x: x[1], reverse=True)[:15]
         for consumer_type, count in sorted_types:
-            pct = (count / len(meters)) * 100
+            pct = (count / len(meters_df)) * 100
             type_name = self.consumer_types[consumer_type]['category_name']
             print(f"   - {type_name}: {count:,} ({pct:.1f}%)")
         
-        return pd.DataFrame(meters)
+        if not meters_df.empty:
+            # Low-cardinality columns as categoricals; consumer_type categories follow type codes
+            meters_df['consumer_type'] = pd.Categorical(meters_df['consumer_type'], categories=self._ct_names)
+            meters_df['consumer_type_id'] = meters_df['consumer_type'].cat.codes.astype(np.int16)
+            for col in ['consumer_category', 'tariff_category', 'phase_type', 'meter_type',
+                        'meter_make', 'meter_model', 'district', 'division', 'sub_division', 'status']:
+                meters_df[col] = meters_df[col].astype('category')
+        
+        return meters_df
 
-    def _select_consumer_type(self, type_distribution: Dict) -> str:
-        """Select consumer type based on distribution"""
-        types = list(type_distribution.keys())
-        weights = list(type_distribution.values())
-        return random.choices(types, weights=weights, k=1)[0]
+    def _prepare_distribution(self, transformers_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
+        """Filter distribution transformers and index them by sub-division (cached per DataFrame)"""
+        if self._distribution_cache is None or self._distribution_cache[0] is not transformers_df:
+            distribution_df = transformers_df[transformers_df['transformer_type'] == 'distribution']
+            subdiv_indices = distribution_df.groupby('sub_division').indices
+            self._distribution_cache = (transformers_df, distribution_df, subdiv_indices)
+        return self._distribution_cache[1], self._distribution_cache[2]
 
-    def _get_district_level_distribution(self, district_info: Dict) -> Dict:
+    def _build_subdiv_meters(self,
+                             subdiv_info: Dict,
+                             subdiv_transformers: Dict[str, np.ndarray],
+                             subdiv_meters: int,
+                             current_ts: pd.Timestamp,
+                             connect_start: pd.Timestamp,
+                             seed: int) -> Tuple[Dict[str, object], np.ndarray]:
+        """Build all meters for one sub-division as columns, returning columns and type codes"""
+        rng = np.random.default_rng(seed)
+        n = subdiv_meters
+        prosumer_code = self._ct_index['NET_METERING_PROSUMER']
+        
+        # Select consumer types for the whole sub-division, then upgrade
+        # solar adopters to net metering prosumers in a single masked pass.
+        # sampled_codes keeps the pre-upgrade types, whose load range applies
+        sampled_codes = subdiv_info['type_sampler'].sample_n(n, rng)
+        prosumer_mask = (rng.random(n) < self._ct_solar[sampled_codes]) | (sampled_codes == prosumer_code)
+        codes = np.where(prosumer_mask, prosumer_code, sampled_codes)
+        consumer_types = self._ct_names_array[codes]
+        meter_types = self._ct_meter_type[codes]
+        
+        # Sample father names and emails for the whole batch from the pre-generated pools
+        pools = self._get_faker_pools()
+        is_male = rng.random(n) > 0.3
+        father_names = np.where(
+            is_male,
+            pools['male'][rng.integers(0, NAME_POOL_SIZE, n)],
+            pools['female'][rng.integers(0, NAME_POOL_SIZE, n)]
+        )
+        emails = pools['email'][rng.integers(0, NAME_POOL_SIZE, n)]
+        
+        # Distribute meters across transformers (earlier transformers take the remainder)
+        n_transformers = len(subdiv_transformers['transformer_id'])
+        per_transformer = np.full(n_transformers, n // n_transformers)
+        per_transformer[:n % n_transformers] += 1
+        
+        # Connection dates: uniform whole-day offsets within the connection window
+        window_start = np.datetime64(connect_start.normalize(), 'D')
+        window_end = np.datetime64(current_ts.normalize(), 'D')
+        connection_dates = window_start + rng.integers(0, (window_end - window_start).astype(int) + 1, n)
+        
+        # Solar installation dates fall between connection (or programme start) and today
+        solar_start = np.maximum(connection_dates, np.datetime64(SOLAR_PROGRAM_START, 'D'))
+        solar_span = np.maximum((window_end - solar_start).astype(int), 0)
+        solar_dates = solar_start + rng.integers(0, solar_span + 1)
+        solar_dates = np.where(prosumer_mask, solar_dates, np.datetime64('NaT'))
+        
+        connected_load = np.round(rng.uniform(self._ct_load_low[sampled_codes], self._ct_load_high[sampled_codes]), 2)
+        
+        columns = {
+            # Identifiers stay numeric in memory; format_identifiers adds the text form for export
+            'consumer_id': rng.integers(1000000, 10000000, n, dtype=np.int64),
+            'meter_number': rng.integers(10000000000, 100000000000, n, dtype=np.int64),
+            'previous_meter_number': np.full(n, None, dtype=object),
+            'meter_generation': np.ones(n, dtype=np.int64),
+            'consumer_type': consumer_types,
+            'consumer_type_name': self._ct_category_name[codes],
+            'consumer_type_description': self._ct_description[codes],
+            'tariff_category': self._ct_tariff_category[codes],
+            'consumer_category': self._ct_sub_category[codes],
+            'installation_date': connection_dates,
+            'connection_date': connection_dates,
+            'deactivation_date': np.full(n, None, dtype=object),
+            'is_active': np.ones(n, dtype=bool),
+            'reference_no': _str_concat('11 ', rng.integers(10000, 100000, n).astype(str), ' ',
+                                        rng.integers(1000000, 10000000, n).astype(str), ' U'),
+            'name': self._generate_names_batch(consumer_types, rng),
+            'father_name': father_names,
+            'cnic': _str_concat(rng.integers(10000, 100000, n).astype(str), '-',
+                                rng.integers(1000000, 10000000, n).astype(str), '-',
+                                rng.integers(1, 10, n).astype(str)),
+            'phone': _str_concat('03', rng.integers(0, 10, n).astype(str), '-',
+                                 rng.integers(1000000, 10000000, n).astype(str)),
+            'address': self._generate_addresses_batch(
+                subdiv_info['district'],
+                subdiv_info['division'],
+                subdiv_info['sub_division'],
+                n,
+                rng
+            ),
+            'district': np.full(n, subdiv_info['district'], dtype=object),
+            'division': np.full(n, subdiv_info['division'], dtype=object),
+            'sub_division': np.full(n, subdiv_info['sub_division'], dtype=object),
+            'feeder_name': np.repeat(subdiv_transformers['feeder_name'], per_transformer),
+            'grid_transformer_id': np.repeat(subdiv_transformers['grid_transformer_id'], per_transformer),
+            'distribution_transformer_id': np.repeat(subdiv_transformers['transformer_id'], per_transformer),
+            'phase_type': self._ct_phase[codes],
+            'meter_type': meter_types,
+            'meter_make': self._choose_batch(meter_types, self._meter_make_options, rng),
+            'meter_model': self._choose_batch(meter_types, self._meter_model_options, rng),
+            'latitude': np.repeat(subdiv_transformers['latitude'], per_transformer) + rng.uniform(-0.001, 0.001, n),
+            'longitude': np.repeat(subdiv_transformers['longitude'], per_transformer) + rng.uniform(-0.001, 0.001, n),
+            'status': np.full(n, 'Active', dtype=object),
+            'connected_load_kw': connected_load.astype(np.float32),
+            'sanctioned_load_kw': (connected_load * rng.uniform(1.1, 1.3, n)).astype(np.float32),
+            'has_solar': prosumer_mask,
+            'solar_capacity_kw': np.where(prosumer_mask, np.round(rng.uniform(3, 15, n), 2), 0).astype(np.float32),
+            'solar_installation_date': solar_dates,
+            'subsidized': self._ct_subsidized[codes],
+            'priority': self._ct_priority[codes],
+            'average_monthly_consumption': np.zeros(n, dtype=np.int64),
+            'billing_status': np.full(n, 'Regular', dtype=object),
+            'payment_method': self._choose_batch(consumer_types, self._payment_method_options, rng),
+            'email': emails,
+            'lifecycle_events': [[] for _ in range(n)]
+        }
+        
+        return columns, codes
+
+    def _build_type_table(self, type_distribution: Dict) -> AliasSampler:
+        """Convert a type distribution into an alias sampler over consumer type codes"""
+        # Types missing from CONSUMER_TYPES are skipped; remaining weights are renormalized
+        known = [(self._ct_index[t], w) for t, w in type_distribution.items() if t in self._ct_index]
+        return AliasSampler([w for _, w in known], outcomes=np.array([code for code, _ in known], dtype=np.int64))
+
+    def _get_district_level_distribution(self, district_name: str) -> Dict:
+        """Get district-level distribution, computed once per district"""
+        if district_name not in self._district_dist_cache:
+            self._district_dist_cache[district_name] = self._build_district_level_distribution(
+                self.districts[district_name]
+            )
+        return self._district_dist_cache[district_name]
+
+    def _build_district_level_distribution(self, district_info: Dict) -> Dict:
         """Generate distribution from district-level percentages"""
         # Simplified mapping from categories to specific types
         category_dist = district_info['consumer_type_distribution']
@@ -1474,224 +1801,260 @@ class IESCOConsumerTypesGenerator:
         
         return distribution
 
-    def _generate_name_by_type(self, consumer_type: str) -> str:
-        """Generate appropriate name based on consumer type"""
-        
-        if 'GOVT' in consumer_type:
-            depts = ['Education', 'Health', 'Municipal', 'Public Works', 'Revenue']
-            return f"Government {random.choice(depts)} Department"
-        
-        elif 'SCHOOL' in consumer_type or 'COLLEGE' in consumer_type or 'UNIVERSITY' in consumer_type:
-            if 'GOVT' in consumer_type:
-                prefixes = ['Government', 'Federal', 'Islamabad Model']
-            else:
-                prefixes = ['The City', 'Roots', 'Beaconhouse', 'Lahore Grammar', 'Pak-Turk']
-            suffixes = ['School', 'College', 'Academy', 'High School', 'Public School']
-            return f"{random.choice(prefixes)} {random.choice(suffixes)}"
+    def _get_faker_pools(self) -> Dict[str, np.ndarray]:
+        """Build fixed-seed pools of Faker values once, so batches sample by index"""
+        if self._faker_pools is None:
+            # Dedicated seeded instance: every worker process builds identical pools
+            pool_fake = Faker('en_PK')
+            pool_fake.seed_instance(0)
+            male = np.array([pool_fake.name_male() for _ in range(NAME_POOL_SIZE)])
+            female = np.array([pool_fake.name_female() for _ in range(NAME_POOL_SIZE)])
+            self._faker_pools = {
+                'male': male,
+                'female': female,
+                'any': np.concatenate([male, female]),
+                'last_name': np.array([pool_fake.last_name() for _ in range(NAME_POOL_SIZE)]),
+                'city': np.array([pool_fake.city()[:10] for _ in range(NAME_POOL_SIZE)]),
+                'email': np.array([pool_fake.email() for _ in range(NAME_POOL_SIZE)])
+            }
+        return self._faker_pools
+
+    def _generate_names_batch(self, consumer_types: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Names by consumer type, with one set of draws per distinct consumer type"""
+        pools = self._get_faker_pools()
+        names = np.empty(len(consumer_types), dtype=object)
+        unique_types, inverse = np.unique(consumer_types, return_inverse=True)
         
-        elif 'HOSPITAL' in consumer_type:
+        for k, consumer_type in enumerate(unique_types):
+            idx = np.flatnonzero(inverse == k)
+            n = len(idx)
+            
+            def pick(pool):
+                pool = np.asarray(pool)
+                return pool[rng.integers(0, len(pool), n)]
+            
             if 'GOVT' in consumer_type:
-                return f"Government {random.choice(['District', 'General', 'Civil'])} Hospital"
+                group = _str_concat('Government ', pick(GOVT_DEPARTMENTS), ' Department')
+            elif 'SCHOOL' in consumer_type or 'COLLEGE' in consumer_type or 'UNIVERSITY' in consumer_type:
+                group = _str_concat(pick(PRIVATE_SCHOOL_PREFIXES), ' ', pick(SCHOOL_SUFFIXES))
+            elif 'HOSPITAL' in consumer_type:
+                group = _str_concat(pick(PRIVATE_HOSPITAL_NAMES), ' ', pick(HOSPITAL_SUFFIXES))
+            elif 'MOSQUE' in consumer_type:
+                group = _str_concat(pick(MOSQUE_NAMES), ' ', pick(pools['city']))
+            elif 'INDUSTRY' in consumer_type or 'FACTORY' in consumer_type:
+                group = _str_concat(pick(INDUSTRY_PRODUCTS), ' ', pick(INDUSTRY_SUFFIXES))
+            elif 'COMMERCIAL' in consumer_type or 'SHOP' in consumer_type:
+                group = _str_concat(pick(pools['last_name']), ' ', pick(SHOP_TYPES))
+            elif 'FARM' in consumer_type or 'AGRICULTURE' in consumer_type:
+                group = _str_concat(pick(pools['last_name']), ' ', pick(FARM_SUFFIXES))
             else:
-                return f"{random.choice(['Shifa', 'Ali Medical', 'Maroof', 'Rehman'])} {random.choice(['Hospital', 'Clinic', 'Medical Center'])}"
-        
-        elif 'MOSQUE' in consumer_type:
-            names = ['Jamia Masjid', 'Madni Masjid', 'Quba Masjid', 'Faisal Masjid', 'Badshahi Masjid']
-            return f"{random.choice(names)} {fake.city()[:10]}"
+                group = pick(pools['any'])
+            names[idx] = group
         
-        elif 'INDUSTRY' in consumer_type or 'FACTORY' in consumer_type:
-            products = ['Textile', 'Steel', 'Cement', 'Food', 'Pharmaceutical', 'Plastic', 'Paper']
-            return f"{random.choice(products)} {random.choice(['Industries', 'Mills', 'Factory', 'Manufacturing'])}"
-        
-        elif 'COMMERCIAL' in consumer_type or 'SHOP' in consumer_type:
-            shops = ['General Store', 'Medical Store', 'Electronics', 'Clothing', 'Furniture', 'Book Shop']
-            return f"{fake.last_name()} {random.choice(shops)}"
-        
-        elif 'FARM' in consumer_type or 'AGRICULTURE' in consumer_type:
-            return f"{fake.last_name()} {random.choice(['Farm', 'Agriculture', 'Tube Well', 'Orchard'])}"
-        
-        else:
-            # Default to person name
-            return fake.name()
+        return names
 
-    def _get_meter_make(self, meter_type: str) -> str:
-        """Get meter manufacturer based on type"""
+    def _meter_make_options(self, meter_type: str) -> Tuple[str, ...]:
+        """Candidate meter manufacturers for a meter type"""
         if 'smart' in meter_type.lower():
-            return random.choice(['Landis+Gyr', 'Siemens', 'Itron', 'Elster'])
+            return ('Landis+Gyr', 'Siemens', 'Itron', 'Elster')
         elif 'bi' in meter_type.lower():
-            return random.choice(['Landis+Gyr', 'Siemens', 'Itron'])
+            return ('Landis+Gyr', 'Siemens', 'Itron')
         else:
-            return random.choice(['S&C Electric', 'Local', 'WAPDA Standard'])
+            return ('S&C Electric', 'Local', 'WAPDA Standard')
 
-    def _get_meter_model(self, meter_type: str) -> str:
-        """Get meter model based on type"""
+    def _meter_model_options(self, meter_type: str) -> Tuple[str, ...]:
+        """Candidate meter models for a meter type"""
         if 'smart_tou_ht' in meter_type:
-            return random.choice(['SGM4000-HT', 'EM2400-TOU', 'AX-04-HT'])
+            return ('SGM4000-HT', 'EM2400-TOU', 'AX-04-HT')
         elif 'smart_tou' in meter_type:
-            return random.choice(['SGM3000-TOU', 'EM1200-TOU', 'AX-03-TOU'])
+            return ('SGM3000-TOU', 'EM1200-TOU', 'AX-03-TOU')
         elif 'smart_bi' in meter_type:
-            return random.choice(['SGM4000-BI', 'EM2400-NM', 'AX-04-NM'])
+            return ('SGM4000-BI', 'EM2400-NM', 'AX-04-NM')
         elif 'smart' in meter_type:
-            return random.choice(['SGM3000', 'EM1200', 'AX-03'])
+            return ('SGM3000', 'EM1200', 'AX-03')
         else:
-            return random.choice(['ME-100', 'ST-200', 'WAPDA-01'])
+            return ('ME-100', 'ST-200', 'WAPDA-01')
 
-    def _get_payment_method(self, consumer_type: str) -> str:
-        """Get typical payment method for consumer type"""
+    def _payment_method_options(self, consumer_type: str) -> Tuple[str, ...]:
+        """Typical payment methods for a consumer type"""
         if 'GOVT' in consumer_type:
-            return random.choice(['Bank Transfer', 'Government Treasury', 'Bank'])
+            return ('Bank Transfer', 'Government Treasury', 'Bank')
         elif 'INDUSTRY' in consumer_type or 'FACTORY' in consumer_type:
-            return random.choice(['Bank', 'Online', 'Bank Transfer'])
+            return ('Bank', 'Online', 'Bank Transfer')
         elif 'COMMERCIAL' in consumer_type:
-            return random.choice(['Bank', 'JazzCash', 'EasyPaisa', 'Online'])
+            return ('Bank', 'JazzCash', 'EasyPaisa', 'Online')
         elif 'RESIDENTIAL' in consumer_type:
-            return random.choice(['Bank', 'JazzCash', 'EasyPaisa', 'Online', 'Cash'])
-        else:
-            return random.choice(['Bank', 'JazzCash', 'EasyPaisa'])
-
-    def _generate_address(self, district: str, division: str, sub_division: str) -> str:
-        """Generate realistic address"""
-        street_types = ['Street', 'Road', 'Boulevard', 'Lane', 'Avenue', 'Chowk']
-        localities = {
-            'ISLAMABAD': ['G-7/4', 'G-8/1', 'G-9/4', 'F-7/3', 'F-8/1', 'F-10/2', 'I-8/2', 'I-10/3'],
-            'RAWALPINDI': ['Committee Chowk', 'Sadiqabad', 'Tench Bhatta', 'Chah Sultan', 'Dhoke Mangtal'],
-            'ATTOCK': ['Civil Quarters', 'Kamra Road', 'Nala Mohra', 'Shahdand'],
-            'JHELUM': ['Civil Lines', 'G.T. Road', 'Kachehri Chowk', 'Mandi City'],
-            'CHAKWAL': ['Mohalla Lathi', 'Ratta Mohra', 'Shamsabad']
-        }
-        
-        house_no = random.randint(1, 500)
-        street = f"{random.choice(street_types)} {random.randint(1, 30)}"
-        
-        if district in localities:
-            locality = random.choice(localities[district])
+            return ('Bank', 'JazzCash', 'EasyPaisa', 'Online', 'Cash')
         else:
-            locality = f"Main Bazar"
-        
-        return f"H.No. {house_no}, {street}, {locality}, {sub_division}, {division}, {district}"
+            return ('Bank', 'JazzCash', 'EasyPaisa')
 
-    def generate_consumption_patterns(self, consumer_type: str, timestamp: datetime) -> float:
-        """Generate consumption based on consumer type patterns"""
-        
-        type_info = self.consumer_types.get(consumer_type, self.consumer_types['RESIDENTIAL_GENERAL'])
-        pattern = type_info['consumption_pattern']
+    def _choose_batch(self, keys: np.ndarray, options_for, rng: np.random.Generator) -> np.ndarray:
+        """Pick uniformly from options_for(key) for every element, drawing once per distinct key"""
+        choices = np.empty(len(keys), dtype=object)
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        for k, key in enumerate(unique_keys):
+            idx = np.flatnonzero(inverse == k)
+            options = np.array(options_for(key), dtype=object)
+            choices[idx] = options[rng.integers(0, len(options), len(idx))]
+        return choices
+
+    def _generate_addresses_batch(self,
+                                  district: str,
+                                  division: str,
+                                  sub_division: str,
+                                  n: int,
+                                  rng: np.random.Generator) -> np.ndarray:
+        """Generate n addresses for one sub-division with column-wise string ops"""
+        localities = np.array(LOCALITIES.get(district, ('Main Bazar',)))
+        house_no = rng.integers(1, 501, n).astype(str)
+        street_type = np.array(STREET_TYPES)[rng.integers(0, len(STREET_TYPES), n)]
+        street_num = rng.integers(1, 31, n).astype(str)
+        locality = localities[rng.integers(0, len(localities), n)]
         
-        hour = timestamp.hour
-        month = timestamp.month
-        day = timestamp.dayofweek
-        is_weekend = day >= 5
-        
-        # Base consumption ranges by pattern
-        patterns = {
-            'typical': {'base': (0.1, 0.3), 'peak': (0.3, 0.6)},
-            'low': {'base': (0.05, 0.15), 'peak': (0.15, 0.3)},
-            'low_medium': {'base': (0.1, 0.2), 'peak': (0.2, 0.4)},
-            'high': {'base': (0.2, 0.4), 'peak': (0.4, 0.8)},
-            'luxury': {'base': (0.3, 0.6), 'peak': (0.6, 1.2)},
-            'business_hours': {'base': (0.1, 0.2), 'peak': (0.2, 0.5), 'off_hours': (0.05, 0.1)},
-            'business_hours_extended': {'base': (0.2, 0.3), 'peak': (0.3, 0.6), 'off_hours': (0.1, 0.2)},
-            '24_7': {'base': (0.2, 0.4), 'night': (0.1, 0.2)},
-            '24_7_low': {'base': (0.05, 0.1), 'night': (0.02, 0.05)},
-            'evening_peak': {'base': (0.1, 0.2), 'evening': (0.4, 0.8)},
-            'night_only': {'day': (0.01, 0.05), 'night': (0.3, 0.6)},
-            'industrial_single_shift': {'base': (0.5, 1.0), 'peak': (1.0, 2.0), 'off': (0.1, 0.2)},
-            'industrial_multi_shift': {'base': (1.0, 2.0), 'peak': (2.0, 4.0)},
-            'seasonal_peak': {'base': (0.3, 0.6), 'peak_season': (0.8, 1.5)},
-            'seasonal_daytime': {'base': (0.2, 0.4), 'seasonal': (0.6, 1.2)},
-            'solar_hybrid': {'day': (0.1, 0.3), 'evening': (0.4, 0.8), 'night': (0.1, 0.2)},
-            'ev_charging': {'day': (0.1, 0.3), 'evening': (0.6, 1.2), 'night': (0.2, 0.4)},
-            'prayer_times': {'base': (0.1, 0.2), 'prayer': (0.4, 0.8)},
-            'weekly_services': {'weekday': (0.1, 0.2), 'weekend': (0.4, 0.8)},
-            'minimal': (0.01, 0.05),
-            'event_based': (0.2, 0.8)
-        }
+        return _str_concat('H.No. ', house_no, ', ', street_type, ' ', street_num, ', ', locality,
+                           f", {sub_division}, {division}, {district}")
+
+    def _consumption_range(self, pattern: str, hour: int, month: int, is_weekend: bool) -> Tuple[float, float]:
+        """Consumption range for a pattern at one time slot, with seasonal and weekend adjustment"""
         
         # Determine if peak hour (6-10 PM for most)
         is_peak = (18 <= hour <= 22)
         
         # Get appropriate consumption range
-        if pattern in patterns:
-            p = patterns[pattern]
+        if pattern in CONSUMPTION_PATTERNS:
+            p = CONSUMPTION_PATTERNS[pattern]
             
             if isinstance(p, tuple):
                 # Simple uniform range
-                consumption = random.uniform(p[0], p[1])
+                low, high = p
             
             elif pattern == 'business_hours':
                 if 9 <= hour <= 17 and not is_weekend:
-                    consumption = random.uniform(p['peak'][0], p['peak'][1])
+                    low, high = p['peak']
                 else:
-                    consumption = random.uniform(p['off_hours'][0], p['off_hours'][1])
+                    low, high = p['off_hours']
             
             elif pattern == 'evening_peak':
                 if 18 <= hour <= 23:
-                    consumption = random.uniform(p['evening'][0], p['evening'][1])
+                    low, high = p['evening']
                 else:
-                    consumption = random.uniform(p['base'][0], p['base'][1])
+                    low, high = p['base']
             
             elif pattern == 'night_only':
                 if 19 <= hour <= 6:
-                    consumption = random.uniform(p['night'][0], p['night'][1])
+                    low, high = p['night']
                 else:
-                    consumption = random.uniform(p['day'][0], p['day'][1])
+                    low, high = p['day']
             
             elif pattern == 'solar_hybrid':
                 if 8 <= hour <= 17:
-                    consumption = random.uniform(p['day'][0], p['day'][1])
+                    low, high = p['day']
                 elif 18 <= hour <= 23:
-                    consumption = random.uniform(p['evening'][0], p['evening'][1])
+                    low, high = p['evening']
                 else:
-                    consumption = random.uniform(p['night'][0], p['night'][1])
+                    low, high = p['night']
             
             elif pattern == 'ev_charging':
                 if 18 <= hour <= 23:
-                    consumption = random.uniform(p['evening'][0], p['evening'][1])
+                    low, high = p['evening']
                 elif 23 <= hour <= 6:
-                    consumption = random.uniform(p['night'][0], p['night'][1])
+                    low, high = p['night']
                 else:
-                    consumption = random.uniform(p['day'][0], p['day'][1])
+                    low, high = p['day']
             
             elif pattern == 'seasonal_peak':
                 # Higher in summer
-                if month in [5, 6, 7, 8, 9]:
-                    consumption = random.uniform(p['peak_season'][0], p['peak_season'][1])
+                if month in SUMMER_MONTHS:
+                    low, high = p['peak_season']
                 else:
-                    consumption = random.uniform(p['base'][0], p['base'][1])
+                    low, high = p['base']
             
             elif pattern == 'prayer_times':
                 # Higher during prayer times (Fajr, Zuhr, Asr, Maghrib, Isha)
-                prayer_hours = [5, 6, 12, 13, 15, 16, 18, 19, 20, 21]
-                if hour in prayer_hours:
-                    consumption = random.uniform(p['prayer'][0], p['prayer'][1])
+                if hour in PRAYER_HOURS:
+                    low, high = p['prayer']
                 else:
-                    consumption = random.uniform(p['base'][0], p['base'][1])
+                    low, high = p['base']
             
             elif pattern == 'weekly_services':
                 if is_weekend:
-                    consumption = random.uniform(p['weekend'][0], p['weekend'][1])
+                    low, high = p['weekend']
                 else:
-                    consumption = random.uniform(p['weekday'][0], p['weekday'][1])
+                    low, high = p['weekday']
             
             else:
                 # Default to typical pattern
                 if is_peak:
-                    consumption = random.uniform(0.3, 0.6)
+                    low, high = 0.3, 0.6
                 else:
-                    consumption = random.uniform(0.1, 0.3)
+                    low, high = 0.1, 0.3
         else:
             # Default
-            consumption = random.uniform(0.1, 0.3)
+            low, high = 0.1, 0.3
         
         # Apply seasonal adjustment
-        summer_months = [5, 6, 7, 8, 9]
-        if month in summer_months:
-            consumption *= 1.4
-        elif month in [12, 1, 2]:
-            consumption *= 0.9
+        factor = 1.0
+        if month in SUMMER_MONTHS:
+            factor *= 1.4
+        elif month in WINTER_MONTHS:
+            factor *= 0.9
         
         # Weekend adjustment
         if is_weekend and pattern not in ['business_hours', 'business_hours_extended']:
-            consumption *= 1.2
+            factor *= 1.2
+        
+        return low * factor, high * factor
+
+    def _build_consumption_tables(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate _consumption_range for every (pattern, season, weekend, hour) slot"""
+        shape = (len(self._pattern_names), len(SEASON_MONTHS), 2, 24)
+        lo = np.zeros(shape, dtype=np.float32)
+        hi = np.zeros(shape, dtype=np.float32)
+        for pid, pattern in enumerate(self._pattern_names):
+            for season, month in enumerate(SEASON_MONTHS):
+                for weekend in (0, 1):
+                    for hour in range(24):
+                        lo[pid, season, weekend, hour], hi[pid, season, weekend, hour] = \
+                            self._consumption_range(pattern, hour, month, bool(weekend))
+        return lo, hi
+
+    def generate_consumption_patterns(self, consumer_type: str, timestamp: datetime) -> float:
+        """Generate consumption based on consumer type patterns"""
+        type_code = self._ct_index.get(consumer_type, self._ct_default)
+        slot = (self._ct_pattern[type_code], MONTH_SEASON[timestamp.month],
+                int(timestamp.dayofweek >= 5), timestamp.hour)
+        return random.uniform(float(self._consumption_lo[slot]), float(self._consumption_hi[slot]))
+
+    def generate_consumption_patterns_batch(self,
+                                            consumer_types,
+                                            timestamps,
+                                            rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Vectorized generate_consumption_patterns for many readings at once (float32)
+        
+        consumer_types is a single type name/consumer_type_id or an array of either
+        aligned with timestamps. Draws come from rng when given, otherwise from self._rng.
+        """
+        
+        timestamps = pd.DatetimeIndex(timestamps)
+        n = len(timestamps)
+        hour = timestamps.hour.values
+        month = timestamps.month.values
+        is_weekend = timestamps.dayofweek.values >= 5
+        
+        types = np.asarray(consumer_types)
+        if np.issubdtype(types.dtype, np.integer):
+            codes = np.broadcast_to(types, (n,))
+        else:
+            codes = pd.Index(self._ct_names).get_indexer(np.broadcast_to(types.astype(object), (n,)))
+            codes[codes < 0] = self._ct_default
+        pattern_id = self._ct_pattern[codes]
+        slot = (pattern_id, MONTH_SEASON[month], is_weekend.astype(np.intp), hour)
+        
+        low = self._consumption_lo[slot]
+        high = self._consumption_hi[slot]
+        rng = self._rng if rng is None else rng
+        consumption = low + (high - low) * rng.random(n, dtype=np.float32)
         
         return consumption
 
@@ -1770,6 +2133,129 @@ class IESCOConsumerTypesGenerator:
             'is_peak_hour': 18 <= hour <= 22
         }
 
+    def generate_readings_batch(self,
+                                meter: Dict,
+                                timestamps,
+                                transformer_load,
+                                seed: Optional[int] = None) -> pd.DataFrame:
+        """
+        Generate readings for one meter over many timestamps in a single pass
+        
+        Batch counterpart of generate_reading_with_consumer_type; transformer_load
+        may be a scalar or an array aligned with timestamps. Missing readings are dropped.
+        """
+        
+        timestamps = pd.DatetimeIndex(timestamps)
+        n = len(timestamps)
+        rng = self._rng if seed is None else np.random.default_rng(seed)
+        
+        consumer_type = meter['consumer_type']
+        type_id = meter.get('consumer_type_id')
+        if type_id is None:
+            type_id = self._ct_index.get(consumer_type, self._ct_default)
+        hours = timestamps.hour.values
+        
+        # Hour flags as boolean arrays, shared by the kernel and the output columns
+        is_peak = (hours >= 18) & (hours <= 22)
+        solar_active = bool(meter['has_solar']) & (hours >= 8) & (hours <= 17)
+        
+        # Base consumption; the kernel applies transformer load correlation and random variation
+        consumption = self.generate_consumption_patterns_batch(int(type_id), timestamps, rng)
+        transformer_load = np.broadcast_to(np.asarray(transformer_load, dtype=np.float32), (n,))
+        jitter = rng.random(n, dtype=np.float32)
+        
+        # Electrical parameters and quality flags
+        columns = {name: np.empty(n, dtype=np.float32) for name in (
+            'voltage_v', 'current_a', 'frequency_hz', 'power_factor',
+            'temperature_c', 'signal_strength_dbm', 'battery_voltage_v'
+        )}
+        noise = rng.standard_normal((6, n), dtype=np.float32)
+        flag = rng.choice(len(DATA_QUALITY_FLAGS), size=n, p=DATA_QUALITY_FLAG_PROBS).astype(np.int8)
+        _fill_readings(*columns.values(), consumption, transformer_load, jitter,
+                       is_peak, MONTH_BASE_TEMP[timestamps.month.values], noise, flag)
+        for name, decimals in (('voltage_v', 1), ('current_a', 2), ('frequency_hz', 2), ('power_factor', 3),
+                               ('temperature_c', 1), ('signal_strength_dbm', 1), ('battery_voltage_v', 2)):
+            np.round(columns[name], decimals, out=columns[name])
+        
+        keep = flag != FLAG_MISSING
+        df = pd.DataFrame({
+            'timestamp': timestamps[keep],
+            'meter_number': meter['meter_number'],
+            'consumer_id': meter['consumer_id'],
+            'consumer_type': consumer_type,
+            'consumer_category': self._ct_sub_category[type_id],
+            'distribution_transformer_id': meter['distribution_transformer_id'],
+            'reading_kwh': consumption[keep],
+            'energy_consumed_kwh': consumption[keep],
+            **{name: values[keep] for name, values in columns.items()},
+            'data_quality_flag': pd.Categorical.from_codes(flag[keep], DATA_QUALITY_FLAGS),
+            'meter_generation': meter['meter_generation'],
+            'solar_active': solar_active[keep],
+            'is_peak_hour': is_peak[keep]
+        })
+        
+        return df
+
+    def write_readings_parquet(self,
+                               meters_df: pd.DataFrame,
+                               start_date: str,
+                               end_date: str,
+                               output_path: str,
+                               reading_frequency: int = 15,
+                               transformer_load: float = 0.7,
+                               chunk_size: int = 2_000_000,
+                               seed: int = 42) -> int:
+        """
+        Stream readings for every meter to a Parquet file in row-group chunks
+        
+        Only about chunk_size readings are held in memory at a time, so the
+        date range is not limited by RAM. Returns the number of rows written.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        timestamps = pd.date_range(start=start_date, end=end_date, freq=f'{reading_frequency}min')
+        meter_cols = ['meter_number', 'consumer_id', 'consumer_type', 'distribution_transformer_id',
+                      'meter_generation', 'has_solar']
+        if 'consumer_type_id' in meters_df.columns:
+            meter_cols.append('consumer_type_id')
+        
+        print(f"\n📝 Streaming {len(meters_df):,} meters x {len(timestamps):,} intervals to {output_path}")
+        
+        writer = None
+        pending = []
+        pending_rows = 0
+        rows_written = 0
+        try:
+            for idx, meter in enumerate(tqdm(meters_df[meter_cols].to_dict('records'), desc="Writing readings")):
+                readings = self.generate_readings_batch(meter, timestamps, transformer_load, seed=seed + idx)
+                pending.append(readings)
+                pending_rows += len(readings)
+                
+                if pending_rows >= chunk_size or idx == len(meters_df) - 1:
+                    table = pa.Table.from_pandas(pd.concat(pending, ignore_index=True), preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(output_path, table.schema, compression='zstd', use_dictionary=True)
+                    writer.write_table(table.cast(writer.schema))
+                    rows_written += table.num_rows
+                    pending = []
+                    pending_rows = 0
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        print(f"✅ Wrote {rows_written:,} readings")
+        return rows_written
+
+    def format_identifiers(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return a copy of a meters/readings frame with export-formatted identifiers"""
+        df = df.copy()
+        if 'consumer_id' in df.columns and pd.api.types.is_integer_dtype(df['consumer_id']):
+            df['consumer_id'] = 'CI' + df['consumer_id'].astype(str)
+        if 'meter_number' in df.columns and pd.api.types.is_integer_dtype(df['meter_number']):
+            df['meter_number'] = df['meter_number'].astype(str)
+        return df
+
     def generate_all_data(self,
                          initial_meters: int = 10000,
                          start_date: str = '2023-01-01',
@@ -1801,6 +2287,24 @@ class IESCOConsumerTypesGenerator:
         }
 
 
+# Per-process generator used by sub-division worker tasks
+_worker_generator = None
+
+
+def _init_subdiv_worker():
+    """Process-pool initializer: build the worker's generator and Faker pools once"""
+    global _worker_generator
+    _worker_generator = IESCOConsumerTypesGenerator()
+    _worker_generator._get_faker_pools()
+
+
+def _build_subdiv_meters_task(task: Tuple) -> Tuple[Dict[str, object], np.ndarray]:
+    """Process-pool entry point: build one sub-division's meters"""
+    if _worker_generator is None:
+        _init_subdiv_worker()
+    return _worker_generator._build_subdiv_meters(*task)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate IESCO Data with Granular Consumer Types')
     parser.add_argument('--initial_meters', type=int, default=10000,
@@ -3,7 +3,7 @@ IESCO PARALLEL PIPELINE GENERATOR - VERSION 2.0
 ================================================
 Revolutionary parallel processing approach:
 ✓ Per-Meter Pipeline: readings → bills → payments (complete one meter before next)
-✓ Multi-threaded: Process multiple meters concurrently
+✓ Multi-process: Process multiple meters concurrently in worker processes
 ✓ Memory Efficient: Stream processing, no bulk loading
 ✓ Real-time Progress: See each meter complete its lifecycle
 ✓ All v1.5 features preserved: 40+ consumer types, grid events, theft, etc.
@@ -17,18 +17,29 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
-import random
-from faker import Faker
 import os
+import glob
+import shutil
 import json
 from tqdm import tqdm
 from typing import Tuple, Dict, List, Optional
 from collections import defaultdict
 import hashlib
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import pickle
+from pickle import PicklingError
+from multiprocessing import util as mp_util
 import threading
-from queue import Queue
+from queue import Empty, SimpleQueue
 import time
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+# Numba is optional: readings fall back to the NumPy kernel
+from numba_compat import njit, prange, set_num_threads, NUMBA_AVAILABLE
 
 # Import the base simulator from v1.5
 import sys
@@ -49,17 +60,119 @@ def load_v15_simulator():
 
 BaseSimulator = load_v15_simulator()
 
-# Initialize
-fake = Faker('en_PK')
-Faker.seed(42)
+# Basic slab rates (simplified): 0-50 @ 2, 50-100 @ 5, 100-200 @ 10, 200+ @ 15 Rs/kWh.
+# SLAB_CUM is the bill accumulated at the start of each slab
+SLAB_BREAKS = np.array([0.0, 50.0, 100.0, 200.0])
+SLAB_RATES = np.array([2.0, 5.0, 10.0, 15.0])
+SLAB_CUM = np.concatenate(([0.0], np.cumsum(np.diff(SLAB_BREAKS) * SLAB_RATES[:-1])))
+
+PAYMENT_METHODS = np.array(['online', 'bank', 'cash', 'mobile_app'])
+
+# Reading status is stored as 1-byte codes into this table (dictionary-encoded in Parquet)
+READING_STATUS = ('normal', 'tamper', 'outage')
+
+
+# Typed columns of one month of readings (name, dtype, rounding decimals); the
+# cumulative register stays float64 across the year, measurements are float32
+READING_COLUMNS = (
+    ('reading_kwh', np.float64, 2),
+    ('consumption_kwh', np.float32, 3),
+    ('voltage_v', np.float32, 1),
+    ('current_a', np.float32, 2),
+    ('power_factor', np.float32, 2),
+    ('frequency_hz', np.float32, 1),
+)
+
+# Arrow schema of the readings shards; batches are assembled directly against it
+READINGS_SCHEMA = pa.schema(
+    [('meter_number', pa.string()), ('timestamp', pa.timestamp('s'))]
+    + [(name, pa.from_numpy_dtype(dtype)) for name, dtype, _ in READING_COLUMNS]
+    + [('status', pa.dictionary(pa.int8(), pa.string()))]
+)
+
+
+# Compiled lazily: an eager signature would start Numba's threading layer at
+# import, and worker processes forked from that parent deadlock. Each pool worker
+# compiles (or loads from the on-disk cache) in _init_pipeline_worker instead
+@njit(cache=True, fastmath=True, parallel=True)
+def _fill_readings_nb(reading_kwh, consumption_kwh, voltage, current, power_factor, frequency,
+                      base_load, prev_reading, interval_h, hours, draws):
+    """
+    Fill one month of readings into the typed columns and return the closing
+    register value. draws holds the pre-drawn randomness: row 0 uniform
+    [0, 1) for the hour-band load multiplier, rows 1-3 standard normal noise
+    for voltage, PF and frequency. Every reading is independent except the
+    register, so the element-wise pass runs across threads and only the
+    prefix sum over the float64 interval energy stays serial
+    """
+    n = hours.shape[0]
+    for i in prange(n):
+        h = hours[i]
+        # Simple pattern: higher during evening
+        if 18 <= h <= 23:
+            mult = 0.7 + 0.25 * draws[0, i]
+        elif 6 <= h <= 9:
+            mult = 0.5 + 0.2 * draws[0, i]
+        else:
+            mult = 0.2 + 0.3 * draws[0, i]
+        consumption = base_load * mult
+        
+        kwh = consumption * interval_h
+        reading_kwh[i] = kwh
+        consumption_kwh[i] = kwh
+        current[i] = consumption / 0.23
+        voltage[i] = 230.0 + 5.0 * draws[1, i]
+        power_factor[i] = 0.95 + 0.02 * draws[2, i]
+        frequency[i] = 50.0 + 0.1 * draws[3, i]
+    
+    # Running register carried across the month
+    total = prev_reading
+    for i in range(n):
+        total += reading_kwh[i]
+        reading_kwh[i] = total
+    return total
+
+
+def _fill_readings_np(reading_kwh, consumption_kwh, voltage, current, power_factor, frequency,
+                      base_load, prev_reading, interval_h, hours, draws):
+    """NumPy equivalent of _fill_readings_nb, used when Numba is not installed"""
+    lo = np.where((hours >= 18) & (hours <= 23), 0.7, np.where((hours >= 6) & (hours <= 9), 0.5, 0.2))
+    span = np.where((hours >= 18) & (hours <= 23), 0.25, np.where((hours >= 6) & (hours <= 9), 0.2, 0.3))
+    consumption = base_load * (lo + span * draws[0])
+    kwh = consumption * interval_h
+    np.cumsum(kwh, out=reading_kwh)
+    reading_kwh += prev_reading
+    consumption_kwh[:] = kwh
+    np.divide(consumption, 0.23, out=current, casting='unsafe')
+    np.multiply(draws[1], 5.0, out=voltage, casting='unsafe')
+    voltage += 230.0
+    np.multiply(draws[2], 0.02, out=power_factor, casting='unsafe')
+    power_factor += 0.95
+    np.multiply(draws[3], 0.1, out=frequency, casting='unsafe')
+    frequency += 50.0
+    return reading_kwh[-1] if len(reading_kwh) else prev_reading
+
+
+_fill_readings = _fill_readings_nb if NUMBA_AVAILABLE else _fill_readings_np
+
+# Per-process shard files, merged into the bronze CSVs at the end of a run
+SHARD_PATTERNS = {
+    'readings': 'readings_*.parquet',
+    'bills': 'bills_*.csv',
+    'payments': 'payments_*.csv',
+}
+
 
 class IESCOParallelPipelineGenerator:
     """
     Parallel pipeline generator that processes each meter through complete lifecycle
     """
     
-    def __init__(self, base_simulator=None):
+    def __init__(self, base_simulator=None, seed: int = 42):
         """Initialize with base simulator for reusing v1.5 logic"""
+        # A caller-supplied base is handed to every pool worker as well, so
+        # output does not depend on the worker count
+        self._custom_base = base_simulator
         if base_simulator:
             self.base = base_simulator
         else:
@@ -71,11 +184,22 @@ class IESCOParallelPipelineGenerator:
                 print("⚠️  Running in minimal mode without v1.5 features")
                 self.base = None
         
-        # Thread-safe data structures
-        self.lock = threading.Lock()
-        self.readings_buffer = []
-        self.bills_buffer = []
-        self.payments_buffer = []
+        # Resolve the optional base-simulator hooks once instead of per month/bill
+        self._gen_consumption = getattr(self.base, 'generate_consumption_patterns', None)
+        self._calc_bill = getattr(self.base, 'calculate_bill_amount', None)
+        
+        # Every meter draws from its own PCG64 streams derived from (seed, meter_id),
+        # so output does not depend on which worker process handles the meter
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+        
+        # Open Parquet shard writers, keyed by path (one per worker process),
+        # and the CSV shards this process has already written a header to
+        self._writers = {}
+        self._csv_headers_written = set()
+        
+        # Month-sized scratch buffers (typed columns, random draws), reused across months
+        self._buffers = None
         self.progress_stats = {
             'meters_completed': 0,
             'readings_generated': 0,
@@ -83,69 +207,82 @@ class IESCOParallelPipelineGenerator:
             'payments_generated': 0
         }
         
+    @staticmethod
+    def build_month_schedule(start_date: str, end_date: str) -> List[Tuple[datetime, datetime, Tuple[str, ...]]]:
+        """
+        Month boundaries for the date range, shared by all meters, as
+        (month_start, month_end, labels) where labels are the preformatted bill
+        strings (billing_month, bill id suffix, issue_date, due_date)
+        """
+        current_date = datetime.strptime(start_date, '%Y-%m-%d')
+        end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+        
+        schedule = []
+        while current_date <= end_dt:
+            month_end = current_date + relativedelta(months=1) - timedelta(days=1)
+            labels = (
+                current_date.strftime('%Y-%m'),
+                current_date.strftime('%Y%m'),
+                (current_date + relativedelta(months=1, days=5)).strftime('%Y-%m-%d'),
+                (current_date + relativedelta(months=1, days=15)).strftime('%Y-%m-%d'),
+            )
+            # Ensure we don't go past end_date
+            schedule.append((current_date, min(month_end, end_dt), labels))
+            current_date += relativedelta(months=1)
+        return schedule
+    
     def process_single_meter_pipeline(self, meter_data: Dict, transformers_df: pd.DataFrame,
-                                     start_date: str, end_date: str, 
+                                     month_schedule: List[Tuple[datetime, datetime, Tuple[str, ...]]],
                                      frequency_minutes: int = 15,
                                      output_dir: str = './iesco_parallel_data') -> Dict:
         """
         Complete pipeline for ONE meter: readings → bills → payments
-        Processes month by month sequentially for this meter
+        Processes month by month sequentially for this meter (see build_month_schedule);
+        each month's readings are flushed to disk as soon as they are generated, so
+        results only carries the reading count plus the small bill/payment tables
         """
         meter_id = meter_data['meter_id']
         results = {
             'meter_id': meter_id,
-            'readings': [],
+            'readings': 0,
             'bills': [],
             'payments': [],
             'status': 'processing'
         }
         
         try:
-            # Parse dates
-            current_date = datetime.strptime(start_date, '%Y-%m-%d')
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+            # One independent random stream per month plus one for payments
+            streams = self._meter_streams(meter_id, len(month_schedule) + 1)
             
             # Process month by month
-            while current_date <= end_dt:
-                month_start = current_date
-                month_end = month_start + relativedelta(months=1) - timedelta(days=1)
-                
-                # Ensure we don't go past end_date
-                if month_end > end_dt:
-                    month_end = end_dt
-                
+            for (month_start, month_end, month_labels), rng in zip(month_schedule, streams):
                 # STEP 1: Generate readings for this month
                 month_readings = self._generate_month_readings(
-                    meter_data, transformers_df, month_start, month_end, frequency_minutes
+                    meter_data, transformers_df, month_start, month_end, frequency_minutes, rng
                 )
-                results['readings'].extend(month_readings)
+                n_readings = len(month_readings['timestamp'])
+                self._write_readings(meter_id, month_readings, output_dir)
+                results['readings'] += n_readings
                 
                 # STEP 2: Calculate bill for this month (immediately after readings)
-                if month_readings:
+                if n_readings:
                     month_bill = self._calculate_month_bill(
-                        meter_data, month_readings, month_start
+                        meter_data, month_readings, month_labels
                     )
                     results['bills'].append(month_bill)
-                    
-                    # STEP 3: Generate payment for this bill (immediately after bill)
-                    payment = self._generate_payment(meter_data, month_bill)
-                    results['payments'].append(payment)
-                
-                # Move to next month
-                current_date = month_start + relativedelta(months=1)
+            
+            # STEP 3: Generate payments for all of this meter's bills in one batch
+            if results['bills']:
+                results['bills'] = pd.DataFrame(results['bills'])
+                results['payments'] = self._generate_payments_batch(
+                    meter_data, results['bills'], streams[-1]
+                )
             
             results['status'] = 'completed'
             
-            # Write to disk immediately (thread-safe)
+            # Write bills and payments to this process's shard files
             self._write_meter_data_to_disk(results, output_dir)
             
-            # Update progress
-            with self.lock:
-                self.progress_stats['meters_completed'] += 1
-                self.progress_stats['readings_generated'] += len(results['readings'])
-                self.progress_stats['bills_generated'] += len(results['bills'])
-                self.progress_stats['payments_generated'] += len(results['payments'])
-            
         except Exception as e:
             results['status'] = 'failed'
             results['error'] = str(e)
@@ -153,78 +290,95 @@ class IESCOParallelPipelineGenerator:
         
         return results
     
+    def _meter_streams(self, meter_id, count: int) -> List[np.random.Generator]:
+        """Independent, reproducible Generators for one meter (stable across processes)"""
+        meter_key = zlib.crc32(str(meter_id).encode())
+        return [np.random.default_rng(child)
+                for child in np.random.SeedSequence([self.seed, meter_key]).spawn(count)]
+    
     def _generate_month_readings(self, meter_data: Dict, transformers_df: pd.DataFrame,
                                 month_start: datetime, month_end: datetime,
-                                frequency_minutes: int) -> List[Dict]:
-        """Generate readings for one meter for one month"""
-        readings = []
-        
-        # Generate timestamps for this month
-        current_time = month_start
-        while current_time <= month_end:
-            # Generate single reading
-            reading = self._generate_single_reading(meter_data, transformers_df, current_time)
-            readings.append(reading)
-            
-            # Move to next interval
-            current_time += timedelta(minutes=frequency_minutes)
-        
-        return readings
-    
-    def _generate_single_reading(self, meter_data: Dict, transformers_df: pd.DataFrame,
-                                timestamp: datetime) -> Dict:
-        """Generate a single reading for a meter at specific timestamp"""
+                                frequency_minutes: int,
+                                rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+        """Generate readings for one meter for one month as typed numpy columns"""
+        n = int((month_end - month_start).total_seconds() // (frequency_minutes * 60)) + 1
+        ts = pd.date_range(month_start, periods=n, freq=f'{frequency_minutes}min')
+        rng = rng if rng is not None else self._rng
+        
+        # Fill this process's reused typed columns and draws in place
+        cols, draws, status = self._month_buffers(n)
+        rng.random(out=draws[0])
+        for row in draws[1:]:
+            rng.standard_normal(out=row)
+        prev_reading = float(meter_data.get('last_reading', 0))
         
         # Use base simulator if available
-        if self.base and hasattr(self.base, 'generate_consumption_patterns'):
-            consumption = self.base.generate_consumption_patterns(
-                meter_data.get('consumer_type', 'RESIDENTIAL_GENERAL'),
-                timestamp
+        if self._gen_consumption is not None:
+            consumer_type = meter_data.get('consumer_type', 'RESIDENTIAL_GENERAL')
+            gen_consumption = self._gen_consumption
+            consumption = np.fromiter(
+                (gen_consumption(consumer_type, t) for t in ts),
+                dtype=np.float64, count=n
             )
+            consumption *= frequency_minutes / 60
+            np.cumsum(consumption, out=cols['reading_kwh'])
+            cols['reading_kwh'] += prev_reading
+            cols['consumption_kwh'][:] = consumption
+            np.divide(consumption, 0.23 * frequency_minutes / 60, out=cols['current_a'], casting='unsafe')
+            for name, mean, std, noise in (('voltage_v', 230, 5, draws[1]),
+                                           ('power_factor', 0.95, 0.02, draws[2]),
+                                           ('frequency_hz', 50, 0.1, draws[3])):
+                np.multiply(noise, std, out=cols[name], casting='unsafe')
+                cols[name] += mean
+            last_reading = cols['reading_kwh'][-1]
         else:
-            # Simple fallback
-            base_load = meter_data.get('sanctioned_load_kw', 5)
-            hour = timestamp.hour
-            # Simple pattern: higher during evening
-            if 18 <= hour <= 23:
-                consumption = base_load * random.uniform(0.7, 0.95)
-            elif 6 <= hour <= 9:
-                consumption = base_load * random.uniform(0.5, 0.7)
-            else:
-                consumption = base_load * random.uniform(0.2, 0.5)
-        
-        # Calculate cumulative
-        prev_reading = meter_data.get('last_reading', 0)
-        current_reading = prev_reading + (consumption * (15/60))  # 15-min interval
-        meter_data['last_reading'] = current_reading
-        
-        reading = {
-            'meter_number': meter_data['meter_id'],  # Use meter_number to match meters table
-            'timestamp': timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-            'reading_kwh': round(current_reading, 2),
-            'consumption_kwh': round(consumption * (15/60), 3),
-            'voltage_v': round(random.gauss(230, 5), 1),
-            'current_a': round(consumption / 0.23, 2),
-            'power_factor': round(random.gauss(0.95, 0.02), 2),
-            'frequency_hz': round(random.gauss(50, 0.1), 1),
-            'status': 'normal'
-        }
+            # Simple fallback: hour-band load pattern filled by the compiled kernel
+            last_reading = _fill_readings(
+                *(cols[name] for name, _, _ in READING_COLUMNS),
+                float(meter_data.get('sanctioned_load_kw', 5)),
+                prev_reading,
+                frequency_minutes / 60,
+                ts.hour.to_numpy(dtype=np.int32, copy=True),  # writable, contiguous
+                draws
+            )
+        meter_data['last_reading'] = float(last_reading)
+        
+        for name, _, decimals in READING_COLUMNS:
+            np.round(cols[name], decimals, out=cols[name])
         
-        return reading
+        cols['timestamp'] = ts.values.astype('datetime64[s]')
+        cols['status'] = status
+        return cols
+    
+    def _month_buffers(self, n: int) -> Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray]:
+        """
+        Views of length n into this process's scratch buffers: the typed reading
+        columns, the (4, n) random draws and the all-'normal' status codes.
+        Buffers grow to the longest month seen and are reused afterwards; the
+        views are only valid until the next month is generated
+        """
+        if self._buffers is None or self._buffers[2].shape[0] < n:
+            self._buffers = (
+                {name: np.empty(n, dtype=dtype) for name, dtype, _ in READING_COLUMNS},
+                np.empty((4, n)),
+                np.zeros(n, dtype=np.int8),
+            )
+        columns, draws, status = self._buffers
+        return {name: col[:n] for name, col in columns.items()}, draws[:, :n], status[:n]
     
-    def _calculate_month_bill(self, meter_data: Dict, month_readings: List[Dict],
-                             billing_month: datetime) -> Dict:
-        """Calculate bill for one meter for one month"""
+    def _calculate_month_bill(self, meter_data: Dict, month_readings: Dict[str, np.ndarray],
+                             month_labels: Tuple[str, ...]) -> Dict:
+        """Calculate bill for one meter for one month (labels from build_month_schedule)"""
         
-        if not month_readings:
+        if not len(month_readings['timestamp']):
             return None
         
         # Calculate total consumption
-        total_consumption = sum(r['consumption_kwh'] for r in month_readings)
+        total_consumption = float(month_readings['consumption_kwh'].sum())
         
         # Use base simulator billing if available
-        if self.base and hasattr(self.base, 'calculate_bill_amount'):
-            bill_amount, breakdown = self.base.calculate_bill_amount(
+        if self._calc_bill is not None:
+            bill_amount, breakdown = self._calc_bill(
                 total_consumption,
                 meter_data.get('tariff_category', 'A-1a'),
                 meter_data.get('consumer_type', 'RESIDENTIAL_GENERAL')
@@ -234,15 +388,16 @@ class IESCOParallelPipelineGenerator:
             bill_amount = self._simple_billing(total_consumption, meter_data.get('consumer_type'))
             breakdown = {'energy_charges': bill_amount}
         
+        billing_month, bill_suffix, issue_date, due_date = month_labels
         bill = {
-            'bill_id': f"BILL-{meter_data['meter_id']}-{billing_month.strftime('%Y%m')}",
+            'bill_id': f"BILL-{meter_data['meter_id']}-{bill_suffix}",
             'meter_id': meter_data['meter_id'],
-            'billing_month': billing_month.strftime('%Y-%m'),
-            'issue_date': (billing_month + relativedelta(months=1, days=5)).strftime('%Y-%m-%d'),
-            'due_date': (billing_month + relativedelta(months=1, days=15)).strftime('%Y-%m-%d'),
-            'reading_date': month_readings[-1]['timestamp'][:10],
-            'previous_reading': month_readings[0]['reading_kwh'],
-            'current_reading': month_readings[-1]['reading_kwh'],
+            'billing_month': billing_month,
+            'issue_date': issue_date,
+            'due_date': due_date,
+            'reading_date': np.datetime_as_string(month_readings['timestamp'][-1], unit='D'),
+            'previous_reading': float(month_readings['reading_kwh'][0]),
+            'current_reading': float(month_readings['reading_kwh'][-1]),
             'consumption_kwh': round(total_consumption, 2),
             'bill_amount': round(bill_amount, 2),
             'status': 'issued'
@@ -250,107 +405,189 @@ class IESCOParallelPipelineGenerator:
         
         return bill
     
-    def _simple_billing(self, consumption_kwh: float, consumer_type: str) -> float:
-        """Simple billing calculation fallback"""
-        # Basic slab rates (simplified)
-        if consumption_kwh <= 50:
-            return consumption_kwh * 2.0
-        elif consumption_kwh <= 100:
-            return 50 * 2.0 + (consumption_kwh - 50) * 5.0
-        elif consumption_kwh <= 200:
-            return 50 * 2.0 + 50 * 5.0 + (consumption_kwh - 100) * 10.0
-        else:
-            return 50 * 2.0 + 50 * 5.0 + 100 * 10.0 + (consumption_kwh - 200) * 15.0
+    def _simple_billing(self, consumption_kwh, consumer_type: str):
+        """Simple billing calculation fallback (scalar or array of consumptions)"""
+        # Find the slab, then bill = amount up to that slab + units into it at its rate
+        consumption_kwh = np.asarray(consumption_kwh, dtype=np.float64)
+        idx = np.maximum(np.searchsorted(SLAB_BREAKS, consumption_kwh, side='right') - 1, 0)
+        return SLAB_CUM[idx] + (consumption_kwh - SLAB_BREAKS[idx]) * SLAB_RATES[idx]
     
-    def _generate_payment(self, meter_data: Dict, bill: Dict) -> Dict:
-        """Generate payment for a bill (may be unpaid)"""
-        
-        if not bill:
-            return None
-        
-        # Payment probability based on consumer type and amount
+    def _generate_payments_batch(self, meter_data: Dict, bills: pd.DataFrame,
+                                 rng: Optional[np.random.Generator] = None) -> pd.DataFrame:
+        """Generate payments for a batch of bills (some may be unpaid)"""
+        n = len(bills)
+        rng = rng if rng is not None else self._rng
+        bill_amount = bills['bill_amount'].to_numpy(dtype=np.float64)
+        
+        # Payment probability based on consumer type and amount:
+        # higher bills have slightly lower payment rate,
+        # government/protected consumers pay more reliably
         consumer_type = meter_data.get('consumer_type', 'RESIDENTIAL_GENERAL')
-        bill_amount = bill['bill_amount']
-        
-        # Higher bills have slightly lower payment rate
-        if bill_amount > 10000:
-            payment_prob = 0.75
-        elif bill_amount > 5000:
-            payment_prob = 0.85
-        else:
-            payment_prob = 0.92
-        
-        # Government/protected consumers pay more reliably
         if 'GOVT' in consumer_type or 'PROTECTED' in consumer_type:
-            payment_prob = 0.98
-        
-        is_paid = random.random() < payment_prob
-        
-        if is_paid:
-            # Payment made within 0-20 days after issue
-            issue_date = datetime.strptime(bill['issue_date'], '%Y-%m-%d')
-            payment_delay = random.randint(0, 20)
-            payment_date = issue_date + timedelta(days=payment_delay)
-            
-            # Partial or full payment
-            if random.random() < 0.95:
-                amount_paid = bill_amount
-                status = 'paid'
-            else:
-                amount_paid = round(bill_amount * random.uniform(0.5, 0.9), 2)
-                status = 'partial'
+            payment_prob = np.full(n, 0.98)
         else:
-            payment_date = None
-            amount_paid = 0
-            status = 'unpaid'
-        
-        payment = {
-            'payment_id': f"PAY-{bill['bill_id']}",
-            'bill_id': bill['bill_id'],
-            'meter_id': bill['meter_id'],
+            payment_prob = np.where(bill_amount > 10000, 0.75,
+                           np.where(bill_amount > 5000, 0.85, 0.92))
+        
+        is_paid = rng.random(n) < payment_prob
+        # Payment made within 0-20 days after issue; 5% of payments are partial
+        payment_delay = rng.integers(0, 21, n)
+        is_partial = is_paid & (rng.random(n) >= 0.95)
+        partial_amount = np.round(bill_amount * rng.uniform(0.5, 0.9, n), 2)
+        method = rng.choice(PAYMENT_METHODS, n)
+        
+        payment_date = pd.to_datetime(bills['issue_date']) + pd.to_timedelta(payment_delay, unit='D')
+        
+        return pd.DataFrame({
+            'payment_id': 'PAY-' + bills['bill_id'],
+            'bill_id': bills['bill_id'],
+            'meter_id': bills['meter_id'],
             'bill_amount': bill_amount,
-            'amount_paid': amount_paid,
-            'payment_date': payment_date.strftime('%Y-%m-%d') if payment_date else None,
-            'payment_method': random.choice(['online', 'bank', 'cash', 'mobile_app']) if is_paid else None,
-            'status': status
-        }
-        
-        return payment
+            'amount_paid': np.where(is_partial, partial_amount, np.where(is_paid, bill_amount, 0.0)),
+            'payment_date': payment_date.dt.strftime('%Y-%m-%d').where(is_paid, None),
+            'payment_method': np.where(is_paid, method, None),
+            'status': np.where(is_partial, 'partial', np.where(is_paid, 'paid', 'unpaid'))
+        })
+    
+    def _write_readings(self, meter_id, month_readings: Dict[str, np.ndarray], output_dir: str):
+        """Stream one month of readings into this worker process's Parquet shard"""
+        n = len(month_readings['timestamp'])
+        if not n:
+            return
+        # Build the record batch straight from the typed columns (no pandas inference)
+        batch = pa.record_batch(
+            [pa.repeat(str(meter_id), n),  # Use meter_number to match meters table
+             pa.array(month_readings['timestamp'])]
+            + [pa.array(month_readings[name]) for name, _, _ in READING_COLUMNS]
+            + [pa.DictionaryArray.from_arrays(month_readings['status'], READING_STATUS)],
+            schema=READINGS_SCHEMA
+        )
+        readings_file = os.path.join(output_dir, f'readings_{os.getpid()}.parquet')
+        if readings_file not in self._writers:
+            os.makedirs(output_dir, exist_ok=True)
+        self._get_writer(readings_file, READINGS_SCHEMA).write_batch(batch)
     
     def _write_meter_data_to_disk(self, results: Dict, output_dir: str):
-        """Write meter data to disk (thread-safe)"""
-        meter_id = results['meter_id']
+        """Append a meter's bills and payments to this worker process's shard files"""
+        shard = os.getpid()
         
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
-        with self.lock:
-            # Append readings
-            if results['readings']:
-                readings_file = os.path.join(output_dir, 'readings.csv')
-                df = pd.DataFrame(results['readings'])
-                if os.path.exists(readings_file):
-                    df.to_csv(readings_file, mode='a', header=False, index=False)
-                else:
-                    df.to_csv(readings_file, index=False)
-            
-            # Append bills
-            if results['bills']:
-                bills_file = os.path.join(output_dir, 'bills.csv')
-                df = pd.DataFrame(results['bills'])
-                if os.path.exists(bills_file):
-                    df.to_csv(bills_file, mode='a', header=False, index=False)
-                else:
-                    df.to_csv(bills_file, index=False)
-            
-            # Append payments
-            if results['payments']:
-                payments_file = os.path.join(output_dir, 'payments.csv')
-                df = pd.DataFrame(results['payments'])
-                if os.path.exists(payments_file):
-                    df.to_csv(payments_file, mode='a', header=False, index=False)
-                else:
-                    df.to_csv(payments_file, index=False)
+        # Append bills
+        if len(results['bills']):
+            self._append_csv(results['bills'], os.path.join(output_dir, f'bills_{shard}.csv'))
+        
+        # Append payments
+        if len(results['payments']):
+            self._append_csv(results['payments'], os.path.join(output_dir, f'payments_{shard}.csv'))
+    
+    def _append_csv(self, df: pd.DataFrame, path: str):
+        """Append to a CSV shard, writing the header only on this process's first write"""
+        if path in self._csv_headers_written:
+            df.to_csv(path, mode='a', header=False, index=False)
+        else:
+            df.to_csv(path, index=False)
+            self._csv_headers_written.add(path)
+    
+    def _get_writer(self, path: str, schema: pa.Schema) -> pq.ParquetWriter:
+        """Get or open the Parquet writer for a shard file"""
+        writer = self._writers.get(path)
+        if writer is None:
+            writer = pq.ParquetWriter(path, schema, compression='zstd', use_dictionary=True)
+            self._writers[path] = writer
+        return writer
+    
+    def close_writers(self):
+        """Close all open Parquet shard writers (writes the file footers)"""
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+    
+    @staticmethod
+    def _shard_files(output_dir: str, kind: str) -> List[str]:
+        """Shard files of one kind (readings/bills/payments) in output_dir"""
+        return sorted(glob.glob(os.path.join(output_dir, SHARD_PATTERNS[kind])))
+    
+    def _merge_shards(self, output_dir: str):
+        """
+        Combine the per-process shards into the Bronze files the Silver layer
+        reads (readings.csv, bills.csv, payments.csv), then remove the shards.
+        Readings are streamed one row group at a time; bill and payment CSV
+        shards are concatenated byte-wise, keeping the first header only
+        """
+        readings_shards = self._shard_files(output_dir, 'readings')
+        if readings_shards:
+            # Every shard is written from the same readings columns
+            schema = pq.read_schema(readings_shards[0]).remove_metadata()
+            with pa_csv.CSVWriter(os.path.join(output_dir, 'readings.csv'), schema) as writer:
+                for shard in readings_shards:
+                    parquet_file = pq.ParquetFile(shard)
+                    for i in range(parquet_file.num_row_groups):
+                        writer.write_table(parquet_file.read_row_group(i).cast(schema))
+        
+        merged = readings_shards
+        for kind in ('bills', 'payments'):
+            shards = self._shard_files(output_dir, kind)
+            if not shards:
+                continue
+            with open(os.path.join(output_dir, f'{kind}.csv'), 'wb') as out:
+                for i, shard in enumerate(shards):
+                    with open(shard, 'rb') as f:
+                        header = f.readline()
+                        if i == 0:
+                            out.write(header)
+                        shutil.copyfileobj(f, out)
+            merged = merged + shards
+        
+        for shard in merged:
+            os.remove(shard)
+    
+    def _record_meter_summaries(self, summaries: List[Dict], pbar: tqdm):
+        """Fold a batch of finished meters' counts into the progress stats"""
+        for summary in summaries:
+            if summary['status'] == 'completed':
+                self.progress_stats['meters_completed'] += 1
+                self.progress_stats['readings_generated'] += summary['readings']
+                self.progress_stats['bills_generated'] += summary['bills']
+                self.progress_stats['payments_generated'] += summary['payments']
+        pbar.update(len(summaries))
+        pbar.set_postfix({
+            'completed': self.progress_stats['meters_completed'],
+            'readings': self.progress_stats['readings_generated'],
+            'bills': self.progress_stats['bills_generated']
+        })
+    
+    def _report_progress(self, progress_queue: SimpleQueue, pbar: tqdm, done: threading.Event,
+                         batch_size: int = 64, poll_seconds: float = 0.1):
+        """Single reporter thread: drain per-meter summaries and update the bar once per batch"""
+        while True:
+            finished = done.is_set()
+            batch = []
+            while len(batch) < batch_size:
+                try:
+                    batch.append(progress_queue.get_nowait())
+                except Empty:
+                    break
+            if batch:
+                self._record_meter_summaries(batch, pbar)
+            elif finished:
+                return
+            else:
+                time.sleep(poll_seconds)
+    
+    def _check_base_picklable(self):
+        """
+        Pool workers are built on the caller's base simulator, so it has to
+        pickle; fail here rather than let workers run on a different base
+        """
+        if not self._custom_base:
+            return
+        try:
+            pickle.dumps(self._custom_base)
+        except Exception as e:
+            raise TypeError(f"base_simulator cannot be sent to pool workers ({e}); "
+                            f"pass a picklable base simulator or run with max_workers=1") from e
     
     def generate_parallel(self, num_meters: int = 100,
                          start_date: str = '2024-01-01',
@@ -367,7 +604,7 @@ class IESCOParallelPipelineGenerator:
             end_date: End date for data generation
             frequency_minutes: Reading interval in minutes
             output_dir: Output directory
-            max_workers: Number of parallel threads
+            max_workers: Number of worker processes (1 runs serially in-process)
         """
         
         print("="*80)
@@ -382,6 +619,10 @@ class IESCOParallelPipelineGenerator:
         print("="*80)
         
         os.makedirs(output_dir, exist_ok=True)
+        # Shards left behind by an interrupted run would be merged into this one
+        for kind in SHARD_PATTERNS:
+            for shard in self._shard_files(output_dir, kind):
+                os.remove(shard)
         
         # Step 1: Generate transformers (once)
         print("\n📊 Step 1: Generating transformers...")
@@ -406,7 +647,7 @@ class IESCOParallelPipelineGenerator:
             meters_df = pd.DataFrame({
                 'meter_id': [f'MTR-{i:06d}' for i in range(num_meters)],
                 'consumer_type': ['RESIDENTIAL_GENERAL'] * num_meters,
-                'sanctioned_load_kw': [random.uniform(2, 10) for _ in range(num_meters)],
+                'sanctioned_load_kw': self._rng.uniform(2, 10, num_meters),
                 'tariff_category': ['A-1a'] * num_meters
             })
         
@@ -422,46 +663,71 @@ class IESCOParallelPipelineGenerator:
         meters_list = meters_df.to_dict('records')
         
         # Normalize column names (v1.5 uses meter_number, v2.0 expects meter_id)
-        for meter in meters_list:
+        # and add the last_reading tracker in a single pass
+        for i, meter in enumerate(meters_list):
             if 'meter_number' in meter and 'meter_id' not in meter:
                 meter['meter_id'] = meter['meter_number']
             if 'meter_id' not in meter:
                 # Fallback: create meter_id from index
-                meter['meter_id'] = f"MTR-{meters_list.index(meter):06d}"
-        
-        # Add last_reading tracker
-        for meter in meters_list:
+                meter['meter_id'] = f"MTR-{i:06d}"
             meter['last_reading'] = 0
         
-        # Process with thread pool
+        # Process with a pool of worker processes (each has its own interpreter and GIL)
         start_time = time.time()
+        month_schedule = self.build_month_schedule(start_date, end_date)
+        # Shared, read-only inputs travel to each worker once via the initializer;
+        # tasks carry only the meter itself
+        context = (transformers_df, month_schedule, frequency_minutes, output_dir)
+        
+        # Meters report their counts through a queue drained by one reporter thread
+        progress_queue = SimpleQueue()
+        done = threading.Event()
+        pbar = tqdm(total=num_meters, desc="Processing meters", unit="meter")
+        reporter = threading.Thread(target=self._report_progress, args=(progress_queue, pbar, done),
+                                    daemon=True)
+        reporter.start()
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all meter processing tasks
-            futures = {
-                executor.submit(
-                    self.process_single_meter_pipeline,
-                    meter, transformers_df, start_date, end_date,
-                    frequency_minutes, output_dir
-                ): meter['meter_id']
-                for meter in meters_list
-            }
-            
-            # Progress bar
-            with tqdm(total=num_meters, desc="Processing meters", unit="meter") as pbar:
-                for future in as_completed(futures):
-                    meter_id = futures[future]
-                    try:
-                        result = future.result()
-                        pbar.update(1)
-                        pbar.set_postfix({
-                            'completed': self.progress_stats['meters_completed'],
-                            'readings': self.progress_stats['readings_generated'],
-                            'bills': self.progress_stats['bills_generated']
-                        })
-                    except Exception as e:
-                        print(f"\n❌ Error with meter {meter_id}: {e}")
-                        pbar.update(1)
+        try:
+            if max_workers <= 1:
+                for meter in meters_list:
+                    progress_queue.put(_summarize_meter_results(
+                        self.process_single_meter_pipeline(meter, *context)))
+            else:
+                self._check_base_picklable()
+                pending = dict(enumerate(meters_list))
+                try:
+                    with ProcessPoolExecutor(max_workers=max_workers,
+                                             initializer=_init_pipeline_worker,
+                                             initargs=(self.seed, self._custom_base, context)) as executor:
+                        futures = {
+                            executor.submit(_process_meter_task, meter): task_idx
+                            for task_idx, meter in pending.items()
+                        }
+                        for future in as_completed(futures):
+                            task_idx = futures[future]
+                            try:
+                                progress_queue.put(future.result())
+                            except (PicklingError, BrokenProcessPool, AttributeError):
+                                raise
+                            except Exception as e:
+                                print(f"\n❌ Error with meter {meters_list[task_idx]['meter_id']}: {e}")
+                                progress_queue.put({'status': 'failed'})
+                            del pending[task_idx]
+                except (PicklingError, BrokenProcessPool, AttributeError) as e:
+                    print(f"⚠️  Parallel meter processing unavailable ({e}); running serially")
+                    for meter in pending.values():
+                        progress_queue.put(_summarize_meter_results(
+                            self.process_single_meter_pipeline(meter, *context)))
+        finally:
+            done.set()
+            reporter.join()
+            pbar.close()
+            # Serial runs write through this instance's own writers
+            self.close_writers()
+        
+        # Step 4: Merge the per-process shards into the Bronze files
+        print(f"\n📦 Step 4: Merging worker shards into readings/bills/payments...")
+        self._merge_shards(output_dir)
         
         elapsed_time = time.time() - start_time
         
@@ -490,6 +756,57 @@ class IESCOParallelPipelineGenerator:
         }
 
 
+# Per-process pipeline generator and shared run inputs used by worker tasks
+_worker_pipeline = None
+_worker_context = None
+
+
+def _init_pipeline_worker(seed: int, base_simulator, context: Tuple):
+    """
+    Process-pool initializer: build the worker's generator once, on the
+    caller's base simulator if one was given (else the default v1.5 base), and
+    keep the shared (transformers_df, month_schedule, frequency_minutes, output_dir)
+    """
+    global _worker_pipeline, _worker_context
+    _worker_pipeline = IESCOParallelPipelineGenerator(base_simulator=base_simulator, seed=seed)
+    _worker_context = context
+    # Parallelism comes from the pool; keep each worker's kernels single-threaded
+    set_num_threads(1)
+    _warm_up_kernels()
+    # Pool workers skip atexit, so close the shard writers from a multiprocessing finalizer
+    mp_util.Finalize(_worker_pipeline, _worker_pipeline.close_writers, exitpriority=10)
+
+
+def _warm_up_kernels():
+    """
+    Compile the readings kernel before the first meter. draws is a (4, n) view
+    into the scratch buffer: contiguous for the longest month, strided for
+    shorter ones, so both layouts are compiled
+    """
+    cols = [np.zeros(2, dtype=dtype) for _, dtype, _ in READING_COLUMNS]
+    hours = np.zeros(2, dtype=np.int32)
+    for draws in (np.zeros((4, 2)), np.zeros((4, 3))[:, :2]):
+        _fill_readings(*cols, 1.0, 0.0, 0.25, hours, draws)
+
+
+def _summarize_meter_results(results: Dict) -> Dict:
+    """Reduce a meter's pipeline results to the counts sent back to the parent"""
+    return {
+        'meter_id': results['meter_id'],
+        'status': results['status'],
+        'readings': results['readings'],
+        'bills': len(results['bills']),
+        'payments': len(results['payments'])
+    }
+
+
+def _process_meter_task(meter: Dict) -> Dict:
+    """Process-pool entry point: run one meter's pipeline and return its counts"""
+    return _summarize_meter_results(
+        _worker_pipeline.process_single_meter_pipeline(meter, *_worker_context)
+    )
+
+
 def main():
     """Main entry point with interactive prompts"""
     print("\n" + "="*80)
@@ -511,7 +828,7 @@ def main():
     frequency = input("Reading interval in minutes [15]: ").strip()
     frequency = int(frequency) if frequency else 15
     
-    workers = input("Number of parallel workers [4]: ").strip()
+    workers = input("Number of worker processes [4]: ").strip()
     workers = int(workers) if workers else 4
     
     output_dir = input("Output directory [./iesco_parallel_data]: ").strip()
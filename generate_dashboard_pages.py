@@ -2,6 +2,8 @@
 Generate all dashboard page templates
 """
 import os
+from string import Template
+from concurrent.futures import ThreadPoolExecutor
 
 # Page definitions
 pages = {
@@ -37,10 +39,9 @@ pages = {
     ]
 }
 
-# Template for each page
-def generate_page_template(filename, title, description, category):
-    return f'''"""
-{title}
+# Template for each page, parsed once and filled per page
+PAGE_TEMPLATE = Template('''"""
+${title}
 """
 import streamlit as st
 import pandas as pd
@@ -51,20 +52,18 @@ from pathlib import Path
 import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
-from utils.data_loader import load_all_gold_data
+from utils.data_loader import GOLD_PATH, load_table
 
-st.set_page_config(page_title="{title}", page_icon="📊", layout="wide")
+st.set_page_config(page_title="${title}", page_icon="📊", layout="wide")
 
-st.title("{title}")
-st.markdown("{description}")
+st.title("${title}")
+st.markdown("${description}")
 st.markdown("---")
 
-# Load data
-with st.spinner("Loading data..."):
-    data = load_all_gold_data()
-
-if data is None:
-    st.error("Failed to load data")
+# Load data: read only the Gold tables (and columns) this page renders, e.g.
+# readings = load_table('fact_readings', ['meter_key', 'date_key', 'energy_consumed_kwh'])
+if not GOLD_PATH.exists():
+    st.error(f"Gold Layer data not found at {GOLD_PATH}")
     st.stop()
 
 # Sidebar controls
@@ -106,7 +105,7 @@ st.markdown("---")
 st.subheader("🔍 Detailed Analysis")
 
 # Add your analysis here
-st.info("Analysis section - Implement specific logic for {title}")
+st.info("Analysis section - Implement specific logic for ${title}")
 
 # Data table
 st.subheader("📋 Data Table")
@@ -121,9 +120,22 @@ st.markdown("""
 - Recommendation 2
 - Recommendation 3
 """)
-'''
+''')
+
+
+def generate_page_template(filename, title, description, category):
+    return PAGE_TEMPLATE.substitute(title=title, description=description)
+
 
-# Generate all pages
+def write_page(filepath, content):
+    """Write one page file (run on the I/O thread pool)"""
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return filepath
+
+
+# Render all pages, then write the new files concurrently
+to_write = []
 for category, page_list in pages.items():
     category_path = f"pages/{category}"
     os.makedirs(category_path, exist_ok=True)
@@ -136,11 +148,10 @@ for category, page_list in pages.items():
             print(f"Skipping {filepath} (already exists)")
             continue
         
-        content = generate_page_template(filename, title, description, category)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
+        to_write.append((filepath, generate_page_template(filename, title, description, category)))
+
+with ThreadPoolExecutor(max_workers=8) as executor:
+    for filepath in executor.map(lambda page: write_page(*page), to_write):
         print(f"Created: {filepath}")
 
 print("\n✅ All page templates generated!")
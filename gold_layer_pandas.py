@@ -7,10 +7,18 @@ No Spark required - uses Pandas
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import os
 import json
+import calendar
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+# Numba is optional: AGG_MONTHLY falls back to the NumPy kernel
+from numba_compat import njit, prange, NUMBA_AVAILABLE
+
 print("="*80)
 print("IESCO GOLD LAYER PROCESSING - Star Schema (Pandas)")
 print("="*80)
@@ -22,23 +30,213 @@ SILVER_PATH = "./iesco_silver_data"
 GOLD_PATH = "./iesco_gold_data"
 os.makedirs(GOLD_PATH, exist_ok=True)
 
+# Silver columns referenced downstream; everything else is left on disk
+METERS_COLUMNS = [
+    'meter_number', 'consumer_id', 'consumer_type', 'tariff_category',
+    'consumer_category', 'phase_type', 'meter_type', 'sanctioned_load_kw',
+    'connected_load_kw', 'has_solar', 'solar_capacity_kw',
+    'district', 'division', 'sub_division', 'installation_date', 'status'
+]
+BILLS_COLUMNS = [
+    'bill_id', 'meter_id', 'billing_month', 'issue_date', 'due_date', 'reading_date',
+    'consumption_kwh', 'bill_amount', 'previous_reading', 'current_reading', 'status'
+]
+PAYMENTS_COLUMNS = [
+    'payment_id', 'bill_id', 'payment_date', 'bill_amount',
+    'amount_paid', 'payment_method', 'status'
+]
+
+# Readings columns that feed FACT_READINGS (optional ones are skipped if absent)
+READINGS_COLUMNS = [
+    'meter_number', 'timestamp', 'reading_kwh', 'consumption_kwh', 'energy_consumed_kwh',
+    'voltage_v', 'current_a', 'power_factor', 'frequency_hz', 'is_anomaly',
+    'is_peak_hour', 'data_quality_flag'
+]
+
+
+def date_key(ts, monthly=False):
+    """int32 YYYYMMDD (or YYYYMM) keys from a datetime Series, without strftime.
+
+    NaT rows come back as <NA> in a nullable Int32 result.
+    """
+    days = ts.to_numpy(dtype='datetime64[D]')
+    months = days.astype('datetime64[M]')
+    year = months.astype('datetime64[Y]').astype(np.int64) + 1970
+    month = months.astype(np.int64) % 12 + 1
+    if monthly:
+        key = year * 100 + month
+    else:
+        key = year * 10000 + month * 100 + (days - months).astype(np.int64) + 1
+    key = key.astype(np.int32)
+    missing = np.isnat(days)
+    if missing.any():
+        return pd.Series(pd.arrays.IntegerArray(key, missing), index=ts.index)
+    return pd.Series(key, index=ts.index)
+
+
+@njit(cache=True, parallel=True)
+def _monthly_agg_nb(ids, energy, voltage, power_factor, ngroups):
+    """
+    Fused per-group reductions for AGG_MONTHLY over pre-factorized group ids.
+    Returns (stats, size): stats rows are energy sum/mean/max/min, mean voltage
+    and mean power factor (NaN-skipping like pandas), size counts every row.
+    Rows are bucketed by group with a counting sort, then groups run in
+    parallel, each one a single linear pass with every reduction fused
+    """
+    n = ids.shape[0]
+    size = np.zeros(ngroups, dtype=np.int64)
+    for i in range(n):
+        size[ids[i]] += 1
+    offsets = np.zeros(ngroups + 1, dtype=np.int64)
+    for g in range(ngroups):
+        offsets[g + 1] = offsets[g] + size[g]
+    fill = offsets[:-1].copy()
+    order = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        order[fill[ids[i]]] = i
+        fill[ids[i]] += 1
+
+    stats = np.full((6, ngroups), np.nan)
+    for g in prange(ngroups):
+        e_sum = 0.0
+        e_max = -np.inf
+        e_min = np.inf
+        e_n = 0
+        v_sum = 0.0
+        v_n = 0
+        pf_sum = 0.0
+        pf_n = 0
+        for k in range(offsets[g], offsets[g + 1]):
+            i = order[k]
+            e = energy[i]
+            if not np.isnan(e):
+                e_sum += e
+                e_n += 1
+                e_max = max(e_max, e)
+                e_min = min(e_min, e)
+            v = voltage[i]
+            if not np.isnan(v):
+                v_sum += v
+                v_n += 1
+            pf = power_factor[i]
+            if not np.isnan(pf):
+                pf_sum += pf
+                pf_n += 1
+        stats[0, g] = e_sum
+        if e_n > 0:
+            stats[1, g] = e_sum / e_n
+            stats[2, g] = e_max
+            stats[3, g] = e_min
+        if v_n > 0:
+            stats[4, g] = v_sum / v_n
+        if pf_n > 0:
+            stats[5, g] = pf_sum / pf_n
+    return stats, size
+
+
+def _monthly_agg_np(ids, energy, voltage, power_factor, ngroups):
+    """NumPy equivalent of _monthly_agg_nb, used when Numba is not installed"""
+    size = np.bincount(ids, minlength=ngroups)
+    stats = np.full((6, ngroups), np.nan)
+    valid = ~np.isnan(energy)
+    e_n = np.bincount(ids[valid], minlength=ngroups)
+    stats[0] = np.bincount(ids[valid], weights=energy[valid], minlength=ngroups)
+    has_e = e_n > 0
+    stats[1, has_e] = stats[0, has_e] / e_n[has_e]
+    e_max = np.full(ngroups, -np.inf)
+    e_min = np.full(ngroups, np.inf)
+    np.maximum.at(e_max, ids[valid], energy[valid])
+    np.minimum.at(e_min, ids[valid], energy[valid])
+    stats[2, has_e] = e_max[has_e]
+    stats[3, has_e] = e_min[has_e]
+    for row, values in ((4, voltage), (5, power_factor)):
+        valid = ~np.isnan(values)
+        n_valid = np.bincount(ids[valid], minlength=ngroups)
+        total = np.bincount(ids[valid], weights=values[valid], minlength=ngroups)
+        stats[row, n_valid > 0] = total[n_valid > 0] / n_valid[n_valid > 0]
+    return stats, size
+
+
+_monthly_agg = _monthly_agg_nb if NUMBA_AVAILABLE else _monthly_agg_np
+
+
+def arrow_dtype_mapper(arrow_type):
+    """Keep columns Arrow-backed, except dictionary columns (e.g. Silver's
+    data_quality_flag), which stay pandas categoricals: an ArrowDtype
+    dictionary lands in the written pandas metadata and cannot be read back"""
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def check_readable(path):
+    """Read the first row group back through pandas, which rebuilds every
+    column dtype from the file's pandas metadata the way pd.read_parquet does"""
+    parquet_file = pq.ParquetFile(path)
+    if parquet_file.num_row_groups:
+        parquet_file.read_row_group(0).to_pandas()
+
+
+# Parquet encoding/compression releases the GIL, so outputs are written on a
+# small thread pool while the next table is being built
+parquet_writer = ThreadPoolExecutor(max_workers=8)
+pending_writes = []
+
+
+def write_fact_parquet(df, path, dictionary_columns, chunk_rows=1_000_000):
+    """Write a fact table in row-group sized chunks (zstd, column statistics on).
+
+    Each chunk is converted to Arrow on its own, so peak memory stays around
+    one row group instead of a full second copy of the table. Chunks go through
+    Table.from_pandas because ArrowDtype columns read from a filtered scan are
+    backed by multi-chunk arrays, which RecordBatch.from_pandas rejects.
+    """
+    schema = pa.Schema.from_pandas(df.iloc[:chunk_rows], preserve_index=False)
+    with pq.ParquetWriter(path, schema, compression='zstd',
+                          use_dictionary=dictionary_columns, write_statistics=True) as writer:
+        for start in range(0, len(df), chunk_rows):
+            chunk = df.iloc[start:start + chunk_rows]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def write_parquet(df, path, dictionary_columns=None):
+    """
+    Queue a DataFrame write on the writer pool. Fact tables (dictionary_columns
+    given) go through the chunked writer. The shallow snapshot keeps column
+    edits made after queueing out of the file
+    """
+    snapshot = df.copy(deep=False)
+    if dictionary_columns is None:
+        future = parquet_writer.submit(snapshot.to_parquet, path, index=False, compression='zstd')
+    else:
+        future = parquet_writer.submit(write_fact_parquet, snapshot, path, dictionary_columns)
+    pending_writes.append(future)
+
+
 print("="*80)
 print("STEP 1: LOAD SILVER LAYER")
 print("="*80)
 
 try:
     print("\nLoading Silver Layer (Parquet)...")
-    meters_silver = pd.read_parquet(f"{SILVER_PATH}/meters.parquet")
+    meters_silver = pd.read_parquet(f"{SILVER_PATH}/meters.parquet", columns=METERS_COLUMNS, engine='pyarrow')
     print(f"   [OK] Meters: {len(meters_silver):,}")
     
     print("   Loading readings (large file)...")
-    readings_silver = pd.read_parquet(f"{SILVER_PATH}/readings.parquet")
-    print(f"   [OK] Readings: {len(readings_silver):,}")
+    # Anomalies never reach FACT_READINGS, so let the parquet reader skip them
+    readings_path = f"{SILVER_PATH}/readings.parquet"
+    readings_schema = pq.read_schema(readings_path)
+    readings_silver = pq.read_table(
+        readings_path,
+        columns=[c for c in READINGS_COLUMNS if c in readings_schema.names],
+        filters=[('is_anomaly', '==', False)]
+    ).to_pandas(types_mapper=arrow_dtype_mapper)
+    print(f"   [OK] Readings: {len(readings_silver):,} (clean)")
     
-    bills_silver = pd.read_parquet(f"{SILVER_PATH}/bills.parquet")
+    bills_silver = pd.read_parquet(f"{SILVER_PATH}/bills.parquet", columns=BILLS_COLUMNS, engine='pyarrow')
     print(f"   [OK] Bills: {len(bills_silver):,}")
     
-    payments_silver = pd.read_parquet(f"{SILVER_PATH}/payments.parquet")
+    payments_silver = pd.read_parquet(f"{SILVER_PATH}/payments.parquet", columns=PAYMENTS_COLUMNS, engine='pyarrow')
     print(f"   [OK] Payments: {len(payments_silver):,}")
     
 except Exception as e:
@@ -51,62 +249,68 @@ print("="*80)
 
 # DIM_METER
 print("\n1. Creating DIM_METER...")
-dim_meter = meters_silver[[
-    'meter_number', 'consumer_id', 'consumer_type', 'tariff_category',
-    'consumer_category', 'phase_type', 'meter_type', 'sanctioned_load_kw',
-    'connected_load_kw', 'has_solar', 'solar_capacity_kw',
-    'district', 'division', 'sub_division', 'installation_date', 'status'
-]].copy()
-dim_meter['meter_key'] = dim_meter['meter_number']
-dim_meter['dim_created_at'] = datetime.now()
-dim_meter.to_parquet(f"{GOLD_PATH}/dim_meter.parquet", index=False)
+# meters_silver is already projected to METERS_COLUMNS; assign() shares those
+# columns instead of copying them
+dim_meter = meters_silver.assign(
+    meter_key=meters_silver['meter_number'],
+    dim_created_at=pd.Timestamp.now()
+)
+write_parquet(dim_meter, f"{GOLD_PATH}/dim_meter.parquet")
 print(f"   [OK] DIM_METER: {len(dim_meter):,} records")
 
 # DIM_DATE
 print("\n2. Creating DIM_DATE...")
-readings_silver['timestamp'] = pd.to_datetime(readings_silver['timestamp'])
-min_date = readings_silver['timestamp'].min().date()
-max_date = readings_silver['timestamp'].max().date()
+# DIM_DATE spans every reading, anomalies included
+reading_bounds = pc.min_max(pq.read_table(readings_path, columns=['timestamp']).column('timestamp'))
+min_date = pd.Timestamp(reading_bounds['min'].as_py()).date()
+max_date = pd.Timestamp(reading_bounds['max'].as_py()).date()
 date_range = pd.date_range(start=min_date, end=max_date, freq='D')
 
+y = date_range.year.values
+m = date_range.month.values
+d = date_range.day.values
+dow = date_range.dayofweek.values
+# ISO week: the week belongs to the year of its Thursday, numbered from that
+# year's first Thursday
+days = date_range.values.astype('datetime64[D]')
+thursday = days + (3 - dow).astype('timedelta64[D]')
+iso_week = ((thursday - thursday.astype('datetime64[Y]')).astype(np.int64) // 7 + 1).astype(np.int32)
+
 dim_date = pd.DataFrame({
     'date': date_range,
-    'date_key': date_range.strftime('%Y%m%d').astype(int),
-    'year': date_range.year,
-    'month': date_range.month,
-    'day': date_range.day,
-    'day_of_week': date_range.dayofweek + 1,
-    'day_of_year': date_range.dayofyear,
-    'week_of_year': date_range.isocalendar().week,
-    'quarter': date_range.quarter,
-    'month_name': date_range.strftime('%B'),
-    'day_name': date_range.strftime('%A'),
-    'is_weekend': date_range.dayofweek.isin([5, 6]),
-    'season': date_range.month.map({
-        12: 'Winter', 1: 'Winter', 2: 'Winter',
-        3: 'Spring', 4: 'Spring', 5: 'Spring',
-        6: 'Summer', 7: 'Summer', 8: 'Summer',
-        9: 'Fall', 10: 'Fall', 11: 'Fall'
-    })
+    'date_key': (y * 10000 + m * 100 + d).astype(np.int32),
+    'year': y,
+    'month': m,
+    'day': d,
+    'day_of_week': dow + 1,
+    'day_of_year': date_range.dayofyear.values,
+    'week_of_year': iso_week,
+    'quarter': (m - 1) // 3 + 1,
+    'month_name': pd.Categorical.from_codes(m - 1, categories=calendar.month_name[1:]),
+    'day_name': pd.Categorical.from_codes(dow, categories=list(calendar.day_name)),
+    'is_weekend': dow >= 5,
+    # Dec/Jan/Feb -> 0, Mar-May -> 1, Jun-Aug -> 2, Sep-Nov -> 3
+    'season': pd.Categorical.from_codes((m % 12) // 3, categories=['Winter', 'Spring', 'Summer', 'Fall'])
 })
-dim_date.to_parquet(f"{GOLD_PATH}/dim_date.parquet", index=False)
+write_parquet(dim_date, f"{GOLD_PATH}/dim_date.parquet")
 print(f"   [OK] DIM_DATE: {len(dim_date):,} records")
 
 # DIM_TIME
 print("\n3. Creating DIM_TIME...")
+hours = np.arange(24)
 dim_time = pd.DataFrame({
-    'hour': range(24),
-    'time_key': [h * 100 for h in range(24)],
-    'am_pm': ['AM' if h < 12 else 'PM' for h in range(24)],
-    'time_of_day': [
-        'Night' if h < 6 else 'Morning' if h < 12 else 
-        'Afternoon' if h < 18 else 'Evening' if h < 22 else 'Night'
-        for h in range(24)
-    ],
-    'is_peak_hour': [17 <= h <= 22 for h in range(24)],
-    'is_off_peak': [0 <= h <= 5 for h in range(24)]
+    'hour': hours,
+    'time_key': hours * 100,
+    'am_pm': np.where(hours < 12, 'AM', 'PM'),
+    'time_of_day': np.select(
+        [hours < 6, hours < 12, hours < 18, hours < 22],
+        ['Night', 'Morning', 'Afternoon', 'Evening'],
+        default='Night'
+    ),
+    'is_peak_hour': (hours >= 17) & (hours <= 22),
+    'is_off_peak': hours <= 5
 })
-dim_time.to_parquet(f"{GOLD_PATH}/dim_time.parquet", index=False)
+write_parquet(dim_time, f"{GOLD_PATH}/dim_time.parquet")
 print(f"   [OK] DIM_TIME: {len(dim_time):,} records")
 
 # DIM_CONSUMER_TYPE
@@ -115,20 +319,18 @@ dim_consumer_type = meters_silver[[
     'consumer_type', 'consumer_category', 'tariff_category'
 ]].drop_duplicates()
 dim_consumer_type['consumer_type_key'] = dim_consumer_type['consumer_type']
-dim_consumer_type.to_parquet(f"{GOLD_PATH}/dim_consumer_type.parquet", index=False)
+write_parquet(dim_consumer_type, f"{GOLD_PATH}/dim_consumer_type.parquet")
 print(f"   [OK] DIM_CONSUMER_TYPE: {len(dim_consumer_type):,} records")
 
 # DIM_LOCATION
 print("\n5. Creating DIM_LOCATION...")
 dim_location = meters_silver[[
     'district', 'division', 'sub_division'
-]].drop_duplicates()
-dim_location['location_key'] = (
-    dim_location['district'] + '-' + 
-    dim_location['division'] + '-' + 
-    dim_location['sub_division']
-)
-dim_location.to_parquet(f"{GOLD_PATH}/dim_location.parquet", index=False)
+]].drop_duplicates().sort_values(['district', 'division', 'sub_division']).reset_index(drop=True)
+# Rows are unique triples, so their sorted position is a stable surrogate key;
+# the table itself is the key -> (district, division, sub_division) mapping
+dim_location['location_key'] = np.arange(len(dim_location), dtype=np.int32)
+write_parquet(dim_location, f"{GOLD_PATH}/dim_location.parquet")
 print(f"   [OK] DIM_LOCATION: {len(dim_location):,} records")
 
 print("\n" + "="*80)
@@ -137,18 +339,20 @@ print("="*80)
 
 # FACT_READINGS
 print("\n1. Creating FACT_READINGS...")
-print("   Filtering clean readings...")
-fact_readings = readings_silver[readings_silver['is_anomaly'] == False].copy()
+fact_readings = readings_silver  # already filtered to clean readings at load time
 
 fact_readings['meter_key'] = fact_readings['meter_number']
-fact_readings['timestamp'] = pd.to_datetime(fact_readings['timestamp'], errors='coerce')
+# Silver stores timestamps as parquet timestamps; only parse if an older file has strings
+if not pd.api.types.is_datetime64_any_dtype(fact_readings['timestamp']):
+    fact_readings['timestamp'] = pd.to_datetime(fact_readings['timestamp'], errors='coerce')
 fact_readings = fact_readings.dropna(subset=['timestamp'])  # Remove rows with invalid timestamps
-fact_readings['date_key'] = fact_readings['timestamp'].dt.strftime('%Y%m%d').astype(int)
-fact_readings['time_key'] = fact_readings['timestamp'].dt.hour * 100
+reading_hours = fact_readings['timestamp'].dt.hour.to_numpy(dtype=np.int16)
+fact_readings['date_key'] = date_key(fact_readings['timestamp'])
+fact_readings['time_key'] = reading_hours * 100
 
 # Add is_peak_hour if not present
 if 'is_peak_hour' not in fact_readings.columns:
-    fact_readings['is_peak_hour'] = fact_readings['timestamp'].dt.hour.between(17, 22)
+    fact_readings['is_peak_hour'] = (reading_hours >= 17) & (reading_hours <= 22)
 
 # Rename consumption_kwh to energy_consumed_kwh for consistency
 if 'consumption_kwh' in fact_readings.columns and 'energy_consumed_kwh' not in fact_readings.columns:
@@ -165,26 +369,46 @@ fact_readings_final = fact_readings[[
     'timestamp', 'data_quality_flag'
 ]].copy()
 
-# Convert Arrow types to regular pandas types to avoid aggregation issues
-print("   Converting data types...")
-for col in fact_readings_final.columns:
-    if hasattr(fact_readings_final[col].dtype, 'pyarrow_dtype'):
-        fact_readings_final[col] = fact_readings_final[col].astype(str) if fact_readings_final[col].dtype == 'string' else fact_readings_final[col].to_numpy()
+# Columns stay Arrow-backed (zero-copy into the parquet writer); only the
+# telemetry the aggregates reduce over is materialized, as float32 NumPy.
+# This is the one numeric coercion pass: every aggregate below relies on it.
+# Meter telemetry needs nowhere near float64 precision; halving the width
+# halves the bytes every aggregate scan has to pull through memory.
+# reading_kwh is a cumulative register and keeps float64 so large meters
+# don't lose their 0.01 kWh resolution.
+for col in ['energy_consumed_kwh', 'voltage_v', 'current_a', 'power_factor', 'frequency_hz']:
+    fact_readings_final[col] = pd.to_numeric(fact_readings_final[col], errors='coerce').astype(np.float32)
+fact_readings_final['date_key'] = fact_readings_final['date_key'].astype(np.int32)
+fact_readings_final['time_key'] = fact_readings_final['time_key'].astype(np.int16)
+
+# meter_key is cast exactly once: categorical over the string meter numbers,
+# so the aggregates group on integer codes and the DIM_METER merges below
+# join on the same dtype. Categories come from the readings themselves so a
+# meter missing from DIM_METER still keeps its key here
+fact_readings_final['meter_key'] = fact_readings_final['meter_key'].astype(str).astype('category')
+meter_key_dtype = fact_readings_final['meter_key'].dtype
 
 print("   Saving (this may take a minute)...")
-fact_readings_final.to_parquet(f"{GOLD_PATH}/fact_readings.parquet", index=False)
+write_parquet(fact_readings_final, f"{GOLD_PATH}/fact_readings.parquet",
+              dictionary_columns=['meter_key', 'data_quality_flag'])
 print(f"   [OK] FACT_READINGS: {len(fact_readings_final):,} records")
 
 # FACT_BILLS
 print("\n2. Creating FACT_BILLS...")
 fact_bills = bills_silver.copy()
 fact_bills['bill_key'] = fact_bills['bill_id']
-fact_bills['meter_key'] = fact_bills['meter_id']
-fact_bills['billing_month_key'] = pd.to_datetime(fact_bills['billing_month']).dt.strftime('%Y%m').astype(int)
-fact_bills['issue_date_key'] = pd.to_datetime(fact_bills['issue_date']).dt.strftime('%Y%m%d').astype(int)
-fact_bills['due_date_key'] = pd.to_datetime(fact_bills['due_date']).dt.strftime('%Y%m%d').astype(int)
+# Bills and payments store meter_key categorical like FACT_READINGS, so the
+# dashboard joins DIM_METER onto every fact table by category codes
+fact_bills['meter_key'] = fact_bills['meter_id'].astype('category')
+fact_bills['billing_month_key'] = date_key(pd.to_datetime(fact_bills['billing_month']), monthly=True)
+fact_bills['issue_date_key'] = date_key(pd.to_datetime(fact_bills['issue_date']))
+fact_bills['due_date_key'] = date_key(pd.to_datetime(fact_bills['due_date']))
 fact_bills['reading_difference'] = fact_bills['current_reading'] - fact_bills['previous_reading']
-fact_bills['rate_per_kwh'] = fact_bills['bill_amount'] / fact_bills['consumption_kwh'].replace(0, np.nan)
+# Zero-consumption bills have no rate; divide only where the denominator is non-zero
+bill_amount = fact_bills['bill_amount'].to_numpy(dtype=np.float64)
+consumption = fact_bills['consumption_kwh'].to_numpy(dtype=np.float64)
+fact_bills['rate_per_kwh'] = np.divide(bill_amount, consumption, out=np.full_like(bill_amount, np.nan),
+                                       where=consumption != 0)
 
 fact_bills_final = fact_bills[[
     'bill_key', 'meter_key', 'billing_month_key', 'issue_date_key', 'due_date_key',
@@ -193,34 +417,29 @@ fact_bills_final = fact_bills[[
     'due_date', 'reading_date', 'status'
 ]]
 
-fact_bills_final.to_parquet(f"{GOLD_PATH}/fact_bills.parquet", index=False)
+# Quantities and rates are analytics-grade and stored as float32; bill amounts
+# and the cumulative meter registers keep float64 (paisa / 0.01 kWh resolution)
+for col in ['consumption_kwh', 'reading_difference', 'rate_per_kwh']:
+    fact_bills_final[col] = fact_bills_final[col].astype(np.float32)
+
+write_parquet(fact_bills_final, f"{GOLD_PATH}/fact_bills.parquet",
+              dictionary_columns=['meter_key', 'billing_month', 'status'])
 print(f"   [OK] FACT_BILLS: {len(fact_bills_final):,} records")
 
 # FACT_PAYMENTS
 print("\n3. Creating FACT_PAYMENTS...")
-fact_payments = payments_silver.merge(
-    bills_silver[['bill_id', 'meter_id', 'billing_month']],
-    on='bill_id',
-    how='left'
-)
-
+# bill_id is unique in silver bills, so a keyed lookup replaces the merge
+bill_lookup = bills_silver.set_index('bill_id')
+fact_payments = payments_silver
 fact_payments['payment_key'] = fact_payments['payment_id']
 fact_payments['bill_key'] = fact_payments['bill_id']
-# Use meter_id from the merge, or meter_id from payments if available
-if 'meter_id_y' in fact_payments.columns:
-    fact_payments['meter_key'] = fact_payments['meter_id_y']
-elif 'meter_id_x' in fact_payments.columns:
-    fact_payments['meter_key'] = fact_payments['meter_id_x']
-elif 'meter_id' in fact_payments.columns:
-    fact_payments['meter_key'] = fact_payments['meter_id']
-else:
-    # Fallback: get from bill_id
-    fact_payments['meter_key'] = fact_payments['bill_key'].str.extract(r'MTR-(\d+)')[0]
-
-fact_payments['billing_month_key'] = pd.to_datetime(fact_payments['billing_month'], errors='coerce').dt.strftime('%Y%m').astype('Int64')
-fact_payments['payment_date_key'] = pd.to_datetime(fact_payments['payment_date'], errors='coerce').dt.strftime('%Y%m%d').astype('Int64')
+fact_payments['meter_key'] = fact_payments['bill_id'].map(bill_lookup['meter_id']).astype('category')
+fact_payments['billing_month'] = fact_payments['bill_id'].map(bill_lookup['billing_month'])
+
+fact_payments['billing_month_key'] = date_key(pd.to_datetime(fact_payments['billing_month'], errors='coerce'), monthly=True).astype('Int32')
+fact_payments['payment_date_key'] = date_key(pd.to_datetime(fact_payments['payment_date'], errors='coerce')).astype('Int32')
 fact_payments['amount_due'] = fact_payments['bill_amount'] - fact_payments['amount_paid']
-fact_payments['payment_percentage'] = (fact_payments['amount_paid'] / fact_payments['bill_amount'] * 100).fillna(0)
+fact_payments['payment_percentage'] = (fact_payments['amount_paid'] / fact_payments['bill_amount'] * 100).fillna(0).astype(np.float32)
 
 fact_payments_final = fact_payments[[
     'payment_key', 'bill_key', 'meter_key', 'billing_month_key', 'payment_date_key',
@@ -228,7 +447,8 @@ fact_payments_final = fact_payments[[
     'payment_date', 'payment_method', 'status'
 ]]
 
-fact_payments_final.to_parquet(f"{GOLD_PATH}/fact_payments.parquet", index=False)
+write_parquet(fact_payments_final, f"{GOLD_PATH}/fact_payments.parquet",
+              dictionary_columns=['meter_key', 'payment_method', 'status'])
 print(f"   [OK] FACT_PAYMENTS: {len(fact_payments_final):,} records")
 
 print("\n" + "="*80)
@@ -237,55 +457,70 @@ print("="*80)
 
 # AGG_MONTHLY_CONSUMPTION
 print("\n1. Creating AGG_MONTHLY_CONSUMPTION...")
-fact_readings_final['year_month'] = (fact_readings_final['date_key'] / 100).astype(int)
-
-# Ensure numeric columns are proper float types
-numeric_cols = ['energy_consumed_kwh', 'voltage_v', 'power_factor']
-for col in numeric_cols:
-    fact_readings_final[col] = pd.to_numeric(fact_readings_final[col], errors='coerce')
-
-agg_monthly = fact_readings_final.groupby(['meter_key', 'year_month']).agg({
-    'energy_consumed_kwh': ['sum', 'mean', 'max', 'min'],
-    'voltage_v': 'mean',
-    'power_factor': 'mean'
+# Group on compact keys: categorical meter_key (int codes instead of string
+# hashing) and the int32 date keys
+fact_readings_final['year_month'] = fact_readings_final['date_key'] // 100
+
+# Factorize (meter_key, year_month) into dense group ids (first-appearance
+# order, like groupby(sort=False)) and reduce them in one fused kernel pass
+meter_codes = fact_readings_final['meter_key'].cat.codes.to_numpy().astype(np.int64)
+month_codes, months = pd.factorize(fact_readings_final['year_month'])
+group_ids, group_keys = pd.factorize(meter_codes * len(months) + month_codes)
+monthly_stats, monthly_size = _monthly_agg(
+    group_ids,
+    np.ascontiguousarray(fact_readings_final['energy_consumed_kwh'].to_numpy()),
+    np.ascontiguousarray(fact_readings_final['voltage_v'].to_numpy()),
+    np.ascontiguousarray(fact_readings_final['power_factor'].to_numpy()),
+    len(group_keys)
+)
+energy_dtype = fact_readings_final['energy_consumed_kwh'].dtype
+agg_monthly = pd.DataFrame({
+    'meter_key': pd.Categorical.from_codes(group_keys // len(months), dtype=fact_readings_final['meter_key'].dtype),
+    'year_month': months[group_keys % len(months)],
+    'total_consumption_kwh': monthly_stats[0].astype(energy_dtype),
+    'avg_consumption_kwh': monthly_stats[1].astype(energy_dtype),
+    'max_consumption_kwh': monthly_stats[2].astype(energy_dtype),
+    'min_consumption_kwh': monthly_stats[3].astype(energy_dtype),
+    'avg_voltage': monthly_stats[4].astype(fact_readings_final['voltage_v'].dtype),
+    'avg_power_factor': monthly_stats[5].astype(fact_readings_final['power_factor'].dtype),
+    'reading_count': monthly_size
 })
-agg_monthly['reading_count'] = fact_readings_final.groupby(['meter_key', 'year_month']).size()
-agg_monthly.columns = ['total_consumption_kwh', 'avg_consumption_kwh', 'max_consumption_kwh', 
-                       'min_consumption_kwh', 'avg_voltage', 'avg_power_factor', 'reading_count']
-agg_monthly = agg_monthly.reset_index()
-agg_monthly.to_parquet(f"{GOLD_PATH}/agg_monthly_consumption.parquet", index=False)
+write_parquet(agg_monthly, f"{GOLD_PATH}/agg_monthly_consumption.parquet")
 print(f"   [OK] AGG_MONTHLY_CONSUMPTION: {len(agg_monthly):,} records")
 
 # AGG_DAILY_CONSUMPTION
 print("\n2. Creating AGG_DAILY_CONSUMPTION...")
-# Ensure numeric column is proper float type
-fact_readings_final['energy_consumed_kwh'] = pd.to_numeric(fact_readings_final['energy_consumed_kwh'], errors='coerce')
-
-agg_daily = fact_readings_final.groupby(['meter_key', 'date_key']).agg({
-    'energy_consumed_kwh': ['sum', 'mean', 'max']
-})
-agg_daily['reading_count'] = fact_readings_final.groupby(['meter_key', 'date_key']).size()
-agg_daily.columns = ['total_consumption_kwh', 'avg_consumption_kwh', 'max_consumption_kwh', 'reading_count']
-agg_daily = agg_daily.reset_index()
-agg_daily.to_parquet(f"{GOLD_PATH}/agg_daily_consumption.parquet", index=False)
+# Aggregated and written as an Arrow table (no pandas round trip for this output)
+daily_source = pa.Table.from_pandas(
+    fact_readings_final[['meter_key', 'date_key', 'energy_consumed_kwh']], preserve_index=False
+)
+agg_daily = daily_source.group_by(['meter_key', 'date_key']).aggregate([
+    ('energy_consumed_kwh', 'sum', pc.ScalarAggregateOptions(min_count=0)),
+    ('energy_consumed_kwh', 'mean'),
+    ('energy_consumed_kwh', 'max'),
+    ('energy_consumed_kwh', 'count', pc.CountOptions(mode='all'))
+])
+agg_daily = agg_daily.select([
+    'meter_key', 'date_key', 'energy_consumed_kwh_sum', 'energy_consumed_kwh_mean',
+    'energy_consumed_kwh_max', 'energy_consumed_kwh_count'
+]).rename_columns([
+    'meter_key', 'date_key', 'total_consumption_kwh', 'avg_consumption_kwh',
+    'max_consumption_kwh', 'reading_count'
+])
+pending_writes.append(parquet_writer.submit(
+    pq.write_table, agg_daily, f"{GOLD_PATH}/agg_daily_consumption.parquet", compression='zstd'
+))
 print(f"   [OK] AGG_DAILY_CONSUMPTION: {len(agg_daily):,} records")
 
 # AGG_CONSUMER_TYPE_SUMMARY
 print("\n3. Creating AGG_CONSUMER_TYPE_SUMMARY...")
-# Ensure meter_key types match for merge
-dim_meter_copy = dim_meter.copy()
-dim_meter_copy['meter_key'] = dim_meter_copy['meter_key'].astype(str)
-fact_readings_final['meter_key'] = fact_readings_final['meter_key'].astype(str)
-
-readings_with_type = fact_readings_final.merge(
-    dim_meter_copy[['meter_key', 'consumer_type', 'consumer_category']],
-    on='meter_key'
-)
-# Ensure numeric columns are proper float types
-for col in ['energy_consumed_kwh', 'voltage_v', 'power_factor']:
-    readings_with_type[col] = pd.to_numeric(readings_with_type[col], errors='coerce')
-
-agg_consumer = readings_with_type.groupby(['consumer_type', 'consumer_category']).agg({
+# One merge pulls both the consumer-type and the location attributes; it is
+# reused for AGG_LOCATION_SUMMARY below. DIM_METER is keyed with the fact
+# table's meter_key dtype so the join runs on category codes
+meter_attrs = dim_meter[['consumer_type', 'consumer_category', 'district', 'division', 'sub_division']].astype('category')
+meter_attrs.insert(0, 'meter_key', dim_meter['meter_key'].astype(str).astype(meter_key_dtype))
+readings_with_meter = fact_readings_final.merge(meter_attrs, on='meter_key')
+agg_consumer = readings_with_meter.groupby(['consumer_type', 'consumer_category'], sort=False, observed=True).agg({
     'meter_key': 'nunique',
     'energy_consumed_kwh': ['sum', 'mean'],
     'voltage_v': 'mean',
@@ -294,7 +529,7 @@ agg_consumer = readings_with_type.groupby(['consumer_type', 'consumer_category']
 agg_consumer.columns = ['consumer_type', 'consumer_category', 'meter_count',
                         'total_consumption_kwh', 'avg_consumption_kwh',
                         'avg_voltage', 'avg_power_factor']
-agg_consumer.to_parquet(f"{GOLD_PATH}/agg_consumer_type_summary.parquet", index=False)
+write_parquet(agg_consumer, f"{GOLD_PATH}/agg_consumer_type_summary.parquet")
 print(f"   [OK] AGG_CONSUMER_TYPE_SUMMARY: {len(agg_consumer):,} records")
 
 # AGG_PAYMENT_SUMMARY
@@ -308,41 +543,61 @@ agg_payment = fact_payments_final.groupby(['billing_month_key', 'status']).agg({
 }).reset_index()
 agg_payment.columns = ['billing_month_key', 'payment_status', 'payment_count',
                        'total_billed', 'total_paid', 'total_due', 'avg_payment_percentage']
-agg_payment.to_parquet(f"{GOLD_PATH}/agg_payment_summary.parquet", index=False)
+write_parquet(agg_payment, f"{GOLD_PATH}/agg_payment_summary.parquet")
 print(f"   [OK] AGG_PAYMENT_SUMMARY: {len(agg_payment):,} records")
 
 # AGG_LOCATION_SUMMARY
 print("\n5. Creating AGG_LOCATION_SUMMARY...")
-# Ensure meter_key types match for merge
-dim_meter_copy2 = dim_meter.copy()
-dim_meter_copy2['meter_key'] = dim_meter_copy2['meter_key'].astype(str)
-fact_readings_final['meter_key'] = fact_readings_final['meter_key'].astype(str)
-
-readings_with_location = fact_readings_final.merge(
-    dim_meter_copy2[['meter_key', 'district', 'division', 'sub_division']],
-    on='meter_key'
-)
-# Ensure numeric columns are proper float types
-for col in ['energy_consumed_kwh', 'voltage_v']:
-    readings_with_location[col] = pd.to_numeric(readings_with_location[col], errors='coerce')
-
-agg_location = readings_with_location.groupby(['district', 'division', 'sub_division']).agg({
+agg_location = readings_with_meter.groupby(['district', 'division', 'sub_division'], sort=False, observed=True).agg({
     'meter_key': 'nunique',
     'energy_consumed_kwh': ['sum', 'mean'],
     'voltage_v': 'mean'
 }).reset_index()
 agg_location.columns = ['district', 'division', 'sub_division', 'meter_count',
                         'total_consumption_kwh', 'avg_consumption_kwh', 'avg_voltage']
-agg_location.to_parquet(f"{GOLD_PATH}/agg_location_summary.parquet", index=False)
+write_parquet(agg_location, f"{GOLD_PATH}/agg_location_summary.parquet")
 print(f"   [OK] AGG_LOCATION_SUMMARY: {len(agg_location):,} records")
 
+# Dashboard Home tables: the top-5 consumer types and the payment status
+# totals are tiny, so they are stored ready to render instead of being
+# recomputed from the summaries on every page load
+print("\n6. Creating AGG_TOP5_CONSUMER_TYPE / AGG_PAYMENT_STATUS...")
+agg_top5_consumer = agg_consumer.nlargest(5, 'total_consumption_kwh')[
+    ['consumer_type', 'total_consumption_kwh', 'meter_count']
+]
+write_parquet(agg_top5_consumer, f"{GOLD_PATH}/agg_top5_consumer_type.parquet")
+agg_payment_status = agg_payment.groupby('payment_status', observed=True)['payment_count'].sum().reset_index()
+write_parquet(agg_payment_status, f"{GOLD_PATH}/agg_payment_status.parquet")
+print(f"   [OK] AGG_TOP5_CONSUMER_TYPE: {len(agg_top5_consumer):,} records")
+print(f"   [OK] AGG_PAYMENT_STATUS: {len(agg_payment_status):,} records")
+
 print("\n" + "="*80)
 print("STEP 5: CREATE METADATA")
 print("="*80)
 
-# Calculate sizes
-def get_file_size(path):
-    return os.path.getsize(path) / (1024 * 1024)
+# Every output has to be on disk before its size can be recorded
+for future in pending_writes:
+    future.result()
+parquet_writer.shutdown()
+
+# Every table must load back into pandas; the dashboard reads them all
+unreadable = []
+for entry in os.scandir(GOLD_PATH):
+    if entry.name.endswith('.parquet'):
+        try:
+            check_readable(entry.path)
+        except Exception as e:
+            unreadable.append(entry.name)
+            print(f"   [ERROR] {entry.name} cannot be read back: {e}")
+if unreadable:
+    exit(1)
+print("   [OK] All Gold tables read back")
+
+# Calculate sizes (one directory scan instead of a stat call per file)
+file_sizes_mb = {
+    entry.name: entry.stat().st_size / (1024 * 1024)
+    for entry in os.scandir(GOLD_PATH) if entry.name.endswith('.parquet')
+}
 
 metadata = {
     'created_at': datetime.now().isoformat(),
@@ -350,23 +605,25 @@ metadata = {
     'destination': GOLD_PATH,
     'schema_type': 'Star Schema',
     'dimensions': {
-        'dim_meter': {'records': len(dim_meter), 'size_mb': get_file_size(f"{GOLD_PATH}/dim_meter.parquet")},
-        'dim_date': {'records': len(dim_date), 'size_mb': get_file_size(f"{GOLD_PATH}/dim_date.parquet")},
-        'dim_time': {'records': len(dim_time), 'size_mb': get_file_size(f"{GOLD_PATH}/dim_time.parquet")},
-        'dim_consumer_type': {'records': len(dim_consumer_type), 'size_mb': get_file_size(f"{GOLD_PATH}/dim_consumer_type.parquet")},
-        'dim_location': {'records': len(dim_location), 'size_mb': get_file_size(f"{GOLD_PATH}/dim_location.parquet")}
+        'dim_meter': {'records': len(dim_meter), 'size_mb': file_sizes_mb['dim_meter.parquet']},
+        'dim_date': {'records': len(dim_date), 'size_mb': file_sizes_mb['dim_date.parquet']},
+        'dim_time': {'records': len(dim_time), 'size_mb': file_sizes_mb['dim_time.parquet']},
+        'dim_consumer_type': {'records': len(dim_consumer_type), 'size_mb': file_sizes_mb['dim_consumer_type.parquet']},
+        'dim_location': {'records': len(dim_location), 'size_mb': file_sizes_mb['dim_location.parquet']}
     },
     'facts': {
-        'fact_readings': {'records': len(fact_readings_final), 'size_mb': get_file_size(f"{GOLD_PATH}/fact_readings.parquet")},
-        'fact_bills': {'records': len(fact_bills_final), 'size_mb': get_file_size(f"{GOLD_PATH}/fact_bills.parquet")},
-        'fact_payments': {'records': len(fact_payments_final), 'size_mb': get_file_size(f"{GOLD_PATH}/fact_payments.parquet")}
+        'fact_readings': {'records': len(fact_readings_final), 'size_mb': file_sizes_mb['fact_readings.parquet']},
+        'fact_bills': {'records': len(fact_bills_final), 'size_mb': file_sizes_mb['fact_bills.parquet']},
+        'fact_payments': {'records': len(fact_payments_final), 'size_mb': file_sizes_mb['fact_payments.parquet']}
     },
     'aggregates': {
-        'agg_monthly_consumption': {'records': len(agg_monthly), 'size_mb': get_file_size(f"{GOLD_PATH}/agg_monthly_consumption.parquet")},
-        'agg_daily_consumption': {'records': len(agg_daily), 'size_mb': get_file_size(f"{GOLD_PATH}/agg_daily_consumption.parquet")},
-        'agg_consumer_type_summary': {'records': len(agg_consumer), 'size_mb': get_file_size(f"{GOLD_PATH}/agg_consumer_type_summary.parquet")},
-        'agg_payment_summary': {'records': len(agg_payment), 'size_mb': get_file_size(f"{GOLD_PATH}/agg_payment_summary.parquet")},
-        'agg_location_summary': {'records': len(agg_location), 'size_mb': get_file_size(f"{GOLD_PATH}/agg_location_summary.parquet")}
+        'agg_monthly_consumption': {'records': len(agg_monthly), 'size_mb': file_sizes_mb['agg_monthly_consumption.parquet']},
+        'agg_daily_consumption': {'records': len(agg_daily), 'size_mb': file_sizes_mb['agg_daily_consumption.parquet']},
+        'agg_consumer_type_summary': {'records': len(agg_consumer), 'size_mb': file_sizes_mb['agg_consumer_type_summary.parquet']},
+        'agg_payment_summary': {'records': len(agg_payment), 'size_mb': file_sizes_mb['agg_payment_summary.parquet']},
+        'agg_location_summary': {'records': len(agg_location), 'size_mb': file_sizes_mb['agg_location_summary.parquet']},
+        'agg_top5_consumer_type': {'records': len(agg_top5_consumer), 'size_mb': file_sizes_mb['agg_top5_consumer_type.parquet']},
+        'agg_payment_status': {'records': len(agg_payment_status), 'size_mb': file_sizes_mb['agg_payment_status.parquet']}
     }
 }
 
@@ -406,6 +663,6 @@ print(f"Gold Layer: {GOLD_PATH}/")
 print(f"\nStar Schema created with:")
 print(f"   5 Dimension tables (DIMs)")
 print(f"   3 Fact tables (FACTs)")
-print(f"   5 Aggregate tables (AGGs)")
+print(f"   7 Aggregate tables (AGGs)")
 print(f"\nData is now ready for analytics, BI tools, and ML!")
 print("="*80)
@@ -5,25 +5,61 @@ Realistic simulation of Pakistan's power distribution challenges
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
-from faker import Faker
+from datetime import timedelta
 import os
 import json
-from tqdm import tqdm
 import argparse
 from typing import Tuple, Dict, List, Optional
 from collections import defaultdict
-import hashlib
 
-# Initialize Faker
-fake = Faker('en_PK')
-Faker.seed(42)
+# Numba is optional: transformer loading falls back to the NumPy kernel
+from numba_compat import njit, NUMBA_AVAILABLE
+
 np.random.seed(42)
-random.seed(42)
+
+# Load-shedding seasons by code: peak_summer (Jun-Jul), summer (May, Aug), winter (Dec-Feb);
+# 'normal' months have no schedule and use the default
+SEASONS = ['peak_summer', 'summer', 'winter', 'normal']
+
+# Overload status codes, in threshold order
+OVERLOAD_STATUSES = ['normal', 'moderate_overload', 'high_overload', 'critical_overload']
+
+
+@njit(cache=True, fastmath=True)
+def _bucket_and_prob_nb(peak_load_kva, rating_kva, thresholds, probs):
+    """Load percentage, overload status code and failure probability per row"""
+    n = peak_load_kva.shape[0]
+    load_percentage = np.empty(n, dtype=np.float64)
+    status_codes = np.empty(n, dtype=np.int8)
+    failure_prob = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        pct = peak_load_kva[i] / rating_kva[i] * 100
+        code = 0
+        for k in range(thresholds.shape[0]):
+            if pct >= thresholds[k]:
+                code = k + 1
+        load_percentage[i] = pct
+        status_codes[i] = code
+        failure_prob[i] = probs[code]
+    return load_percentage, status_codes, failure_prob
+
+
+def _bucket_and_prob_np(peak_load_kva, rating_kva, thresholds, probs):
+    """NumPy equivalent of _bucket_and_prob_nb"""
+    load_percentage = peak_load_kva / rating_kva * 100
+    status_codes = (load_percentage[:, None] >= thresholds).sum(axis=1).astype(np.int8)
+    return load_percentage, status_codes, probs[status_codes]
+
+
+_bucket_and_prob = _bucket_and_prob_nb if NUMBA_AVAILABLE else _bucket_and_prob_np
+
 
 class IESCOGridSimulator:
-    def __init__(self):
+    def __init__(self, seed: int = 42):
+        # Batched draws for the event generators come from one seeded Generator
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+        
         # ============================================================
         # CONSUMER TYPES (as defined previously - 40+ types)
         # ============================================================
@@ -57,6 +93,9 @@ class IESCOGridSimulator:
             }
         }
         
+        # Distribution transformer specs keyed by rating, for O(1) lookups
+        self._dist_trans_by_rating = {t['rating_kva']: t for t in self.transformer_specs['distribution_transformer']['types']}
+        
         # ============================================================
         # GRID INSTABILITY CONFIGURATION
         # ============================================================
@@ -90,6 +129,17 @@ class IESCOGridSimulator:
             }
         }
         
+        # Schedules as a (district, season) table of duration lo/hi, frequency lo/hi, feeders pct;
+        # the extra last row and missing seasons hold the default schedule for other districts
+        self._schedule_districts = {district: i for i, district in enumerate(self.load_shedding_schedules)}
+        self._schedule_table = np.tile(np.array([4, 6, 5, 7, 0.5]), (len(self._schedule_districts) + 1, len(SEASONS), 1))
+        for district, d in self._schedule_districts.items():
+            for k, season in enumerate(SEASONS):
+                schedule = self.load_shedding_schedules[district].get(season)
+                if schedule:
+                    self._schedule_table[d, k] = (*schedule['duration_hours'], *schedule['frequency_days'],
+                                                  schedule['feeders_affected_pct'])
+        
         # Scheduled maintenance times [citation:6]
         self.maintenance_slots = [
             {'start_hour': 6, 'end_hour': 11, 'day_preference': 'weekday'},    # Morning maintenance
@@ -98,6 +148,12 @@ class IESCOGridSimulator:
             {'start_hour': 23, 'end_hour': 4, 'day_preference': 'any'},         # Night maintenance
         ]
         
+        # Slot (start_hour, end_hour) pairs and the slots allowed on weekends, for index sampling
+        self._maintenance_slots_arr = np.array([(s['start_hour'], s['end_hour']) for s in self.maintenance_slots])
+        self._maintenance_all_idx = np.arange(len(self.maintenance_slots))
+        self._maintenance_any_idx = np.array([i for i, s in enumerate(self.maintenance_slots)
+                                              if s['day_preference'] != 'weekday'])
+        
         # Transformer overloading thresholds [citation:2]
         self.overloading_thresholds = {
             'critical_overload': 95,     # >95% - immediate risk
@@ -199,94 +255,103 @@ class IESCOGridSimulator:
     def generate_load_shedding_events(self, 
                                       transformers_df: pd.DataFrame,
                                       start_date: str,
-                                      end_date: str) -> List[Dict]:
+                                      end_date: str) -> pd.DataFrame:
         """
         Generate load shedding events based on schedules [citation:1]
         """
         start = pd.to_datetime(start_date)
         end = pd.to_datetime(end_date)
-        
-        load_shedding_events = []
-        
-        # Group transformers by district and feeder
-        feeders_by_district = defaultdict(list)
-        for _, transformer in transformers_df.iterrows():
-            if transformer['transformer_type'] == 'distribution':
-                feeders_by_district[transformer['district']].append({
-                    'feeder_name': transformer['feeder_name'],
-                    'transformer_id': transformer['transformer_id'],
-                    'sub_division': transformer['sub_division'],
-                    'priority': random.randint(1, 5)  # 1 = critical (less shedding), 5 = low priority (more shedding)
-                })
-        
-        # Generate daily load shedding events
-        current_date = start
-        while current_date <= end:
-            month = current_date.month
-            day_of_week = current_date.dayofweek
-            is_weekend = day_of_week >= 5
+        rng = self._rng
+        
+        # Event columns, filled per shedding (day, district) and assembled once at the end
+        event_columns = defaultdict(list)
+        
+        # Feeder columns per district as parallel arrays
+        distribution = transformers_df[transformers_df['transformer_type'] == 'distribution']
+        feeders_by_district = {}
+        for district, feeders in distribution.groupby('district', sort=False):
+            feeders_by_district[district] = {
+                'feeder_name': feeders['feeder_name'].to_numpy(),
+                'transformer_id': feeders['transformer_id'].to_numpy(),
+                'sub_division': feeders['sub_division'].to_numpy(),
+                'priority': rng.integers(1, 6, size=len(feeders))  # 1 = critical (less shedding), 5 = low priority (more shedding)
+            }
+        districts = list(feeders_by_district)
+        
+        # One row per day of the horizon
+        dates = pd.date_range(start, end, freq='D')
+        months = dates.month.values
+        is_weekend = dates.dayofweek.values >= 5
+        
+        # Season per day, once for the whole horizon
+        season_codes = np.select(
+            [np.isin(months, [6, 7]), np.isin(months, [5, 8]), np.isin(months, [12, 1, 2])],
+            [0, 1, 2], default=3
+        )
+        
+        # Schedule per (day, district) from the precomputed table
+        district_codes = np.array([self._schedule_districts.get(district, len(self._schedule_districts))
+                                   for district in districts], dtype=np.int64)
+        day_schedules = self._schedule_table[district_codes][:, season_codes].transpose(1, 0, 2)  # (n_days, n_districts, 5)
+        
+        # Determine, for every day and district at once, whether shedding occurs
+        occurs = rng.random(day_schedules.shape[:2]) < 1.0 / rng.uniform(day_schedules[..., 2], day_schedules[..., 3])
+        
+        # Only the (day, district) pairs with shedding build events, in date order
+        for day_idx, dist_idx in np.argwhere(occurs):
+            district = districts[dist_idx]
+            feeders = feeders_by_district[district]
+            n_feeders = len(feeders['feeder_name'])
             
-            # Determine season
-            if month in [5, 6, 7, 8]:
-                season = 'peak_summer' if month in [6, 7] else 'summer'
-            elif month in [12, 1, 2]:
-                season = 'winter'
-            else:
-                season = 'normal'
+            # Select feeders for shedding
+            num_feeders = max(1, int(n_feeders * day_schedules[day_idx, dist_idx, 4]))
+            affected_idx = rng.choice(n_feeders, size=min(num_feeders, n_feeders), replace=False)
             
-            for district, feeders in feeders_by_district.items():
-                schedule = self.load_shedding_schedules.get(district, {}).get(season, 
-                            {'duration_hours': (4, 6), 'frequency_days': (5, 7), 'feeders_affected_pct': 0.5})
+            # Determine shedding time
+            if season_codes[day_idx] == 0 and rng.random() > 0.7:
+                # Extended evening shedding during peak summer
+                start_hour = int(rng.integers(17, 20))
+                duration = rng.uniform(6, 10)
+            else:
+                # Use maintenance slots [citation:6]; weekday-only slots are skipped on weekends
+                slot_idx = rng.choice(self._maintenance_any_idx if is_weekend[day_idx] else self._maintenance_all_idx)
+                start_hour, end_hour = self._maintenance_slots_arr[slot_idx]
+                duration = end_hour - start_hour if end_hour > start_hour else (24 - start_hour + end_hour)
                 
-                # Determine if shedding occurs today
-                freq_min, freq_max = schedule['frequency_days']
-                if random.random() < (1 / random.uniform(freq_min, freq_max)):
-                    # Select feeders for shedding
-                    num_feeders = max(1, int(len(feeders) * schedule['feeders_affected_pct']))
-                    affected_feeders = random.sample(feeders, min(num_feeders, len(feeders)))
-                    
-                    # Determine shedding time
-                    if season == 'peak_summer' and random.random() > 0.7:
-                        # Extended evening shedding during peak summer
-                        start_hour = random.choice([17, 18, 19])
-                        duration = random.uniform(6, 10)
-                    else:
-                        # Use maintenance slots [citation:6]
-                        slot = random.choice(self.maintenance_slots)
-                        
-                        # Adjust for weekend
-                        if is_weekend and slot['day_preference'] == 'weekday':
-                            slot = random.choice([s for s in self.maintenance_slots if s['day_preference'] != 'weekday'])
-                        
-                        start_hour = slot['start_hour']
-                        end_hour = slot['end_hour']
-                        duration = end_hour - start_hour if end_hour > start_hour else (24 - start_hour + end_hour)
-                        
-                        # Add random variation
-                        duration += random.uniform(-0.5, 1.0)
-                    
-                    for feeder in affected_feeders:
-                        # Priority affects likelihood (lower priority = more shedding)
-                        if random.random() < (1 / feeder['priority']):
-                            event = {
-                                'event_id': f"LS{current_date.strftime('%Y%m%d')}{random.randint(1000, 9999)}",
-                                'event_type': 'load_shedding',
-                                'district': district,
-                                'feeder_name': feeder['feeder_name'],
-                                'transformer_id': feeder['transformer_id'],
-                                'sub_division': feeder['sub_division'],
-                                'date': current_date,
-                                'start_time': current_date.replace(hour=int(start_hour), minute=0),
-                                'end_time': current_date.replace(hour=int(start_hour), minute=0) + timedelta(hours=duration),
-                                'duration_hours': round(duration, 2),
-                                'reason': random.choice(['maintenance', 'load_management', 'system_upgrade', 'feeder_balancing']),
-                                'announced': random.random() > 0.2,  # 80% announced
-                                'feeders_affected': len(affected_feeders),
-                                'consumers_affected_estimate': random.randint(500, 5000)
-                            }
-                            load_shedding_events.append(event)
+                # Add random variation
+                duration += rng.uniform(-0.5, 1.0)
             
-            current_date += timedelta(days=1)
+            # Priority affects likelihood (lower priority = more shedding)
+            shed_idx = affected_idx[rng.random(affected_idx.size) < 1 / feeders['priority'][affected_idx]]
+            event_columns['day_idx'].extend([day_idx] * shed_idx.size)
+            event_columns['district'].extend([district] * shed_idx.size)
+            for col in ('feeder_name', 'transformer_id', 'sub_division'):
+                event_columns[col].extend(feeders[col][shed_idx])
+            event_columns['start_hour'].extend([start_hour] * shed_idx.size)
+            event_columns['duration'].extend([duration] * shed_idx.size)
+            event_columns['feeders_affected'].extend([affected_idx.size] * shed_idx.size)
+        
+        n_events = len(event_columns['day_idx'])
+        event_dates = dates[np.asarray(event_columns['day_idx'], dtype=np.int64)]
+        durations = np.asarray(event_columns['duration'], dtype=np.float64)
+        start_times = event_dates + pd.to_timedelta(np.asarray(event_columns['start_hour'], dtype=np.int64), unit='h')
+        
+        load_shedding_events = pd.DataFrame({
+            'event_id': [f"LS{day}{i:06d}" for i, day in enumerate(event_dates.strftime('%Y%m%d'), 1)],
+            'event_type': 'load_shedding',
+            'district': event_columns['district'],
+            'feeder_name': event_columns['feeder_name'],
+            'transformer_id': event_columns['transformer_id'],
+            'sub_division': event_columns['sub_division'],
+            'date': event_dates,
+            'start_time': start_times,
+            'end_time': start_times + pd.to_timedelta(durations, unit='h'),
+            'duration_hours': durations.round(2),
+            'reason': np.array(['maintenance', 'load_management', 'system_upgrade', 'feeder_balancing'])[rng.integers(0, 4, n_events)],
+            'announced': rng.random(n_events) > 0.2,  # 80% announced
+            'feeders_affected': np.asarray(event_columns['feeders_affected'], dtype=np.int64),
+            'consumers_affected_estimate': rng.integers(500, 5001, n_events)
+        })
         
         print(f"✅ Generated {len(load_shedding_events)} load shedding events")
         return load_shedding_events
@@ -302,180 +367,137 @@ class IESCOGridSimulator:
         """
         Simulate transformer loading and calculate overload conditions [citation:2]
         """
-        transformers = transformers_df.to_dict('records')
-        
-        # Group readings by transformer and month
-        readings_by_transformer = defaultdict(list)
-        for _, reading in readings_df.iterrows():
-            readings_by_transformer[reading['distribution_transformer_id']].append(reading)
-        
-        loading_history = []
-        
-        for transformer in tqdm(transformers, desc="Calculating transformer loading"):
-            if transformer['transformer_type'] != 'distribution':
-                continue
-                
-            trans_id = transformer['transformer_id']
-            rating_kva = transformer['rating_kva']
-            trans_readings = readings_by_transformer.get(trans_id, [])
-            
-            if not trans_readings:
-                continue
-            
-            # Group by month
-            readings_df_filtered = pd.DataFrame(trans_readings)
-            readings_df_filtered['month'] = pd.to_datetime(readings_df_filtered['timestamp']).dt.to_period('M')
-            
-            for month, month_readings in readings_df_filtered.groupby('month'):
-                # Calculate peak load this month
-                peak_consumption_kw = month_readings.groupby('timestamp')['energy_consumed_kwh'].sum().max() * 4  # Convert 15-min to hourly
-                peak_load_kva = peak_consumption_kw / 0.9  # Assuming 0.9 power factor
-                
-                load_percentage = (peak_load_kva / rating_kva) * 100
-                
-                # Determine overload status
-                if load_percentage >= self.overloading_thresholds['critical_overload']:
-                    overload_status = 'critical_overload'
-                elif load_percentage >= self.overloading_thresholds['high_overload']:
-                    overload_status = 'high_overload'
-                elif load_percentage >= self.overloading_thresholds['moderate_overload']:
-                    overload_status = 'moderate_overload'
-                else:
-                    overload_status = 'normal'
-                
-                # Calculate failure probability
-                failure_prob = self.failure_probabilities[overload_status]
-                
-                loading_record = {
-                    'transformer_id': trans_id,
-                    'district': transformer['district'],
-                    'sub_division': transformer['sub_division'],
-                    'month': str(month),
-                    'peak_load_kva': round(peak_load_kva, 2),
-                    'rating_kva': rating_kva,
-                    'load_percentage': round(load_percentage, 2),
-                    'overload_status': overload_status,
-                    'failure_probability': failure_prob,
-                    'cumulative_overload_months': len([h for h in loading_history 
-                                                       if h['transformer_id'] == trans_id and 
-                                                       h['overload_status'] in ['critical_overload', 'high_overload']]) + 1
-                }
-                loading_history.append(loading_record)
-        
-        return pd.DataFrame(loading_history)
+        # Peak load per transformer and month: sum all meters per timestamp, take the max
+        # (consumption in float32 halves the bytes the groupby has to move)
+        timestamps = pd.to_datetime(readings_df['timestamp'])
+        energy = readings_df['energy_consumed_kwh'].astype(np.float32)
+        peak_load_kva = (energy.groupby([readings_df['distribution_transformer_id'].rename('transformer_id'),
+                                         timestamps.dt.to_period('M').rename('month'),
+                                         timestamps]).sum()
+                         .groupby(level=[0, 1]).max()
+                         * 4  # Convert 15-min to hourly
+                         / 0.9  # Assuming 0.9 power factor
+                         ).rename('peak_load_kva').reset_index()
+        
+        distribution = transformers_df.loc[transformers_df['transformer_type'] == 'distribution',
+                                           ['transformer_id', 'district', 'sub_division', 'rating_kva']]
+        distribution = distribution.astype({'rating_kva': np.int32, 'district': 'category', 'sub_division': 'category'})
+        loading = distribution.merge(peak_load_kva, on='transformer_id', how='inner')
+        
+        # Load percentage, overload status and failure probability in one compiled pass
+        thresholds = np.array([self.overloading_thresholds[status] for status in OVERLOAD_STATUSES[1:]], dtype=np.float64)
+        probs = np.array([self.failure_probabilities[status] for status in OVERLOAD_STATUSES], dtype=np.float64)
+        load_percentage, status_codes, failure_prob = _bucket_and_prob(
+            loading['peak_load_kva'].to_numpy(dtype=np.float64),
+            loading['rating_kva'].to_numpy(dtype=np.float64),
+            thresholds, probs
+        )
+        loading['load_percentage'] = load_percentage
+        loading['overload_status'] = np.array(OVERLOAD_STATUSES)[status_codes]
+        loading['failure_probability'] = failure_prob
+        
+        loading['month'] = loading['month'].astype(str)
+        loading['peak_load_kva'] = loading['peak_load_kva'].round(2)
+        loading['load_percentage'] = loading['load_percentage'].round(2)
+        
+        # Overloaded (high/critical) months before this one for the same transformer, plus one;
+        # rows are already ordered by transformer then month
+        overloaded = loading['overload_status'].isin(['critical_overload', 'high_overload']).astype(int)
+        loading['cumulative_overload_months'] = (
+            overloaded.groupby(loading['transformer_id'], sort=False).cumsum() - overloaded + 1
+        )
+        
+        return loading[['transformer_id', 'district', 'sub_division', 'month', 'peak_load_kva', 'rating_kva',
+                        'load_percentage', 'overload_status', 'failure_probability', 'cumulative_overload_months']]
 
     def generate_transformer_failures(self,
                                      transformers_df: pd.DataFrame,
                                      loading_history: pd.DataFrame,
                                      start_date: str,
-                                     end_date: str) -> List[Dict]:
+                                     end_date: str) -> pd.DataFrame:
         """
         Generate transformer failure events based on loading [citation:2][citation:4]
         """
         start = pd.to_datetime(start_date)
         end = pd.to_datetime(end_date)
         
-        failures = []
-        failure_id = 1
-        
-        # Get unique transformers
-        for _, transformer in transformers_df.iterrows():
-            if transformer['transformer_type'] != 'distribution':
-                continue
-            
-            trans_id = transformer['transformer_id']
-            trans_loading = loading_history[loading_history['transformer_id'] == trans_id]
-            
-            if trans_loading.empty:
-                continue
-            
-            # Calculate cumulative risk
-            max_overload = trans_loading['load_percentage'].max()
-            avg_overload = trans_loading['load_percentage'].mean()
-            overload_months = len(trans_loading[trans_loading['overload_status'].isin(['critical_overload', 'high_overload'])])
-            
-            # Age factor (older transformers fail more)
-            install_date = pd.to_datetime(transformer['installation_date'])
-            age_years = (end - install_date).days / 365
-            age_factor = min(2.0, age_years / 15)  # Max 2x risk at 30 years
-            
-            # Calculate failure probability over the period
-            base_prob = overload_months * 0.02 + (max_overload / 100) * 0.1 + age_factor * 0.05
-            failure_prob = min(0.95, base_prob)
-            
-            # Determine if failure occurs
-            if random.random() < failure_prob:
-                # Determine failure type and severity
-                if max_overload >= 95:
-                    failure_type = 'burnout'
-                    severity = 'major'
-                elif max_overload >= 85:
-                    failure_type = random.choice(['winding_failure', 'insulation_breakdown'])
-                    severity = 'major' if random.random() > 0.5 else 'minor'
-                else:
-                    failure_type = random.choice(['oil_leak', 'tap_changer_failure', 'bushing_failure'])
-                    severity = 'minor'
-                
-                # Determine failure date (weighted towards peak months)
-                peak_months = trans_loading[trans_loading['load_percentage'] == trans_loading['load_percentage'].max()]
-                if not peak_months.empty:
-                    peak_month = peak_months.iloc[0]['month']
-                    year, month = map(int, peak_month.split('-'))
-                    failure_date = datetime(year, month, random.randint(1, 28))
-                else:
-                    failure_date = fake.date_between(start_date=start, end_date=end)
-                
-                # Get repair/replacement details [citation:4][citation:9]
-                if severity == 'major':
-                    if random.random() > 0.3:
-                        action = 'replacement'
-                        cost_range = self.repair_costs['distribution_transformer']['replacement']['cost_range']
-                        duration_range = self.repair_costs['distribution_transformer']['replacement']['duration_days']
-                    else:
-                        action = 'major_repair'
-                        cost_range = self.repair_costs['distribution_transformer']['major_repair']['cost_range']
-                        duration_range = self.repair_costs['distribution_transformer']['major_repair']['duration_days']
-                else:
-                    action = 'minor_repair'
-                    cost_range = self.repair_costs['distribution_transformer']['minor_repair']['cost_range']
-                    duration_range = self.repair_costs['distribution_transformer']['minor_repair']['duration_days']
-                
-                repair_cost = random.randint(cost_range[0], cost_range[1])
-                repair_days = random.randint(duration_range[0], duration_range[1])
-                
-                # Find transformer type for base cost reference
-                trans_type = None
-                for t in self.transformer_specs['distribution_transformer']['types']:
-                    if t['rating_kva'] == transformer['rating_kva']:
-                        trans_type = t
-                        break
-                
-                failure = {
-                    'failure_id': f"TF{failure_id:06d}",
-                    'transformer_id': trans_id,
-                    'district': transformer['district'],
-                    'sub_division': transformer['sub_division'],
-                    'feeder_name': transformer['feeder_name'],
-                    'failure_date': failure_date,
-                    'failure_type': failure_type,
-                    'severity': severity,
-                    'action_taken': action,
-                    'repair_cost_rs': repair_cost,
-                    'base_cost_rs': trans_type['base_cost'] if trans_type else None,
-                    'outage_duration_days': repair_days,
-                    'consumers_affected': random.randint(50, 500),
-                    'load_at_failure_kva': transformer['current_load_kva'],
-                    'overload_history': overload_months,
-                    'max_load_percentage': round(max_overload, 2),
-                    'age_years': round(age_years, 1),
-                    'replacement_transformer_id': f"DT{random.randint(100000, 999999)}" if action == 'replacement' else None
-                }
-                failures.append(failure)
-                failure_id += 1
-                
-                # Update transformer status
-                transformer['status'] = 'Failed' if action != 'replacement' else 'Replaced'
-                transformer['last_failure_date'] = failure_date
+        rng = self._rng
+        
+        # Cumulative risk per transformer, from one pass over the loading history
+        overloaded = loading_history['overload_status'].isin(['critical_overload', 'high_overload'])
+        by_transformer = loading_history.assign(overloaded=overloaded).groupby('transformer_id', sort=False)
+        risk = by_transformer.agg(max_overload=('load_percentage', 'max'),
+                                  avg_overload=('load_percentage', 'mean'),
+                                  overload_months=('overloaded', 'sum'))
+        risk['peak_month'] = loading_history['month'].loc[by_transformer['load_percentage'].idxmax()].values
+        
+        candidates = transformers_df[transformers_df['transformer_type'] == 'distribution'].merge(
+            risk, left_on='transformer_id', right_index=True, how='inner'
+        )
+        
+        # Age factor (older transformers fail more)
+        age_years = ((end - pd.to_datetime(candidates['installation_date'])).dt.days / 365).to_numpy()
+        age_factor = np.minimum(2.0, age_years / 15)  # Max 2x risk at 30 years
+        
+        # Calculate failure probability over the period
+        base_prob = (candidates['overload_months'].to_numpy() * 0.02
+                     + (candidates['max_overload'].to_numpy() / 100) * 0.1
+                     + age_factor * 0.05)
+        failure_prob = np.minimum(0.95, base_prob)
+        
+        # Determine which transformers fail, all at once
+        fires = rng.random(len(candidates)) < failure_prob
+        
+        failing = candidates[fires]
+        n_fail = len(failing)
+        
+        # Determine failure type, severity and action for all failures at once
+        max_overloads = failing['max_overload'].to_numpy()
+        burnout = max_overloads >= 95
+        winding = ~burnout & (max_overloads >= 85)
+        failure_types = np.where(
+            burnout, 'burnout',
+            np.where(winding,
+                     rng.choice(['winding_failure', 'insulation_breakdown'], size=n_fail),
+                     rng.choice(['oil_leak', 'tap_changer_failure', 'bushing_failure'], size=n_fail))
+        )
+        major = burnout | (winding & (rng.random(n_fail) > 0.5))
+        actions = np.where(major, np.where(rng.random(n_fail) > 0.3, 'replacement', 'major_repair'), 'minor_repair')
+        
+        # Determine failure date (weighted towards peak months)
+        failure_dates = (pd.to_datetime(failing['peak_month'], format='%Y-%m')
+                         + pd.to_timedelta(rng.integers(0, 28, n_fail), unit='D'))
+        
+        # Get repair/replacement details [citation:4][citation:9]
+        repair = self.repair_costs['distribution_transformer']
+        cost_ranges = np.array([repair[action]['cost_range'] for action in actions], dtype=np.int64).reshape(n_fail, 2)
+        duration_ranges = np.array([repair[action]['duration_days'] for action in actions], dtype=np.int64).reshape(n_fail, 2)
+        
+        # Transformer type base cost for reference
+        base_costs = {rating: t['base_cost'] for rating, t in self._dist_trans_by_rating.items()}
+        
+        failures = pd.DataFrame({
+            'failure_id': [f"TF{i:06d}" for i in range(1, n_fail + 1)],
+            'transformer_id': failing['transformer_id'].to_numpy(),
+            'district': failing['district'].to_numpy(),
+            'sub_division': failing['sub_division'].to_numpy(),
+            'feeder_name': failing['feeder_name'].to_numpy(),
+            'failure_date': failure_dates.to_numpy(),
+            'failure_type': failure_types,
+            'severity': np.where(major, 'major', 'minor'),
+            'action_taken': actions,
+            'repair_cost_rs': rng.integers(cost_ranges[:, 0], cost_ranges[:, 1] + 1),
+            'base_cost_rs': failing['rating_kva'].map(base_costs).to_numpy(),
+            'outage_duration_days': rng.integers(duration_ranges[:, 0], duration_ranges[:, 1] + 1),
+            'consumers_affected': rng.integers(50, 501, n_fail),
+            'load_at_failure_kva': failing['current_load_kva'].to_numpy(),
+            'overload_history': failing['overload_months'].to_numpy(dtype=np.int64),
+            'max_load_percentage': max_overloads.round(2),
+            'age_years': age_years[fires].round(1),
+            'replacement_transformer_id': np.where(
+                actions == 'replacement', [f"DT{n}" for n in rng.integers(100000, 1000000, n_fail)], None
+            )
+        })
         
         print(f"✅ Generated {len(failures)} transformer failures")
         return failures
@@ -488,121 +510,117 @@ class IESCOGridSimulator:
                                   meters_df: pd.DataFrame,
                                   readings_df: pd.DataFrame,
                                   start_date: str,
-                                  end_date: str) -> Tuple[pd.DataFrame, List]:
+                                  end_date: str) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """
         Simulate electricity theft incidents
         """
         start = pd.to_datetime(start_date)
         end = pd.to_datetime(end_date)
         
-        theft_incidents = []
-        modified_meters = meters_df.copy()
+        rng = self._rng
         
-        # Track theft by meter
-        meter_theft_status = {}
+        modified_meters = meters_df.copy()
         
-        for idx, meter in tqdm(meters_df.iterrows(), desc="Simulating theft", total=len(meters_df)):
-            meter_number = meter['meter_number']
-            consumer_type = meter['consumer_type']
-            meter_type = meter['meter_type']
-            district = meter['district']
-            
-            # Base theft probability by consumer type
-            base_prob = self.theft_probabilities.get(consumer_type, 0.03)
-            
-            # Adjust by district (some areas have higher theft)
-            district_multipliers = {
-                'ISLAMABAD': 0.3,
-                'RAWALPINDI': 0.8,
-                'ATTOCK': 1.2,
-                'JHELUM': 1.1,
-                'CHAKWAL': 1.3
-            }
-            district_factor = district_multipliers.get(district, 1.0)
-            
-            # Adjust by meter type (smart meters deter theft) [citation:3]
-            if 'smart' in meter_type.lower():
-                detection_factor = self.ami_detection_rate
-                theft_prob = base_prob * district_factor * 0.3  # Smart meters reduce theft by 70%
-            else:
-                detection_factor = self.conventional_detection_rate
-                theft_prob = base_prob * district_factor
-            
-            # Determine if this meter has theft
-            if random.random() < theft_prob:
-                # Determine theft start date (random within period)
-                theft_start = fake.date_between(start_date=start, end_date=end - timedelta(days=90))
-                
-                # Determine theft duration
-                if random.random() > 0.5:
-                    # Ongoing theft
-                    theft_end = None
-                    status = 'active'
-                else:
-                    # Temporary theft (eventually caught)
-                    theft_end = fake.date_between(start_date=theft_start, end_date=end)
-                    status = 'detected' if random.random() < detection_factor else 'ended_unknown'
-                
-                # Theft method
-                theft_method = random.choice(self.theft_methods)
-                
-                # Theft intensity (percentage stolen)
-                theft_percentage = random.uniform(*self.theft_impact_range)
-                
-                # Detection details
-                detected = False
-                detection_date = None
-                detection_method = None
-                
-                if status == 'detected':
-                    detected = True
-                    detection_date = theft_end
-                    
-                    if 'smart' in meter_type.lower():
-                        detection_method = random.choice(['AMI_auto_detection', 'remote_analysis', 'meter_bypass_alert'])
-                    else:
-                        detection_method = random.choice(['physical_inspection', 'bill_anomaly', 'tip_off', 'neighbor_complaint'])
-                    
-                    # Penalty calculation [citation:3]
-                    months_active = ((detection_date - theft_start).days / 30)
-                    estimated_stolen_units = random.randint(500, 5000) * months_active
-                    detection_bill = estimated_stolen_units * random.uniform(20, 30)  # Rs 20-30 per unit penalty
-                    
-                    # Legal action
-                    fir_registered = random.random() > 0.4
-                else:
-                    detection_bill = None
-                    fir_registered = False
-                
-                theft_record = {
-                    'theft_id': f"TH{random.randint(100000, 999999)}",
-                    'meter_number': meter_number,
-                    'consumer_id': meter['consumer_id'],
-                    'consumer_type': consumer_type,
-                    'district': district,
-                    'sub_division': meter['sub_division'],
-                    'theft_start_date': theft_start,
-                    'theft_end_date': theft_end,
-                    'status': status,
-                    'theft_method': theft_method,
-                    'theft_percentage': round(theft_percentage, 3),
-                    'estimated_monthly_stolen_kwh': int(theft_percentage * meter.get('average_monthly_consumption', 300)),
-                    'detected': detected,
-                    'detection_date': detection_date,
-                    'detection_method': detection_method,
-                    'detection_bill_rs': detection_bill,
-                    'fir_registered': fir_registered,
-                    'meter_type': meter_type,
-                    'ami_detected': detected and 'smart' in meter_type.lower()
-                }
-                theft_incidents.append(theft_record)
-                
-                # Update meter status
-                modified_meters.at[idx, 'has_theft_history'] = True
-                modified_meters.at[idx, 'theft_status'] = status
-                
-                if detected:
-                    modified_meters.at[idx, 'theft_detected_date'] = detection_date
+        # Repeated strings as categoricals: per-category values are looked up once and
+        # gathered by code (the trailing entry catches code -1, i.e. missing values)
+        consumer_types = meters_df['consumer_type'].astype('category')
+        meter_types = meters_df['meter_type'].astype('category')
+        districts = meters_df['district'].astype('category')
+        
+        # Base theft probability by consumer type
+        base_prob = np.append(
+            [self.theft_probabilities.get(ct, 0.03) for ct in consumer_types.cat.categories], 0.03
+        ).astype(np.float32)[consumer_types.cat.codes.to_numpy()]
+        
+        # Adjust by district (some areas have higher theft)
+        district_multipliers = {
+            'ISLAMABAD': 0.3,
+            'RAWALPINDI': 0.8,
+            'ATTOCK': 1.2,
+            'JHELUM': 1.1,
+            'CHAKWAL': 1.3
+        }
+        mult_arr = np.ones(len(districts.cat.categories) + 1, dtype=np.float32)
+        for i, district in enumerate(districts.cat.categories):
+            mult_arr[i] = district_multipliers.get(district, 1.0)
+        district_factor = mult_arr[districts.cat.codes.to_numpy()]
+        
+        # Adjust by meter type (smart meters deter theft) [citation:3]
+        is_smart = np.append(
+            ['smart' in str(mt).lower() for mt in meter_types.cat.categories], False
+        )[meter_types.cat.codes.to_numpy()]
+        detection_factor = np.where(is_smart, self.ami_detection_rate, self.conventional_detection_rate)
+        theft_prob = base_prob * district_factor * np.where(is_smart, np.float32(0.3), np.float32(1.0))  # Smart meters reduce theft by 70%
+        
+        # Determine which meters have theft, then draw the per-theft attributes in bulk
+        theft_idx = np.flatnonzero(rng.random(len(meters_df)) < theft_prob)
+        ongoing = rng.random(theft_idx.size) > 0.5
+        caught = rng.random(theft_idx.size) < detection_factor[theft_idx]
+        theft_method_idx = rng.integers(0, len(self.theft_methods), theft_idx.size)
+        theft_pcts = rng.uniform(*self.theft_impact_range, theft_idx.size)
+        
+        # Theft start within the period (at least 90 days before its end), end between start and period end
+        start_offsets = rng.integers(0, (end - timedelta(days=90) - start).days + 1, theft_idx.size)
+        theft_starts = start + pd.to_timedelta(start_offsets, unit='D')
+        theft_ends = theft_starts + pd.to_timedelta(rng.integers(0, (end - theft_starts).days.to_numpy() + 1), unit='D')
+        
+        theft_meters = meters_df.iloc[theft_idx]
+        theft_smart = is_smart[theft_idx]
+        
+        # Determine theft duration: ongoing thefts have no end, the rest end detected or unnoticed
+        statuses = np.where(ongoing, 'active', np.where(caught, 'detected', 'ended_unknown'))
+        detected = statuses == 'detected'
+        det_idx = np.flatnonzero(detected)
+        
+        # Detection details
+        detection_methods = np.full(theft_idx.size, None, dtype=object)
+        detection_methods[det_idx] = np.where(
+            theft_smart[det_idx],
+            rng.choice(['AMI_auto_detection', 'remote_analysis', 'meter_bypass_alert'], size=det_idx.size),
+            rng.choice(['physical_inspection', 'bill_anomaly', 'tip_off', 'neighbor_complaint'], size=det_idx.size)
+        )
+        
+        # Penalty calculation [citation:3] over the detected thefts
+        months_active = (theft_ends[det_idx] - theft_starts[det_idx]).days.to_numpy() / 30
+        estimated_stolen_units = rng.integers(500, 5001, det_idx.size) * months_active
+        detection_bill = np.full(theft_idx.size, np.nan)
+        detection_bill[det_idx] = estimated_stolen_units * rng.uniform(20, 30, det_idx.size)  # Rs 20-30 per unit penalty
+        
+        # Legal action
+        fir_registered = np.zeros(theft_idx.size, dtype=bool)
+        fir_registered[det_idx] = rng.random(det_idx.size) > 0.4
+        
+        monthly_consumption = (theft_meters['average_monthly_consumption'].to_numpy(dtype=np.float64)
+                               if 'average_monthly_consumption' in theft_meters else 300)
+        
+        theft_incidents = pd.DataFrame({
+            'theft_id': [f"TH{i:08d}" for i in range(1, theft_idx.size + 1)],
+            'meter_number': theft_meters['meter_number'].to_numpy(),
+            'consumer_id': theft_meters['consumer_id'].to_numpy(),
+            'consumer_type': theft_meters['consumer_type'].to_numpy(),
+            'district': theft_meters['district'].to_numpy(),
+            'sub_division': theft_meters['sub_division'].to_numpy(),
+            'theft_start_date': theft_starts,
+            'theft_end_date': theft_ends.where(~ongoing),
+            'status': statuses,
+            'theft_method': np.array(self.theft_methods)[theft_method_idx],
+            'theft_percentage': theft_pcts.round(3),
+            'estimated_monthly_stolen_kwh': (theft_pcts * monthly_consumption).astype(np.int64),
+            'detected': detected,
+            'detection_date': theft_ends.where(detected),
+            'detection_method': detection_methods,
+            'detection_bill_rs': detection_bill,
+            'fir_registered': fir_registered,
+            'meter_type': theft_meters['meter_type'].to_numpy(),
+            'ami_detected': detected & theft_smart
+        })
+        
+        # Update meter status, one column write each instead of per-cell .at
+        if theft_idx.size:
+            modified_meters.loc[theft_meters.index, 'has_theft_history'] = True
+            modified_meters.loc[theft_meters.index, 'theft_status'] = statuses
+        if det_idx.size:
+            modified_meters.loc[theft_meters.index[det_idx], 'theft_detected_date'] = theft_ends[det_idx]
         
         # Modify readings to reflect theft
         modified_readings = self._apply_theft_to_readings(readings_df, theft_incidents)
@@ -610,64 +628,90 @@ class IESCOGridSimulator:
         print(f"✅ Generated {len(theft_incidents)} theft incidents")
         
         # Theft statistics
-        detected_count = len([t for t in theft_incidents if t['detected']])
-        print(f"   - Detected: {detected_count} ({detected_count/len(theft_incidents)*100:.1f}% if theft_incidents else 0)")
-        print(f"   - Active: {len([t for t in theft_incidents if t['status'] == 'active'])}")
+        detected_count = int(theft_incidents['detected'].sum())
+        detected_pct = detected_count / len(theft_incidents) * 100 if len(theft_incidents) else 0
+        print(f"   - Detected: {detected_count} ({detected_pct:.1f}%)")
+        print(f"   - Active: {int((theft_incidents['status'] == 'active').sum())}")
         
         return modified_meters, modified_readings, theft_incidents
 
-    def _apply_theft_to_readings(self, readings_df: pd.DataFrame, theft_incidents: List) -> pd.DataFrame:
+    def _apply_theft_to_readings(self, readings_df: pd.DataFrame, theft_incidents: pd.DataFrame) -> pd.DataFrame:
         """
         Modify readings to reflect theft (under-reporting)
         """
         modified_readings = readings_df.copy()
         
-        # Create lookup for theft periods
-        theft_by_meter = defaultdict(list)
-        for theft in theft_incidents:
-            theft_by_meter[theft['meter_number']].append(theft)
-        
-        # Apply theft adjustments
-        for idx, reading in modified_readings.iterrows():
-            meter_number = reading['meter_number']
-            timestamp = reading['timestamp']
-            
-            for theft in theft_by_meter.get(meter_number, []):
-                theft_start = pd.to_datetime(theft['theft_start_date'])
-                theft_end = pd.to_datetime(theft['theft_end_date']) if theft['theft_end_date'] else None
-                
-                # Check if reading falls within theft period
-                if timestamp >= theft_start and (theft_end is None or timestamp <= theft_end):
-                    # Apply theft (reduce reported consumption)
-                    theft_pct = theft['theft_percentage']
-                    
-                    # Different theft methods affect readings differently
-                    if theft['theft_method'] == 'meter_bypass':
-                        # Complete bypass - no reading
-                        modified_readings.at[idx, 'energy_consumed_kwh'] = 0
-                        modified_readings.at[idx, 'reading_kwh'] = modified_readings.at[idx, 'reading_kwh'] - reading['energy_consumed_kwh']
-                        modified_readings.at[idx, 'data_quality_flag'] = 'theft_bypass'
-                        modified_readings.at[idx, 'current_a'] = 0
-                    elif theft['theft_method'] == 'meter_slowdown':
-                        # Meter runs slow - reduced reading
-                        modified_readings.at[idx, 'energy_consumed_kwh'] = reading['energy_consumed_kwh'] * (1 - theft_pct)
-                        modified_readings.at[idx, 'reading_kwh'] = modified_readings.at[idx, 'reading_kwh'] - (reading['energy_consumed_kwh'] * theft_pct)
-                        modified_readings.at[idx, 'data_quality_flag'] = 'theft_slowdown'
-                    elif theft['theft_method'] == 'magnetic_interference':
-                        # Intermittent interference
-                        if random.random() < 0.3:
-                            modified_readings.at[idx, 'energy_consumed_kwh'] = reading['energy_consumed_kwh'] * 0.5
-                            modified_readings.at[idx, 'data_quality_flag'] = 'theft_magnetic'
-                    elif theft['theft_method'] == 'neutral_current_bypass':
-                        # Partial bypass
-                        modified_readings.at[idx, 'energy_consumed_kwh'] = reading['energy_consumed_kwh'] * (1 - theft_pct * 0.7)
-                        modified_readings.at[idx, 'data_quality_flag'] = 'theft_neutral_bypass'
-                    
-                    # Mark as theft in general
-                    modified_readings.at[idx, 'theft_active'] = True
-                    modified_readings.at[idx, 'theft_id'] = theft['theft_id']
-                    
-                    break  # Only apply first matching theft
+        # Pair every reading with the thefts on its meter, keeping reading position and theft order
+        readings = pd.DataFrame({
+            'meter_number': modified_readings['meter_number'].to_numpy(),
+            'timestamp': pd.to_datetime(modified_readings['timestamp']).to_numpy(),
+            'pos': np.arange(len(modified_readings))
+        })
+        thefts = pd.DataFrame({
+            'meter_number': theft_incidents['meter_number'].to_numpy(),
+            'theft_order': np.arange(len(theft_incidents)),
+            'theft_id': theft_incidents['theft_id'].to_numpy(),
+            'theft_start': pd.to_datetime(theft_incidents['theft_start_date']).to_numpy(),
+            'theft_end': pd.to_datetime(theft_incidents['theft_end_date']).to_numpy(),
+            'theft_method': theft_incidents['theft_method'].to_numpy(),
+            'theft_pct': theft_incidents['theft_percentage'].to_numpy(dtype=np.float64)
+        })
+        merged = readings.merge(thefts, on='meter_number', how='inner')
+        
+        # Check if reading falls within theft period; only the first matching theft applies
+        in_period = (merged['timestamp'] >= merged['theft_start']) & (
+            merged['theft_end'].isna() | (merged['timestamp'] <= merged['theft_end'])
+        )
+        merged = (merged[in_period].sort_values(['pos', 'theft_order'], kind='stable')
+                  .drop_duplicates('pos', keep='first'))
+        
+        pos = merged['pos'].to_numpy()
+        method = merged['theft_method'].to_numpy()
+        theft_pct = merged['theft_pct'].to_numpy()
+        
+        # Different theft methods affect readings differently
+        bypass = method == 'meter_bypass'                     # Complete bypass - no reading
+        slowdown = method == 'meter_slowdown'                 # Meter runs slow - reduced reading
+        magnetic = (method == 'magnetic_interference') & (self._rng.random(pos.size) < 0.3)  # Intermittent interference
+        neutral = method == 'neutral_current_bypass'          # Partial bypass
+        
+        energy = modified_readings['energy_consumed_kwh'].to_numpy(dtype=np.float64, copy=True)
+        consumed = energy[pos]
+        energy[pos] = np.select(
+            [bypass, slowdown, magnetic, neutral],
+            [0.0, consumed * (1 - theft_pct), consumed * 0.5, consumed * (1 - theft_pct * 0.7)],
+            default=consumed
+        )
+        
+        reading_kwh = modified_readings['reading_kwh'].to_numpy(dtype=np.float64, copy=True)
+        reading_kwh[pos] -= np.select([bypass, slowdown], [consumed, consumed * theft_pct], default=0.0)
+        
+        if 'data_quality_flag' in modified_readings:
+            flags = modified_readings['data_quality_flag'].to_numpy(dtype=object, copy=True)
+        else:
+            flags = np.full(len(modified_readings), None, dtype=object)
+        flags[pos] = np.select(
+            [bypass, slowdown, magnetic, neutral],
+            ['theft_bypass', 'theft_slowdown', 'theft_magnetic', 'theft_neutral_bypass'],
+            default=flags[pos]
+        )
+        
+        modified_readings['energy_consumed_kwh'] = energy
+        modified_readings['reading_kwh'] = reading_kwh
+        modified_readings['data_quality_flag'] = flags
+        if bypass.any():
+            current_a = (modified_readings['current_a'].to_numpy(copy=True) if 'current_a' in modified_readings
+                         else np.full(len(modified_readings), np.nan))
+            current_a[pos[bypass]] = 0
+            modified_readings['current_a'] = current_a
+        
+        # Mark as theft in general
+        theft_active = np.zeros(len(modified_readings), dtype=bool)
+        theft_active[pos] = True
+        theft_ids = np.full(len(modified_readings), None, dtype=object)
+        theft_ids[pos] = merged['theft_id'].to_numpy()
+        modified_readings['theft_active'] = theft_active
+        modified_readings['theft_id'] = theft_ids
         
         return modified_readings
 
@@ -678,7 +722,7 @@ class IESCOGridSimulator:
     def calculate_transmission_losses(self,
                                      transformers_df: pd.DataFrame,
                                      readings_df: pd.DataFrame,
-                                     theft_incidents: List,
+                                     theft_incidents: pd.DataFrame,
                                      month: str) -> Dict:
         """
         Calculate technical and commercial losses by feeder
@@ -686,62 +730,60 @@ class IESCOGridSimulator:
         # Group by feeder
         feeders = transformers_df[transformers_df['transformer_type'] == 'distribution']['feeder_name'].unique()
         
-        feeder_losses = []
-        
-        for feeder in feeders:
-            # Get transformers on this feeder
-            feeder_transformers = transformers_df[transformers_df['feeder_name'] == feeder]
-            transformer_ids = feeder_transformers['transformer_id'].tolist()
-            
-            # Get readings for these transformers
-            feeder_readings = readings_df[readings_df['distribution_transformer_id'].isin(transformer_ids)]
-            
-            if len(feeder_readings) == 0:
-                continue
-            
-            # Calculate total energy supplied (at transformer)
-            total_supplied_kwh = feeder_readings['energy_consumed_kwh'].sum()
-            
-            # Calculate billed energy (after theft adjustments)
-            billed_readings = feeder_readings[feeder_readings['theft_active'] != True]
-            billed_kwh = billed_readings['energy_consumed_kwh'].sum() if len(billed_readings) > 0 else 0
-            
-            # Theft losses
-            theft_readings = feeder_readings[feeder_readings['theft_active'] == True]
-            theft_kwh = theft_readings['energy_consumed_kwh'].sum() if len(theft_readings) > 0 else 0
-            
-            # Technical losses (calculated as difference)
-            # In reality, technical losses are ~12-20% [citation:5]
-            tech_loss_pct = random.uniform(*self.td_losses['technical_losses'].values())
-            technical_kwh = total_supplied_kwh * tech_loss_pct
-            
-            # Commercial losses (theft + billing inefficiencies)
-            commercial_loss_pct = random.uniform(*self.td_losses['commercial_losses'].values())
-            commercial_kwh = total_supplied_kwh * commercial_loss_pct
-            
-            # Total losses
-            total_loss_pct = (technical_kwh + commercial_kwh) / total_supplied_kwh if total_supplied_kwh > 0 else 0
-            
-            loss_record = {
-                'month': month,
-                'feeder_name': feeder,
-                'district': feeder_transformers.iloc[0]['district'] if len(feeder_transformers) > 0 else 'Unknown',
-                'total_supplied_kwh': round(total_supplied_kwh, 2),
-                'billed_kwh': round(billed_kwh, 2),
-                'theft_kwh': round(theft_kwh, 2),
-                'technical_loss_kwh': round(technical_kwh, 2),
-                'commercial_loss_kwh': round(commercial_kwh, 2),
-                'total_loss_kwh': round(technical_kwh + commercial_kwh, 2),
-                'total_loss_percentage': round(total_loss_pct * 100, 2),
-                'collection_rate': random.uniform(85, 98)  # Collection efficiency
-            }
-            feeder_losses.append(loss_record)
+        # Supplied, billed and theft energy for every feeder in one groupby
+        # over the readings, instead of re-filtering them per feeder
+        feeder_of_transformer = transformers_df.set_index('transformer_id')['feeder_name']
+        district_of_feeder = transformers_df.drop_duplicates('feeder_name').set_index('feeder_name')['district']
+        energy = readings_df['energy_consumed_kwh'].to_numpy(dtype=np.float64)
+        theft = (readings_df['theft_active'] == True).to_numpy()
+        feeder_energy = pd.DataFrame({
+            'total_supplied_kwh': energy,
+            'billed_kwh': np.where(theft, 0.0, energy),
+            'theft_kwh': np.where(theft, energy, 0.0),
+        }).groupby(readings_df['distribution_transformer_id'].map(feeder_of_transformer).to_numpy(), sort=False).sum()
+        # Feeders without readings are skipped
+        feeder_energy = feeder_energy.reindex(feeders).dropna()
+        
+        n_feeders = len(feeder_energy)
+        total_supplied_kwh = feeder_energy['total_supplied_kwh'].to_numpy()
+        
+        # Technical losses (calculated as difference), one draw per feeder
+        # In reality, technical losses are ~12-20% [citation:5]
+        tech_loss_pct = self._rng.uniform(*self.td_losses['technical_losses'].values(), size=n_feeders)
+        technical_kwh = total_supplied_kwh * tech_loss_pct
+        
+        # Commercial losses (theft + billing inefficiencies)
+        commercial_loss_pct = self._rng.uniform(*self.td_losses['commercial_losses'].values(), size=n_feeders)
+        commercial_kwh = total_supplied_kwh * commercial_loss_pct
+        
+        # Total losses
+        total_loss_kwh = technical_kwh + commercial_kwh
+        total_loss_pct = np.divide(total_loss_kwh, total_supplied_kwh,
+                                   out=np.zeros(n_feeders), where=total_supplied_kwh > 0)
+        
+        losses = pd.DataFrame({
+            'month': month,
+            'feeder_name': feeder_energy.index,
+            'district': district_of_feeder.reindex(feeder_energy.index).fillna('Unknown').to_numpy(),
+            'total_supplied_kwh': total_supplied_kwh.round(2),
+            'billed_kwh': feeder_energy['billed_kwh'].to_numpy().round(2),
+            'theft_kwh': feeder_energy['theft_kwh'].to_numpy().round(2),
+            'technical_loss_kwh': technical_kwh.round(2),
+            'commercial_loss_kwh': commercial_kwh.round(2),
+            'total_loss_kwh': total_loss_kwh.round(2),
+            'total_loss_percentage': (total_loss_pct * 100).round(2),
+            'collection_rate': self._rng.uniform(85, 98, size=n_feeders)  # Collection efficiency
+        })
+        feeder_losses = losses.to_dict('records')
+        
+        # Totals in one columnar reduction over the feeder records
+        totals = losses[['technical_loss_kwh', 'commercial_loss_kwh', 'total_loss_kwh', 'total_supplied_kwh']].sum()
         
         return {
             'feeder_losses': feeder_losses,
-            'total_technical_losses': sum(l['technical_loss_kwh'] for l in feeder_losses),
-            'total_commercial_losses': sum(l['commercial_loss_kwh'] for l in feeder_losses),
-            'overall_loss_percentage': sum(l['total_loss_kwh'] for l in feeder_losses) / sum(l['total_supplied_kwh'] for l in feeder_losses) * 100 if feeder_losses else 0
+            'total_technical_losses': float(totals['technical_loss_kwh']),
+            'total_commercial_losses': float(totals['commercial_loss_kwh']),
+            'overall_loss_percentage': float(totals['total_loss_kwh'] / totals['total_supplied_kwh'] * 100) if feeder_losses else 0
         }
 
     # ============================================================
@@ -750,76 +792,74 @@ class IESCOGridSimulator:
     
     def generate_grid_events(self,
                             transformers_df: pd.DataFrame,
-                            load_shedding_events: List,
-                            transformer_failures: List,
-                            theft_incidents: List,
+                            load_shedding_events: pd.DataFrame,
+                            transformer_failures: pd.DataFrame,
+                            theft_incidents: pd.DataFrame,
                             start_date: str,
                             end_date: str) -> pd.DataFrame:
         """
         Generate comprehensive grid events log
         """
-        events = []
-        
-        # Add load shedding events
-        for event in load_shedding_events:
-            events.append({
-                'event_id': event['event_id'],
-                'event_type': 'load_shedding',
-                'timestamp': event['start_time'],
-                'end_timestamp': event['end_time'],
-                'district': event['district'],
-                'sub_division': event.get('sub_division'),
-                'feeder_name': event['feeder_name'],
-                'transformer_id': event.get('transformer_id'),
-                'duration_hours': event['duration_hours'],
-                'reason': event['reason'],
-                'severity': 'medium',
-                'consumers_affected': event['consumers_affected_estimate'],
-                'recovery_time_hours': event['duration_hours']
-            })
+        # One frame per event type, built column-wise and concatenated once
+        load_shedding = pd.DataFrame({
+            'event_id': load_shedding_events['event_id'],
+            'event_type': 'load_shedding',
+            'timestamp': load_shedding_events['start_time'],
+            'end_timestamp': load_shedding_events['end_time'],
+            'district': load_shedding_events['district'],
+            'sub_division': load_shedding_events.get('sub_division'),
+            'feeder_name': load_shedding_events['feeder_name'],
+            'transformer_id': load_shedding_events.get('transformer_id'),
+            'duration_hours': load_shedding_events['duration_hours'],
+            'reason': load_shedding_events['reason'],
+            'severity': 'medium',
+            'consumers_affected': load_shedding_events['consumers_affected_estimate'],
+            'recovery_time_hours': load_shedding_events['duration_hours']
+        })
         
         # Add transformer failures
-        for failure in transformer_failures:
-            events.append({
-                'event_id': failure['failure_id'],
-                'event_type': 'transformer_failure',
-                'timestamp': failure['failure_date'],
-                'end_timestamp': failure['failure_date'] + timedelta(days=failure['outage_duration_days']),
-                'district': failure['district'],
-                'sub_division': failure['sub_division'],
-                'feeder_name': failure['feeder_name'],
-                'transformer_id': failure['transformer_id'],
-                'duration_hours': failure['outage_duration_days'] * 24,
-                'reason': failure['failure_type'],
-                'severity': failure['severity'],
-                'repair_cost_rs': failure['repair_cost_rs'],
-                'consumers_affected': failure['consumers_affected'],
-                'recovery_time_hours': failure['outage_duration_days'] * 24
-            })
+        outage_days = transformer_failures['outage_duration_days']
+        failures = pd.DataFrame({
+            'event_id': transformer_failures['failure_id'],
+            'event_type': 'transformer_failure',
+            'timestamp': transformer_failures['failure_date'],
+            'end_timestamp': transformer_failures['failure_date'] + pd.to_timedelta(outage_days, unit='D'),
+            'district': transformer_failures['district'],
+            'sub_division': transformer_failures['sub_division'],
+            'feeder_name': transformer_failures['feeder_name'],
+            'transformer_id': transformer_failures['transformer_id'],
+            'duration_hours': outage_days * 24,
+            'reason': transformer_failures['failure_type'],
+            'severity': transformer_failures['severity'],
+            'repair_cost_rs': transformer_failures['repair_cost_rs'],
+            'consumers_affected': transformer_failures['consumers_affected'],
+            'recovery_time_hours': outage_days * 24
+        })
         
         # Add theft detection events
-        for theft in theft_incidents:
-            if theft['detected'] and theft['detection_date']:
-                events.append({
-                    'event_id': theft['theft_id'],
-                    'event_type': 'theft_detection',
-                    'timestamp': theft['detection_date'],
-                    'end_timestamp': None,
-                    'district': theft['district'],
-                    'sub_division': theft['sub_division'],
-                    'feeder_name': None,
-                    'transformer_id': None,
-                    'duration_hours': None,
-                    'reason': f"theft_{theft['theft_method']}",
-                    'severity': 'high' if theft['detection_bill_rs'] and theft['detection_bill_rs'] > 100000 else 'medium',
-                    'detection_bill_rs': theft['detection_bill_rs'],
-                    'fir_registered': theft['fir_registered'],
-                    'consumers_affected': 1,
-                    'recovery_time_hours': None
-                })
-        
-        events_df = pd.DataFrame(events)
-        events_df = events_df.sort_values('timestamp')
+        detected = theft_incidents[
+            theft_incidents['detected'].astype(bool) & theft_incidents['detection_date'].notna()
+        ]
+        detections = pd.DataFrame({
+            'event_id': detected['theft_id'],
+            'event_type': 'theft_detection',
+            'timestamp': detected['detection_date'],
+            'end_timestamp': pd.NaT,
+            'district': detected['district'],
+            'sub_division': detected['sub_division'],
+            'feeder_name': pd.Series(index=detected.index, dtype='str'),
+            'transformer_id': pd.Series(index=detected.index, dtype='str'),
+            'duration_hours': np.nan,
+            'reason': 'theft_' + detected['theft_method'].astype(str),
+            'severity': np.where(detected['detection_bill_rs'] > 100000, 'high', 'medium'),
+            'detection_bill_rs': detected['detection_bill_rs'],
+            'fir_registered': detected['fir_registered'],
+            'consumers_affected': 1,
+            'recovery_time_hours': np.nan
+        })
+        
+        events_df = pd.concat([load_shedding, failures, detections], ignore_index=True)
+        events_df = events_df.sort_values('timestamp', kind='mergesort')
         
         print(f"✅ Generated {len(events_df)} total grid events")
         return events_df
@@ -829,8 +869,8 @@ class IESCOGridSimulator:
     # ============================================================
     
     def calculate_grid_costs(self,
-                            transformer_failures: List,
-                            theft_incidents: List,
+                            transformer_failures: pd.DataFrame,
+                            theft_incidents: pd.DataFrame,
                             transformers_df: pd.DataFrame,
                             months: int) -> Dict:
         """
@@ -838,27 +878,20 @@ class IESCOGridSimulator:
         """
         
         # Transformer repair/replacement costs
-        transformer_costs = sum(f['repair_cost_rs'] for f in transformer_failures)
+        transformer_costs = transformer_failures['repair_cost_rs'].sum()
         
         # Theft revenue loss
-        theft_loss = 0
-        for theft in theft_incidents:
-            if theft['estimated_monthly_stolen_kwh']:
-                months_active = theft.get('months_active', 12)
-                theft_loss += theft['estimated_monthly_stolen_kwh'] * months_active * 25  # Rs 25/unit average
+        months_active = theft_incidents.get('months_active', 12)
+        theft_loss = (theft_incidents['estimated_monthly_stolen_kwh'] * months_active * 25).sum()  # Rs 25/unit average
         
         # Detection bill recovery
-        detection_recovery = sum(t['detection_bill_rs'] for t in theft_incidents if t.get('detection_bill_rs'))
+        detection_recovery = theft_incidents['detection_bill_rs'].sum()
         
         # Upgrade costs [citation:4]
-        upgraded_transformers = transformers_df[transformers_df['upgrade_date'].notna()]
-        upgrade_costs = 0
-        for _, trans in upgraded_transformers.iterrows():
-            # Find base cost
-            for t in self.transformer_specs['distribution_transformer']['types']:
-                if t['rating_kva'] == trans['rating_kva']:
-                    upgrade_costs += t['base_cost'] * 0.6  # Upgrade cost ~60% of new
-                    break
+        # Ratings without a distribution spec add nothing
+        upgraded_ratings = transformers_df.loc[transformers_df['upgrade_date'].notna(), 'rating_kva']
+        base_costs = {rating: t['base_cost'] for rating, t in self._dist_trans_by_rating.items()}
+        upgrade_costs = float(upgraded_ratings.map(base_costs).sum()) * 0.6  # Upgrade cost ~60% of new
         
         total_costs = transformer_costs + theft_loss - detection_recovery + upgrade_costs
         
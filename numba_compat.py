@@ -0,0 +1,22 @@
+"""
+Optional Numba support shared by the pipeline scripts and dashboard utilities
+
+Modules define each kernel twice (a Numba _nb and a NumPy _np version) and
+pick one with NUMBA_AVAILABLE. Without Numba, njit leaves functions as plain
+Python, prange is range and set_num_threads does nothing
+"""
+
+try:
+    from numba import njit, prange, set_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def set_num_threads(n):
+        pass
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
@@ -5,10 +5,15 @@ No special characters, handles large datasets
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import os
 import json
 from datetime import datetime
 
+# Numba is optional: the readings scan falls back to the NumPy kernel
+from numba_compat import njit, NUMBA_AVAILABLE
+
 print("="*80)
 print("IESCO SILVER LAYER PROCESSING")
 print("="*80)
@@ -20,23 +25,146 @@ BRONZE_PATH = "./iesco_complete_data"
 SILVER_PATH = "./iesco_silver_data"
 os.makedirs(SILVER_PATH, exist_ok=True)
 
+# Readings are cleaned and written to Parquet one chunk at a time, so only a
+# chunk of the largest table (plus the key columns below) is ever held in
+# memory; each chunk becomes one row group
+READINGS_CHUNK_ROWS = 1_000_000
+
+# Columns that decide duplicates and anomalies. They are read for the whole
+# file before the chunked pass, since bronze rows are not guaranteed to be in
+# time order and a meter's previous reading may sit in any chunk
+READINGS_KEY_COLUMNS = ['meter_number', 'timestamp', 'reading_kwh']
+
+# Identifier columns are read as Arrow-backed strings rather than inferred:
+# meter numbers are all digits and would otherwise load as int64 in one file
+# and text in another. 'string[pyarrow]' is Arrow-backed on every supported
+# pandas (plain 'str' only is from pandas 3). Columns missing from a file
+# are ignored
+ID_DTYPES = {'meter_number': 'string[pyarrow]', 'meter_id': 'string[pyarrow]',
+             'bill_id': 'string[pyarrow]', 'payment_id': 'string[pyarrow]'}
+
+# Bronze timestamps/dates are ISO 8601 ("2025-01-01" or "2025-01-01 00:15:00");
+# naming the format keeps pd.to_datetime on its vectorized parser instead of
+# guessing (and falling back to dateutil) per element
+TS_FORMAT = 'ISO8601'
+
+# Meter telemetry is written as float32: the sensor ranges need nowhere near
+# float64 precision, and half the width halves the bytes every downstream
+# scan reads. reading_kwh is a cumulative register and keeps float64 (as in
+# the gold layer), and so do money columns
+READINGS_FLOAT32_COLUMNS = [
+    'energy_consumed_kwh', 'voltage_v', 'current_a', 'power_factor', 'frequency_hz',
+    'temperature_c', 'signal_strength_dbm', 'battery_voltage_v'
+]
+
+# Parquet settings shared by every silver table: row groups of at most 1M
+# rows with column statistics, so downstream reads can skip row groups on a
+# predicate, and dictionary pages for the repeated string columns
+SILVER_ROW_GROUP_ROWS = 1_000_000
+PARQUET_OPTIONS = dict(compression='snappy', use_dictionary=True, write_statistics=True,
+                       data_page_size=1 << 20)
+
+
+def clean_numeric(values, default, is_valid):
+    """
+    Coerce a column to float and replace missing or invalid values with
+    default in a single pass. NaN fails every comparison, so is_valid only
+    needs to describe the accepted range
+    """
+    values = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64)
+    return np.where(is_valid(values), values, default)
+
+
+def write_silver_parquet(df, path):
+    """Write a cleaned table straight through pyarrow with the silver Parquet settings"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(table, path, row_group_size=SILVER_ROW_GROUP_ROWS, **PARQUET_OPTIONS)
+
+
+# Integer stand-in for an unparseable (NaT) timestamp: sorts after every real
+# timestamp, as sort_values placed NaT, and never counts as a duplicate
+TS_MISSING = np.iinfo(np.int64).max
+
+
+@njit(cache=True)
+def _scan_readings_nb(codes, kwh, ts, order, is_anomaly, keep):
+    """
+    Walk all readings in (meter, timestamp) order. A row repeating the
+    meter's previous timestamp is a duplicate and is dropped via keep (order
+    is a stable sort, so the first row in file order survives); the rest are
+    flagged as anomalies when the reading is missing, negative or below the
+    meter's previous reading
+    """
+    prev_code = -2
+    prev_kwh = np.nan
+    prev_ts = TS_MISSING
+    for i in range(order.shape[0]):
+        j = order[i]
+        c = codes[j]
+        k = kwh[j]
+        t = ts[j]
+        if c != prev_code:
+            prev_code = c
+            prev_kwh = np.nan
+            prev_ts = TS_MISSING
+        if c >= 0 and t != TS_MISSING and t == prev_ts:
+            keep[j] = False
+            continue
+        is_anomaly[j] = np.isnan(k) or k < 0 or k < prev_kwh
+        prev_kwh = k
+        prev_ts = t
+
+
+def _scan_readings_np(codes, kwh, ts, order, is_anomaly, keep):
+    """NumPy equivalent of _scan_readings_nb, used when Numba is not installed"""
+    n = order.shape[0]
+    if n == 0:
+        return
+    sc, sk, st = codes[order], kwh[order], ts[order]
+    pos = np.arange(n)
+    first = np.ones(n, dtype=np.bool_)
+    first[1:] = sc[1:] != sc[:-1]
+    group_start = np.maximum.accumulate(np.where(first, pos, 0))
+    prev_ts = np.empty(n, dtype=np.int64)
+    prev_ts[1:] = st[:-1]
+    prev_ts[first] = TS_MISSING
+    repeated = (sc >= 0) & (st != TS_MISSING) & (st == prev_ts)
+    # Previous reading = last kept row of the same meter
+    last_kept = np.maximum.accumulate(np.where(repeated, -1, pos))
+    prev_src = np.empty(n, dtype=np.int64)
+    prev_src[0] = -1
+    prev_src[1:] = last_kept[:-1]
+    has_prev = prev_src >= group_start
+    prev = np.where(has_prev, sk[np.maximum(prev_src, 0)], np.nan)
+    is_anomaly[order] = np.isnan(sk) | (sk < 0) | (sk < prev)
+    keep[order] = ~repeated
+
+
+_scan_readings = _scan_readings_nb if NUMBA_AVAILABLE else _scan_readings_np
+
+
 print("="*80)
 print("STEP 1: LOAD BRONZE LAYER")
 print("="*80)
 
+# CSVs are parsed with the multithreaded Arrow reader straight into columnar
+# buffers. Readings are only opened here and streamed in STEP 3, once for the
+# key columns and once in full (the Arrow engine cannot chunk, so they go
+# through the C parser)
 try:
     print("\nLoading data...")
-    meters_bronze = pd.read_csv(f"{BRONZE_PATH}/meters.csv")
+    meters_bronze = pd.read_csv(f"{BRONZE_PATH}/meters.csv", engine='pyarrow', dtype=ID_DTYPES)
     print(f"   [OK] Meters: {len(meters_bronze):,} records")
     
-    print("   Loading readings (large file, this may take a minute)...")
-    readings_bronze = pd.read_csv(f"{BRONZE_PATH}/readings.csv", low_memory=False)
-    print(f"   [OK] Readings: {len(readings_bronze):,} records")
+    readings_key_chunks = pd.read_csv(f"{BRONZE_PATH}/readings.csv", usecols=READINGS_KEY_COLUMNS,
+                                      dtype=ID_DTYPES, chunksize=READINGS_CHUNK_ROWS)
+    readings_chunks = pd.read_csv(f"{BRONZE_PATH}/readings.csv", dtype=ID_DTYPES, chunksize=READINGS_CHUNK_ROWS)
+    print(f"   [OK] Readings: streaming in chunks of {READINGS_CHUNK_ROWS:,} records")
     
-    bills_bronze = pd.read_csv(f"{BRONZE_PATH}/bills.csv")
+    bills_bronze = pd.read_csv(f"{BRONZE_PATH}/bills.csv", engine='pyarrow', dtype=ID_DTYPES)
     print(f"   [OK] Bills: {len(bills_bronze):,} records")
     
-    payments_bronze = pd.read_csv(f"{BRONZE_PATH}/payments.csv")
+    payments_bronze = pd.read_csv(f"{BRONZE_PATH}/payments.csv", engine='pyarrow', dtype=ID_DTYPES)
     print(f"   [OK] Payments: {len(payments_bronze):,} records")
     
 except Exception as e:
@@ -48,129 +176,161 @@ print("STEP 2: CLEAN METERS")
 print("="*80)
 
 print("\nCleaning meters...")
-meters_clean = meters_bronze.copy()
+meters_read = len(meters_bronze)
 
-# Remove duplicates
-meters_clean = meters_clean.drop_duplicates(subset=['meter_number'])
+# Remove duplicates; drop_duplicates already returns a new frame, so the
+# bronze frame is released instead of being copied first
+meters_clean = meters_bronze.drop_duplicates(subset=['meter_number'])
+del meters_bronze
 
 # Handle missing values
 meters_clean['consumer_type'] = meters_clean['consumer_type'].fillna('UNKNOWN')
 
 # Validate sanctioned_load_kw (convert to numeric first)
-meters_clean['sanctioned_load_kw'] = pd.to_numeric(meters_clean['sanctioned_load_kw'], errors='coerce').fillna(5.0)
-meters_clean.loc[meters_clean['sanctioned_load_kw'] <= 0, 'sanctioned_load_kw'] = 5.0
-meters_clean.loc[meters_clean['sanctioned_load_kw'] > 5000, 'sanctioned_load_kw'] = 5.0
+meters_clean['sanctioned_load_kw'] = clean_numeric(
+    meters_clean['sanctioned_load_kw'], 5.0, lambda kw: (kw > 0) & (kw <= 5000)
+).astype(np.float32)
 
-# Standardize text fields
-meters_clean['consumer_type'] = meters_clean['consumer_type'].str.upper().str.strip()
+# Standardize text fields; the few distinct values are kept as categories
+meters_clean['consumer_type'] = meters_clean['consumer_type'].str.upper().str.strip().astype('category')
 if 'district' in meters_clean.columns:
-    meters_clean['district'] = meters_clean['district'].str.upper().str.strip()
+    meters_clean['district'] = meters_clean['district'].str.upper().str.strip().astype('category')
 
 # Add metadata
 meters_clean['processed_at'] = datetime.now()
 meters_clean['data_layer'] = 'silver'
 
 print(f"   [OK] Cleaned: {len(meters_clean):,} meters")
-print(f"   [OK] Removed: {len(meters_bronze) - len(meters_clean):,} duplicates")
+print(f"   [OK] Removed: {meters_read - len(meters_clean):,} duplicates")
 
 print("\n" + "="*80)
 print("STEP 3: CLEAN READINGS")
 print("="*80)
 
 print("\nCleaning readings (this will take a few minutes)...")
-readings_clean = readings_bronze.copy()
-
-# Remove duplicates
-print("   Removing duplicates...")
-readings_clean = readings_clean.drop_duplicates(subset=['meter_number', 'timestamp'])
-
-# Convert timestamp
-print("   Converting timestamps...")
-readings_clean['timestamp'] = pd.to_datetime(readings_clean['timestamp'], errors='coerce')
-
-# Validate energy_consumed_kwh (convert to numeric first)
-print("   Validating consumption...")
-if 'energy_consumed_kwh' in readings_clean.columns:
-    readings_clean['energy_consumed_kwh'] = pd.to_numeric(readings_clean['energy_consumed_kwh'], errors='coerce').fillna(0.0)
-    readings_clean.loc[readings_clean['energy_consumed_kwh'] < 0, 'energy_consumed_kwh'] = 0.0
-    readings_clean.loc[readings_clean['energy_consumed_kwh'] > 100, 'energy_consumed_kwh'] = 0.0
-
-# Validate voltage (convert to numeric first)
-print("   Validating voltage...")
-if 'voltage_v' in readings_clean.columns:
-    readings_clean['voltage_v'] = pd.to_numeric(readings_clean['voltage_v'], errors='coerce').fillna(230.0)
-    readings_clean.loc[readings_clean['voltage_v'] < 150, 'voltage_v'] = 230.0
-    readings_clean.loc[readings_clean['voltage_v'] > 450, 'voltage_v'] = 230.0
-
-# Flag anomalies
-print("   Flagging anomalies...")
-readings_clean = readings_clean.sort_values(['meter_number', 'timestamp'])
-readings_clean['reading_kwh'] = pd.to_numeric(readings_clean['reading_kwh'], errors='coerce')
-readings_clean['prev_reading'] = readings_clean.groupby('meter_number')['reading_kwh'].shift(1)
-readings_clean['is_anomaly'] = (
-    (readings_clean['reading_kwh'].isna()) |
-    (readings_clean['reading_kwh'] < 0) |
-    ((readings_clean['prev_reading'].notna()) & (readings_clean['reading_kwh'] < readings_clean['prev_reading']))
-)
-readings_clean = readings_clean.drop('prev_reading', axis=1)
+# Readings' meter_number is cast onto the cleaned meters as a categorical:
+# unknown meters get code -1, so the referential check is a code comparison
+# against one hash table instead of a Python set of every meter number
+meter_dtype = pd.CategoricalDtype(categories=meters_clean['meter_number'].dropna())
+readings_path = f"{SILVER_PATH}/readings.parquet"
+readings_writer = None
+readings_read = 0
+readings_written = 0
+anomaly_count = 0
+invalid_readings = 0
+
+# Pass 1: parse the key columns of every reading, then remove duplicates and
+# flag anomalies in one pass over the whole file in (meter, timestamp) order;
+# the rows themselves are not sorted. Results are indexed by file row
+key_codes, key_timestamps, key_kwh = [], [], []
+for keys in readings_key_chunks:
+    key_codes.append(meter_dtype.categories.get_indexer(keys['meter_number']).astype(np.int64))
+    key_timestamps.append(pd.to_datetime(keys['timestamp'], format=TS_FORMAT, errors='coerce', cache=True).to_numpy())
+    key_kwh.append(pd.to_numeric(keys['reading_kwh'], errors='coerce').to_numpy(dtype=np.float64))
+codes = np.concatenate(key_codes)
+timestamps = np.concatenate(key_timestamps)
+reading_kwh = np.concatenate(key_kwh)
+del key_codes, key_timestamps, key_kwh
+
+ts = np.where(np.isnat(timestamps), TS_MISSING, timestamps.view(np.int64))
+is_anomaly = np.zeros(len(codes), dtype=np.bool_)
+keep = np.ones(len(codes), dtype=np.bool_)
+_scan_readings(codes, reading_kwh, ts, np.lexsort((ts, codes)), is_anomaly, keep)
+del ts
+
+# Pass 2: clean and write the full rows chunk by chunk
+for chunk_no, readings_clean in enumerate(readings_chunks, start=1):
+    rows = slice(readings_read, readings_read + len(readings_clean))
+    readings_read += len(readings_clean)
+    print(f"   Chunk {chunk_no}: {readings_read:,} records read...")
+
+    # Timestamps were already parsed in pass 1
+    readings_clean['timestamp'] = timestamps[rows]
+
+    # Validate energy_consumed_kwh (convert to numeric first)
+    if 'energy_consumed_kwh' in readings_clean.columns:
+        readings_clean['energy_consumed_kwh'] = clean_numeric(
+            readings_clean['energy_consumed_kwh'], 0.0, lambda kwh: (kwh >= 0) & (kwh <= 100)
+        )
+
+    # Validate voltage (convert to numeric first)
+    if 'voltage_v' in readings_clean.columns:
+        readings_clean['voltage_v'] = clean_numeric(
+            readings_clean['voltage_v'], 230.0, lambda v: (v >= 150) & (v <= 450)
+        )
+
+    # Apply pass 1's duplicate and anomaly flags and check referential integrity
+    chunk_codes = codes[rows]
+    readings_clean['meter_number'] = pd.Categorical.from_codes(chunk_codes, dtype=meter_dtype)
+    readings_clean['reading_kwh'] = reading_kwh[rows]
+    readings_clean['is_anomaly'] = is_anomaly[rows]
+    invalid_readings += (chunk_codes < 0).sum()
+    readings_clean = readings_clean[keep[rows] & (chunk_codes >= 0)]
+
+    for col in READINGS_FLOAT32_COLUMNS:
+        if col in readings_clean.columns:
+            readings_clean[col] = pd.to_numeric(readings_clean[col], errors='coerce').astype(np.float32)
+    if 'data_quality_flag' in readings_clean.columns:
+        readings_clean['data_quality_flag'] = readings_clean['data_quality_flag'].astype('category')
+
+    # Add metadata
+    readings_clean['processed_at'] = datetime.now()
+    readings_clean['data_layer'] = 'silver'
+
+    if readings_writer is None:
+        readings_schema = pa.Schema.from_pandas(readings_clean, preserve_index=False)
+        readings_writer = pq.ParquetWriter(readings_path, readings_schema, **PARQUET_OPTIONS)
+    readings_writer.write_table(pa.Table.from_pandas(readings_clean, schema=readings_schema, preserve_index=False))
+    readings_written += len(readings_clean)
+    anomaly_count += readings_clean['is_anomaly'].sum()
+
+if readings_writer is not None:
+    readings_writer.close()
+del readings_clean, codes, timestamps, reading_kwh, is_anomaly, keep
 
-# Check referential integrity for readings
-print("   Checking referential integrity...")
-valid_meters = set(meters_clean['meter_number'])
-readings_clean['has_valid_meter'] = readings_clean['meter_number'].isin(valid_meters)
-invalid_readings = (~readings_clean['has_valid_meter']).sum()
 if invalid_readings > 0:
-    print(f"   ⚠️  Found {invalid_readings:,} readings with invalid meter_number - removing...")
-    readings_clean = readings_clean[readings_clean['has_valid_meter']].copy()
-readings_clean = readings_clean.drop(columns=['has_valid_meter'])
-
-# Add metadata
-readings_clean['processed_at'] = datetime.now()
-readings_clean['data_layer'] = 'silver'
-
-print(f"   [OK] Cleaned: {len(readings_clean):,} readings")
-print(f"   [OK] Removed: {len(readings_bronze) - len(readings_clean):,} duplicates")
-anomaly_count = readings_clean['is_anomaly'].sum()
-print(f"   [INFO] Anomalies flagged: {anomaly_count:,} ({anomaly_count/len(readings_clean)*100:.2f}%)")
+    print(f"   ⚠️  Removed {invalid_readings:,} readings with invalid meter_number")
+print(f"   [OK] Cleaned: {readings_written:,} readings")
+print(f"   [OK] Removed: {readings_read - readings_written:,} duplicates")
+print(f"   [INFO] Anomalies flagged: {anomaly_count:,} ({anomaly_count/readings_written*100:.2f}%)")
 
 print("\n" + "="*80)
 print("STEP 4: CLEAN BILLS")
 print("="*80)
 
 print("\nCleaning bills...")
-bills_clean = bills_bronze.copy()
+bills_read = len(bills_bronze)
 
-# Remove duplicates
-bills_clean = bills_clean.drop_duplicates(subset=['bill_id'])
+# Remove duplicates; drop_duplicates already returns a new frame, so the
+# bronze frame is released instead of being copied first
+bills_clean = bills_bronze.drop_duplicates(subset=['bill_id'])
+del bills_bronze
 
 # Validate consumption_kwh (convert to numeric first)
-bills_clean['consumption_kwh'] = pd.to_numeric(bills_clean['consumption_kwh'], errors='coerce').fillna(0.0)
-bills_clean.loc[bills_clean['consumption_kwh'] < 0, 'consumption_kwh'] = 0.0
-bills_clean.loc[bills_clean['consumption_kwh'] > 50000, 'consumption_kwh'] = 0.0
+bills_clean['consumption_kwh'] = clean_numeric(
+    bills_clean['consumption_kwh'], 0.0, lambda kwh: (kwh >= 0) & (kwh <= 50000)
+)
 
 # Validate bill_amount (convert to numeric first)
-bills_clean['bill_amount'] = pd.to_numeric(bills_clean['bill_amount'], errors='coerce').fillna(0.0)
-bills_clean.loc[bills_clean['bill_amount'] < 0, 'bill_amount'] = 0.0
+bills_clean['bill_amount'] = clean_numeric(bills_clean['bill_amount'], 0.0, lambda amount: amount >= 0)
 
 # Convert dates
-bills_clean['issue_date'] = pd.to_datetime(bills_clean['issue_date'], errors='coerce')
-bills_clean['due_date'] = pd.to_datetime(bills_clean['due_date'], errors='coerce')
+bills_clean['issue_date'] = pd.to_datetime(bills_clean['issue_date'], format=TS_FORMAT, errors='coerce', cache=True)
+bills_clean['due_date'] = pd.to_datetime(bills_clean['due_date'], format=TS_FORMAT, errors='coerce', cache=True)
 
 # Check referential integrity
 # Note: bills use 'meter_id', meters use 'meter_number' - need to handle both
 if 'meter_id' in bills_clean.columns:
-    valid_meters = set(meters_clean['meter_number'])
-    bills_clean['has_valid_meter'] = bills_clean['meter_id'].isin(valid_meters)
+    bills_clean['has_valid_meter'] = bills_clean['meter_id'].isin(meter_dtype.categories)
 elif 'meter_number' in bills_clean.columns:
-    valid_meters = set(meters_clean['meter_number'])
-    bills_clean['has_valid_meter'] = bills_clean['meter_number'].isin(valid_meters)
+    bills_clean['has_valid_meter'] = bills_clean['meter_number'].isin(meter_dtype.categories)
 
 # Add metadata
 bills_clean['processed_at'] = datetime.now()
 bills_clean['data_layer'] = 'silver'
 
 print(f"   [OK] Cleaned: {len(bills_clean):,} bills")
-print(f"   [OK] Removed: {len(bills_bronze) - len(bills_clean):,} duplicates")
+print(f"   [OK] Removed: {bills_read - len(bills_clean):,} duplicates")
 invalid_meter_count = (~bills_clean['has_valid_meter']).sum()
 if invalid_meter_count > 0:
     print(f"   [WARN] Bills with invalid meters: {invalid_meter_count:,}")
@@ -180,29 +340,30 @@ print("STEP 5: CLEAN PAYMENTS")
 print("="*80)
 
 print("\nCleaning payments...")
-payments_clean = payments_bronze.copy()
+payments_read = len(payments_bronze)
 
-# Remove duplicates
-payments_clean = payments_clean.drop_duplicates(subset=['payment_id'])
+# Remove duplicates; drop_duplicates already returns a new frame, so the
+# bronze frame is released instead of being copied first
+payments_clean = payments_bronze.drop_duplicates(subset=['payment_id'])
+del payments_bronze
 
 # Validate amounts (convert to numeric first)
-payments_clean['bill_amount'] = pd.to_numeric(payments_clean['bill_amount'], errors='coerce').fillna(0.0)
-payments_clean.loc[payments_clean['bill_amount'] < 0, 'bill_amount'] = 0.0
-
-payments_clean['amount_paid'] = pd.to_numeric(payments_clean['amount_paid'], errors='coerce').fillna(0.0)
-payments_clean.loc[payments_clean['amount_paid'] < 0, 'amount_paid'] = 0.0
+payments_clean['bill_amount'] = clean_numeric(payments_clean['bill_amount'], 0.0, lambda amount: amount >= 0)
+payments_clean['amount_paid'] = clean_numeric(payments_clean['amount_paid'], 0.0, lambda amount: amount >= 0)
 
 # Convert payment_date
-payments_clean['payment_date'] = pd.to_datetime(payments_clean['payment_date'], errors='coerce')
+payments_clean['payment_date'] = pd.to_datetime(payments_clean['payment_date'], format=TS_FORMAT, errors='coerce', cache=True)
 
-# Validate status
-valid_statuses = ['paid', 'partial', 'unpaid']
-payments_clean['status'] = payments_clean['status'].str.lower()
-payments_clean.loc[~payments_clean['status'].isin(valid_statuses), 'status'] = 'unpaid'
+# Validate status: anything outside the valid categories (code -1) defaults
+# to unpaid
+valid_statuses = pd.CategoricalDtype(['paid', 'partial', 'unpaid'])
+status_codes = valid_statuses.categories.get_indexer(payments_clean['status'].str.lower())
+status_codes[status_codes < 0] = valid_statuses.categories.get_loc('unpaid')
+payments_clean['status'] = pd.Categorical.from_codes(status_codes, dtype=valid_statuses)
 
 # Check referential integrity
 # Note: payments use 'bill_id', bills use 'bill_id'
-valid_bills = set(bills_clean['bill_id'])
+valid_bills = pd.Index(bills_clean['bill_id'])
 payments_clean['has_valid_bill'] = payments_clean['bill_id'].isin(valid_bills)
 
 # Add metadata
@@ -210,7 +371,7 @@ payments_clean['processed_at'] = datetime.now()
 payments_clean['data_layer'] = 'silver'
 
 print(f"   [OK] Cleaned: {len(payments_clean):,} payments")
-print(f"   [OK] Removed: {len(payments_bronze) - len(payments_clean):,} duplicates")
+print(f"   [OK] Removed: {payments_read - len(payments_clean):,} duplicates")
 invalid_bill_count = (~payments_clean['has_valid_bill']).sum()
 if invalid_bill_count > 0:
     print(f"   [WARN] Payments with invalid bills: {invalid_bill_count:,}")
@@ -224,22 +385,21 @@ print("(Parquet is compressed and 10x faster than CSV)")
 
 # Save as Parquet (compressed)
 print("   Saving meters...")
-meters_clean.to_parquet(f"{SILVER_PATH}/meters.parquet", compression='snappy', index=False)
+write_silver_parquet(meters_clean, f"{SILVER_PATH}/meters.parquet")
 meters_size = os.path.getsize(f"{SILVER_PATH}/meters.parquet") / (1024 * 1024)
 print(f"   [OK] Meters saved: {SILVER_PATH}/meters.parquet ({meters_size:.2f} MB)")
 
-print("   Saving readings (large file, please wait)...")
-readings_clean.to_parquet(f"{SILVER_PATH}/readings.parquet", compression='snappy', index=False)
+# Readings were already streamed to Parquet chunk by chunk in STEP 3
 readings_size = os.path.getsize(f"{SILVER_PATH}/readings.parquet") / (1024 * 1024)
 print(f"   [OK] Readings saved: {SILVER_PATH}/readings.parquet ({readings_size:.2f} MB)")
 
 print("   Saving bills...")
-bills_clean.to_parquet(f"{SILVER_PATH}/bills.parquet", compression='snappy', index=False)
+write_silver_parquet(bills_clean, f"{SILVER_PATH}/bills.parquet")
 bills_size = os.path.getsize(f"{SILVER_PATH}/bills.parquet") / (1024 * 1024)
 print(f"   [OK] Bills saved: {SILVER_PATH}/bills.parquet ({bills_size:.2f} MB)")
 
 print("   Saving payments...")
-payments_clean.to_parquet(f"{SILVER_PATH}/payments.parquet", compression='snappy', index=False)
+write_silver_parquet(payments_clean, f"{SILVER_PATH}/payments.parquet")
 payments_size = os.path.getsize(f"{SILVER_PATH}/payments.parquet") / (1024 * 1024)
 print(f"   [OK] Payments saved: {SILVER_PATH}/payments.parquet ({payments_size:.2f} MB)")
 
@@ -250,21 +410,23 @@ print("\n" + "="*80)
 print("STEP 7: GENERATE QUALITY REPORT")
 print("="*80)
 
-# Calculate statistics
-paid_count = (payments_clean['status'] == 'paid').sum()
-partial_count = (payments_clean['status'] == 'partial').sum()
-unpaid_count = (payments_clean['status'] == 'unpaid').sum()
+# Calculate statistics; status is categorical, so one value_counts over its
+# codes gives all three counts
+status_counts = payments_clean['status'].value_counts()
+paid_count = int(status_counts.get('paid', 0))
+partial_count = int(status_counts.get('partial', 0))
+unpaid_count = int(status_counts.get('unpaid', 0))
 
 quality_report = {
     'processing_date': datetime.now().isoformat(),
     'bronze_layer': BRONZE_PATH,
     'silver_layer': SILVER_PATH,
     'total_meters': int(len(meters_clean)),
-    'total_readings': int(len(readings_clean)),
+    'total_readings': int(readings_written),
     'total_bills': int(len(bills_clean)),
     'total_payments': int(len(payments_clean)),
     'anomaly_count': int(anomaly_count),
-    'anomaly_percentage': float(anomaly_count/len(readings_clean)*100),
+    'anomaly_percentage': float(anomaly_count/readings_written*100),
     'paid_count': int(paid_count),
     'partial_count': int(partial_count),
     'unpaid_count': int(unpaid_count),
@@ -5,9 +5,9 @@ Multi-page Streamlit dashboard for comprehensive analytics and ML models
 """
 
 import streamlit as st
-import pandas as pd
 import numpy as np
-from pathlib import Path
+
+from utils.data_loader import GOLD_PATH, load_table, row_count
 
 # Page configuration
 st.set_page_config(
@@ -63,38 +63,29 @@ if 'data_loaded' not in st.session_state:
     st.session_state.data_loaded = False
     st.session_state.gold_path = "./iesco_gold_data"
 
-# Data loading function
-@st.cache_data
-def load_gold_data():
-    """Load all Gold Layer tables"""
-    gold_path = Path("./iesco_gold_data")
-    
-    if not gold_path.exists():
-        st.error(f"Gold Layer data not found at {gold_path}")
+# Home page metrics come straight from the Parquet footers; no column is
+# decoded until the quick insights read their two precomputed tables
+HOME_COUNT_TABLES = ['dim_meter', 'fact_readings', 'fact_bills', 'dim_consumer_type']
+
+def load_home_counts():
+    """Row counts for the Home metrics, from Parquet footer metadata only"""
+    if not GOLD_PATH.exists():
+        st.error(f"Gold Layer data not found at {GOLD_PATH}")
         return None
     
-    data = {}
     try:
-        # Load dimension tables
-        data['dim_meter'] = pd.read_parquet(gold_path / "dim_meter.parquet")
-        data['dim_date'] = pd.read_parquet(gold_path / "dim_date.parquet")
-        data['dim_time'] = pd.read_parquet(gold_path / "dim_time.parquet")
-        data['dim_consumer_type'] = pd.read_parquet(gold_path / "dim_consumer_type.parquet")
-        data['dim_location'] = pd.read_parquet(gold_path / "dim_location.parquet")
-        
-        # Load fact tables
-        data['fact_readings'] = pd.read_parquet(gold_path / "fact_readings.parquet")
-        data['fact_bills'] = pd.read_parquet(gold_path / "fact_bills.parquet")
-        data['fact_payments'] = pd.read_parquet(gold_path / "fact_payments.parquet")
-        
-        # Load aggregate tables
-        data['agg_monthly'] = pd.read_parquet(gold_path / "agg_monthly_consumption.parquet")
-        data['agg_daily'] = pd.read_parquet(gold_path / "agg_daily_consumption.parquet")
-        data['agg_consumer_type'] = pd.read_parquet(gold_path / "agg_consumer_type_summary.parquet")
-        data['agg_payment'] = pd.read_parquet(gold_path / "agg_payment_summary.parquet")
-        data['agg_location'] = pd.read_parquet(gold_path / "agg_location_summary.parquet")
-        
-        return data
+        return {name: row_count(name) for name in HOME_COUNT_TABLES}
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
+        return None
+
+def load_home_insights():
+    """Load the two precomputed tables behind the Home quick insights"""
+    try:
+        return {
+            'top_consumers': load_table('agg_top5_consumer_type'),
+            'payment_status': load_table('agg_payment_status'),
+        }
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return None
@@ -147,9 +138,9 @@ if page_category == "🏠 Home":
     
     # Load and display summary statistics
     with st.spinner("Loading data..."):
-        data = load_gold_data()
+        row_counts = load_home_counts()
     
-    if data:
+    if row_counts:
         st.success("✅ Data loaded successfully!")
         
         st.subheader("📊 Data Summary")
@@ -157,36 +148,35 @@ if page_category == "🏠 Home":
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Total Meters", f"{len(data['dim_meter']):,}")
+            st.metric("Total Meters", f"{row_counts['dim_meter']:,}")
         
         with col2:
-            st.metric("Total Readings", f"{len(data['fact_readings']):,}")
+            st.metric("Total Readings", f"{row_counts['fact_readings']:,}")
         
         with col3:
-            st.metric("Total Bills", f"{len(data['fact_bills']):,}")
+            st.metric("Total Bills", f"{row_counts['fact_bills']:,}")
         
         with col4:
-            st.metric("Consumer Types", f"{len(data['dim_consumer_type']):,}")
+            st.metric("Consumer Types", f"{row_counts['dim_consumer_type']:,}")
         
         st.markdown("---")
         
         # Quick insights
         st.subheader("🔍 Quick Insights")
         
-        col1, col2 = st.columns(2)
+        insights = load_home_insights()
         
-        with col1:
-            st.markdown("**Top 5 Consumer Types by Consumption**")
-            top_consumers = data['agg_consumer_type'].nlargest(5, 'total_consumption_kwh')
-            st.dataframe(
-                top_consumers[['consumer_type', 'total_consumption_kwh', 'meter_count']],
-                hide_index=True
-            )
-        
-        with col2:
-            st.markdown("**Payment Status Distribution**")
-            payment_dist = data['agg_payment'].groupby('payment_status')['payment_count'].sum()
-            st.bar_chart(payment_dist)
+        if insights:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("**Top 5 Consumer Types by Consumption**")
+                st.dataframe(insights['top_consumers'], hide_index=True)
+            
+            with col2:
+                st.markdown("**Payment Status Distribution**")
+                payment_dist = insights['payment_status'].set_index('payment_status')['payment_count']
+                st.bar_chart(payment_dist)
         
         st.markdown("---")
         st.info("👈 Use the sidebar to navigate to different analytics and ML modules")
@@ -0,0 +1,99 @@
+"""
+Regression tests for the Silver Layer readings cleaning (silver_clean.py)
+
+silver_clean.py is a script, so each test builds a small Bronze Layer in a
+temporary directory and runs it there with a small READINGS_CHUNK_ROWS
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CHUNK_ROWS = 97
+
+
+def make_bronze(bronze, rng):
+    """Readings in shuffled order with duplicates spread across chunks"""
+    meter_numbers = [f"MTR-{i:06d}" for i in range(6)]
+    pd.DataFrame({
+        'meter_number': meter_numbers,
+        'consumer_type': 'RESIDENTIAL',
+        'sanctioned_load_kw': 5.0,
+    }).to_csv(bronze / 'meters.csv', index=False)
+
+    timestamps = pd.date_range('2025-01-01', periods=80, freq='15min')
+    readings = pd.DataFrame({
+        'meter_number': np.repeat(meter_numbers, len(timestamps)),
+        'timestamp': np.tile(timestamps.strftime('%Y-%m-%d %H:%M:%S'), len(meter_numbers)),
+    })
+    readings['reading_kwh'] = rng.gamma(2, 0.3, len(readings)).round(3)
+    readings['reading_kwh'] = readings.groupby('meter_number')['reading_kwh'].cumsum().round(3)
+    # Meter resets, so the previous reading decides the anomaly flag
+    readings.loc[rng.random(len(readings)) < 0.05, 'reading_kwh'] = 0.0
+    readings['energy_consumed_kwh'] = 0.25
+    readings['voltage_v'] = 230.0
+    # Duplicates differ only in voltage, which shows which copy was kept
+    duplicates = readings.sample(60, random_state=1).assign(voltage_v=240.0)
+    readings = pd.concat([readings, duplicates]).sample(frac=1, random_state=2)
+    readings.to_csv(bronze / 'readings.csv', index=False)
+
+    pd.DataFrame({
+        'bill_id': ['BILL-1'], 'meter_id': [meter_numbers[0]], 'consumption_kwh': [100.0],
+        'bill_amount': [2500.0], 'issue_date': ['2025-01-28'], 'due_date': ['2025-02-10'],
+        'status': ['paid'],
+    }).to_csv(bronze / 'bills.csv', index=False)
+    pd.DataFrame({
+        'payment_id': ['PAY-1'], 'bill_id': ['BILL-1'], 'bill_amount': [2500.0],
+        'amount_paid': [2500.0], 'payment_date': ['2025-02-05'], 'status': ['paid'],
+    }).to_csv(bronze / 'payments.csv', index=False)
+    return readings
+
+
+def expected_readings(readings):
+    """Whole-file reference: first occurrence kept, previous reading in time order"""
+    expected = readings.drop_duplicates(subset=['meter_number', 'timestamp'])
+    expected = expected.sort_values(['meter_number', 'timestamp'])
+    prev_reading = expected.groupby('meter_number')['reading_kwh'].shift(1)
+    expected['is_anomaly'] = (
+        expected['reading_kwh'].isna() | (expected['reading_kwh'] < 0) |
+        (prev_reading.notna() & (expected['reading_kwh'] < prev_reading))
+    )
+    return expected.reset_index(drop=True)
+
+
+def run_silver(workdir, disable_numba):
+    source = (REPO_ROOT / 'silver_clean.py').read_text(encoding='utf-8')
+    assert 'READINGS_CHUNK_ROWS = 1_000_000' in source
+    source = source.replace('READINGS_CHUNK_ROWS = 1_000_000', f'READINGS_CHUNK_ROWS = {CHUNK_ROWS}')
+    script = workdir / 'silver_clean.py'
+    script.write_text(source, encoding='utf-8')
+    command = [sys.executable, str(script)]
+    if disable_numba:
+        command = [sys.executable, '-c',
+                   'import runpy, sys; sys.modules["numba"] = None; runpy.run_path("silver_clean.py")']
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    subprocess.run(command, cwd=workdir, env=env, check=True, capture_output=True)
+
+
+@pytest.mark.parametrize('disable_numba', [False, True], ids=['numba', 'numpy'])
+def test_out_of_order_duplicates_across_chunks(tmp_path, disable_numba):
+    bronze = tmp_path / 'iesco_complete_data'
+    bronze.mkdir()
+    readings = make_bronze(bronze, np.random.default_rng(0))
+    run_silver(tmp_path, disable_numba)
+
+    silver = pd.read_parquet(tmp_path / 'iesco_silver_data' / 'readings.parquet')
+    silver['meter_number'] = silver['meter_number'].astype(str)
+    silver['timestamp'] = silver['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
+    silver = silver.sort_values(['meter_number', 'timestamp']).reset_index(drop=True)
+    expected = expected_readings(readings)
+
+    assert len(silver) == len(expected)
+    pd.testing.assert_series_equal(silver['voltage_v'], expected['voltage_v'], check_dtype=False)
+    pd.testing.assert_series_equal(silver['reading_kwh'], expected['reading_kwh'])
+    pd.testing.assert_series_equal(silver['is_anomaly'], expected['is_anomaly'])
@@ -1,75 +1,100 @@
 """
 Data Loading Utilities
 """
-import pandas as pd
+import pyarrow.parquet as pq
 import streamlit as st
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+GOLD_PATH = Path("./iesco_gold_data")
+
+# Table name -> Parquet file in the Gold Layer
+GOLD_TABLES = {
+    # Dimensions
+    'dim_meter': "dim_meter.parquet",
+    'dim_date': "dim_date.parquet",
+    'dim_time': "dim_time.parquet",
+    'dim_consumer_type': "dim_consumer_type.parquet",
+    'dim_location': "dim_location.parquet",
+
+    # Facts
+    'fact_readings': "fact_readings.parquet",
+    'fact_bills': "fact_bills.parquet",
+    'fact_payments': "fact_payments.parquet",
+
+    # Aggregates
+    'agg_monthly': "agg_monthly_consumption.parquet",
+    'agg_daily': "agg_daily_consumption.parquet",
+    'agg_consumer_type': "agg_consumer_type_summary.parquet",
+    'agg_payment': "agg_payment_summary.parquet",
+    'agg_location': "agg_location_summary.parquet",
+    'agg_top5_consumer_type': "agg_top5_consumer_type.parquet",
+    'agg_payment_status': "agg_payment_status.parquet",
+}
+
+# dim_meter attributes the enrichment helpers join onto each fact table
+READINGS_METER_COLUMNS = ['meter_key', 'consumer_type', 'district', 'division', 'sanctioned_load_kw']
+BILLS_METER_COLUMNS = ['meter_key', 'consumer_type', 'district', 'tariff_category']
+
+@st.cache_resource(show_spinner=False)
+def load_arrow_table(name, columns=None, filters=None):
+    """Read one Gold Layer table as a pyarrow Table, optionally projected to `columns`.
+
+    `filters` takes pyarrow's DNF form, e.g. [('date_key', '>=', 20240101)];
+    it is pushed into the Parquet scan, so row groups whose column statistics
+    fall outside the predicate are never decoded. Arrow tables are immutable,
+    so one cached instance per (table, columns, filters) is shared by every
+    rerun and session without the copy a cache_data round trip would make.
+    """
+    return pq.read_table(GOLD_PATH / GOLD_TABLES[name], columns=columns, filters=filters)
+
+def load_table(name, columns=None, filters=None):
+    """Load one Gold Layer table as a DataFrame, converted from the cached Arrow table"""
+    return load_arrow_table(name, columns, filters).to_pandas()
+
+@st.cache_data(show_spinner=False)
+def row_count(name):
+    """Row count of a Gold Layer table, read from the Parquet footer only"""
+    return pq.ParquetFile(GOLD_PATH / GOLD_TABLES[name]).metadata.num_rows
 
-@st.cache_data
 def load_all_gold_data():
     """Load all Gold Layer tables"""
-    gold_path = Path("./iesco_gold_data")
-    
-    if not gold_path.exists():
-        st.error(f"Gold Layer data not found at {gold_path}")
+    if not GOLD_PATH.exists():
+        st.error(f"Gold Layer data not found at {GOLD_PATH}")
         return None
     
-    data = {}
     try:
-        # Dimensions
-        data['dim_meter'] = pd.read_parquet(gold_path / "dim_meter.parquet")
-        data['dim_date'] = pd.read_parquet(gold_path / "dim_date.parquet")
-        data['dim_time'] = pd.read_parquet(gold_path / "dim_time.parquet")
-        data['dim_consumer_type'] = pd.read_parquet(gold_path / "dim_consumer_type.parquet")
-        data['dim_location'] = pd.read_parquet(gold_path / "dim_location.parquet")
-        
-        # Facts
-        data['fact_readings'] = pd.read_parquet(gold_path / "fact_readings.parquet")
-        data['fact_bills'] = pd.read_parquet(gold_path / "fact_bills.parquet")
-        data['fact_payments'] = pd.read_parquet(gold_path / "fact_payments.parquet")
-        
-        # Aggregates
-        data['agg_monthly'] = pd.read_parquet(gold_path / "agg_monthly_consumption.parquet")
-        data['agg_daily'] = pd.read_parquet(gold_path / "agg_daily_consumption.parquet")
-        data['agg_consumer_type'] = pd.read_parquet(gold_path / "agg_consumer_type_summary.parquet")
-        data['agg_payment'] = pd.read_parquet(gold_path / "agg_payment_summary.parquet")
-        data['agg_location'] = pd.read_parquet(gold_path / "agg_location_summary.parquet")
-        
-        return data
+        # Parquet decode releases the GIL, so the tables are read side by side
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            return dict(zip(GOLD_TABLES, pool.map(load_table, GOLD_TABLES)))
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return None
 
 def get_enriched_readings(data):
     """Get readings enriched with meter and location info"""
-    readings = data['fact_readings'].copy()
-    meters = data['dim_meter'].copy()
+    readings = data['fact_readings']
+    meters = load_table('dim_meter', READINGS_METER_COLUMNS)
     
-    # Convert meter_key to string for joining
-    readings['meter_key'] = readings['meter_key'].astype(str)
-    meters['meter_key'] = meters['meter_key'].astype(str)
+    # Bring the small dimension onto the fact table's categorical key dtype so
+    # the join runs on category codes; meters outside the readings'
+    # categories could never match and are dropped
+    meters['meter_key'] = meters['meter_key'].astype(readings['meter_key'].dtype)
+    meters = meters.dropna(subset=['meter_key'])
     
-    enriched = readings.merge(
-        meters[['meter_key', 'consumer_type', 'district', 'division', 'sanctioned_load_kw']],
-        on='meter_key',
-        how='left'
-    )
+    enriched = readings.merge(meters, on='meter_key', how='left')
     
     return enriched
 
 def get_enriched_bills(data):
     """Get bills enriched with meter info"""
-    bills = data['fact_bills'].copy()
-    meters = data['dim_meter'].copy()
+    bills = data['fact_bills']
+    meters = load_table('dim_meter', BILLS_METER_COLUMNS)
     
-    # Convert meter_key to string
-    bills['meter_key'] = bills['meter_key'].astype(str)
-    meters['meter_key'] = meters['meter_key'].astype(str)
+    # Same key alignment as get_enriched_readings, on the dimension side only
+    meters['meter_key'] = meters['meter_key'].astype(bills['meter_key'].dtype)
+    meters = meters.dropna(subset=['meter_key'])
     
-    enriched = bills.merge(
-        meters[['meter_key', 'consumer_type', 'district', 'tariff_category']],
-        on='meter_key',
-        how='left'
-    )
+    enriched = bills.merge(meters, on='meter_key', how='left')
     
     return enriched
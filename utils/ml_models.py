@@ -3,12 +3,75 @@ Machine Learning Model Utilities
 """
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier, IsolationForest
-from sklearn.cluster import KMeans
+from sklearn.ensemble import HistGradientBoostingRegressor, HistGradientBoostingClassifier, IsolationForest
+from sklearn.inspection import permutation_importance
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 import streamlit as st
 
+# Numba is optional: feature standardization falls back to the NumPy kernel
+from numba_compat import njit, prange, NUMBA_AVAILABLE
+
+# Fitted estimators are cached with st.cache_resource: they are shared,
+# read-only objects keyed on the training data, so a rerun on the same data
+# returns the already-fitted model instead of refitting it. The public
+# functions below only score and predict with them.
+MODEL_CACHE = dict(show_spinner="Training model...", max_entries=4)
+
+# Histogram gradient boosting bins each feature into at most 255 uint8
+# buckets once, then grows trees over the bin histograms
+HGB_PARAMS = dict(max_iter=200, learning_rate=0.05, early_stopping=True,
+                  validation_fraction=0.1, random_state=42)
+
+def _feature_matrix(data, features):
+    """Selected features as one float32 matrix, missing values as 0.
+
+    float32 halves the bytes every distance / split computation streams;
+    IsolationForest casts to float32 internally anyway.
+    """
+    return data[features].to_numpy(dtype=np.float32, na_value=0.0)
+
+@njit(cache=True, parallel=True)
+def _standardize_nb(X, mean, scale):
+    out = np.empty_like(X)
+    for i in prange(X.shape[0]):
+        for j in range(X.shape[1]):
+            out[i, j] = (X[i, j] - mean[j]) / scale[j]
+    return out
+
+def _standardize_np(X, mean, scale):
+    return (X - mean) / scale
+
+_standardize = _standardize_nb if NUMBA_AVAILABLE else _standardize_np
+
+@st.cache_resource(**MODEL_CACHE)
+def _fit_load_forecasting_model(X_train, y_train):
+    model = HistGradientBoostingRegressor(**HGB_PARAMS)
+    return model.fit(X_train, y_train)
+
+@st.cache_resource(**MODEL_CACHE)
+def _fit_anomaly_model(X, contamination):
+    model = IsolationForest(contamination=contamination, random_state=42, n_jobs=-1)
+    return model.fit(X)
+
+@st.cache_resource(**MODEL_CACHE)
+def _fit_segmentation_model(X, n_clusters):
+    # The scaler only learns mean_/scale_; the transform itself is one pass
+    # of the standardize kernel
+    scaler = StandardScaler().fit(X)
+    X_scaled = _standardize(X, scaler.mean_, scaler.scale_)
+    
+    kmeans = MiniBatchKMeans(n_clusters=n_clusters, batch_size=4096, n_init=3, random_state=42)
+    kmeans.fit(X_scaled)
+    
+    return kmeans, scaler
+
+@st.cache_resource(**MODEL_CACHE)
+def _fit_churn_model(X_train, y_train):
+    model = HistGradientBoostingClassifier(**HGB_PARAMS)
+    return model.fit(X_train, y_train)
+
 def train_load_forecasting_model(data, features, target='total_consumption_kwh'):
     """Train load forecasting model"""
     X = data[features]
@@ -16,8 +79,7 @@ def train_load_forecasting_model(data, features, target='total_consumption_kwh')
     
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
     
-    model = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1)
-    model.fit(X_train, y_train)
+    model = _fit_load_forecasting_model(X_train, y_train)
     
     train_score = model.score(X_train, y_train)
     test_score = model.score(X_test, y_test)
@@ -26,26 +88,25 @@ def train_load_forecasting_model(data, features, target='total_consumption_kwh')
 
 def detect_anomalies(data, features, contamination=0.1):
     """Detect anomalies using Isolation Forest"""
-    X = data[features].fillna(0)
+    X = _feature_matrix(data, features)
     
-    model = IsolationForest(contamination=contamination, random_state=42, n_jobs=-1)
-    predictions = model.fit_predict(X)
+    model = _fit_anomaly_model(X, contamination)
+    scores = model.score_samples(X)
     
-    # -1 for anomalies, 1 for normal
-    data['is_anomaly'] = predictions == -1
-    data['anomaly_score'] = model.score_samples(X)
+    # One pass over the trees: predict() flags exactly the samples whose
+    # decision_function (score - offset_) is negative
+    data['is_anomaly'] = scores - model.offset_ < 0
+    data['anomaly_score'] = scores
     
     return data, model
 
 def segment_consumers(data, features, n_clusters=5):
     """Segment consumers using K-Means clustering"""
-    X = data[features].fillna(0)
-    
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
+    X = _feature_matrix(data, features)
     
-    kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-    data['segment'] = kmeans.fit_predict(X_scaled)
+    kmeans, scaler = _fit_segmentation_model(X, n_clusters)
+    # labels_ belongs to the shared cached model; the frame gets its own copy
+    data['segment'] = kmeans.labels_.copy()
     
     return data, kmeans, scaler
 
@@ -56,16 +117,17 @@ def predict_churn(data, features, target='is_churned'):
     
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
     
-    model = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1)
-    model.fit(X_train, y_train)
+    model = _fit_churn_model(X_train, y_train)
     
     train_score = model.score(X_train, y_train)
     test_score = model.score(X_test, y_test)
     
-    # Feature importance
+    # Feature importance (gradient boosting has no impurity importances, so
+    # measure the held-out score drop when each feature is shuffled)
+    importances = permutation_importance(model, X_test, y_test, n_repeats=5, random_state=42)
     feature_importance = pd.DataFrame({
         'feature': features,
-        'importance': model.feature_importances_
+        'importance': importances.importances_mean
     }).sort_values('importance', ascending=False)
     
     return model, train_score, test_score, feature_importance